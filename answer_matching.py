@@ -0,0 +1,106 @@
+"""Potrivire tolerantă a răspunsurilor: distanță de editare mărginită, cu ieșire timpurie.
+
+Greșelile se acceptă cuvânt cu cuvânt, nu pe tot răspunsul: cuvintele scurte și cele care
+conțin cifre (ani, numere) trebuie să fie exacte, altfel "iraq" ar trece drept "iran",
+iar "1988" drept "1989".
+
+Toate funcțiile primesc texte deja normalizate (vezi questions.normalize_text).
+"""
+
+# Lungimea minimă a unui cuvânt pentru o greșeală, respectiv pentru două, pe dificultate
+TOKEN_EDIT_LENGTHS = {"ușor": (5, 10), "mediu": (6, 11), "greu": (7, 12)}
+DEFAULT_TOKEN_EDIT_LENGTHS = (6, 11)
+MAX_EDITS = 3
+
+
+def compact(text):
+    """Elimină spațiile și punctuația: "da vinci" și "davinci" devin identice."""
+    return "".join(c for c in text if c.isalnum())
+
+
+def tokens(text):
+    return "".join(c if c.isalnum() else " " for c in text).split()
+
+
+def has_digit(token):
+    return any(c.isdigit() for c in token)
+
+
+def allowed_edits(token, difficulty):
+    if has_digit(token):
+        return 0
+    one, two = TOKEN_EDIT_LENGTHS.get(difficulty, DEFAULT_TOKEN_EDIT_LENGTHS)
+    if len(token) >= two:
+        return 2
+    return 1 if len(token) >= one else 0
+
+
+def bounded_distance(a, b, limit):
+    """Distanța Damerau-Levenshtein (transpoziții adiacente), calculată doar în banda |i - j| <= limit.
+
+    Întoarce limit + 1 imediat ce distanța sigur depășește limita.
+    """
+    if a == b:
+        return 0
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > limit:
+        return limit + 1
+    over = limit + 1
+    previous2 = None
+    previous = [j if j <= limit else over for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        current = [over] * (len_b + 1)
+        if i <= limit:
+            current[0] = i
+        start = max(1, i - limit)
+        end = min(len_b, i + limit)
+        row_min = current[0] if start == 1 else over
+        char_a = a[i - 1]
+        for j in range(start, end + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == b[j - 1]
+                    and previous2[j - 2] + 1 < value):
+                value = previous2[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        previous2, previous = previous, current
+    return min(previous[len_b], over)
+
+
+def tokens_match(user_tokens, form_tokens, difficulty):
+    """Perechile de cuvinte trebuie să se potrivească fiecare, în limita bugetului propriu."""
+    if len(user_tokens) != len(form_tokens):
+        return False
+    total = 0
+    for user_token, form_token in zip(user_tokens, form_tokens):
+        if user_token == form_token:
+            continue
+        limit = min(allowed_edits(form_token, difficulty), MAX_EDITS - total)
+        if limit <= 0 or has_digit(user_token):
+            return False
+        distance = bounded_distance(user_token, form_token, limit)
+        if distance > limit:
+            return False
+        total += distance
+    return True
+
+
+def answer_matches(user_answer, accepted, difficulty):
+    """True dacă răspunsul normalizat e identic sau suficient de apropiat de o formă acceptată."""
+    if user_answer in accepted:
+        return True
+    user_compact = compact(user_answer)
+    user_tokens = tokens(user_answer)
+    for form in accepted:
+        if user_compact == compact(form):
+            return True
+        form_tokens = tokens(form)
+        if tokens_match(user_tokens, form_tokens, difficulty):
+            return True
+        if len(form_tokens) > 1 and tokens_match(sorted(user_tokens), sorted(form_tokens), difficulty):
+            return True
+    return False
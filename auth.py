@@ -0,0 +1,90 @@
+"""Hash-uirea parolelor, comună interfeței grafice și serverului.
+
+Parolele se salvează cu scrypt (cu sare aleatoare) în formatul
+    scrypt$<cost>$<r>$<p>$<sare base64>$<hash base64>
+unde cost = log2(N). Costul implicit se poate schimba prin variabila QUIZ_PASSWORD_COST,
+de ex. QUIZ_PASSWORD_COST=16 python main.py. Hash-urile SHA-256 vechi (64 de caractere hex)
+sunt încă acceptate și înlocuite la primul login reușit, ca și cele cu alt cost.
+
+Verificarea durează intenționat zeci de milisecunde, deci se apelează de pe un fir de lucru.
+"""
+import base64
+import hashlib
+import hmac
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+SCHEME = "scrypt"
+DEFAULT_COST = 14        # N = 2^14, aproximativ 16 MB de memorie per verificare
+MIN_COST = 10
+MAX_COST = 20
+BLOCK_SIZE = 8
+PARALLELISM = 1
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+def configured_cost():
+    try:
+        cost = int(os.environ.get("QUIZ_PASSWORD_COST", DEFAULT_COST))
+    except ValueError:
+        logger.warning("QUIZ_PASSWORD_COST invalid, se folosește costul implicit")
+        return DEFAULT_COST
+    return min(MAX_COST, max(MIN_COST, cost))
+
+
+def _scrypt(password, salt, cost, r, p):
+    n = 1 << cost
+    # Memoria necesară e 128 * r * N octeți; limita implicită OpenSSL (32 MB) ar bloca costurile mari
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * r * n + (1 << 20), dklen=KEY_BYTES)
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def hash_password(password, cost=None):
+    cost = configured_cost() if cost is None else cost
+    salt = os.urandom(SALT_BYTES)
+    key = _scrypt(password, salt, cost, BLOCK_SIZE, PARALLELISM)
+    logger.debug(f"Parolă hash-uită (cost {cost})")
+    return f"{SCHEME}${cost}${BLOCK_SIZE}${PARALLELISM}${_b64(salt)}${_b64(key)}"
+
+
+def legacy_hash(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def is_legacy(stored):
+    return "$" not in stored
+
+
+def needs_rehash(stored, cost=None):
+    if is_legacy(stored):
+        return True
+    cost = configured_cost() if cost is None else cost
+    parts = stored.split("$")
+    return parts[0] != SCHEME or int(parts[1]) != cost
+
+
+def verify_password(password, stored, cost=None):
+    """Întoarce (potrivire, hash nou). Hash-ul nou e calculat doar pentru un hash vechi sau cu alt cost."""
+    if is_legacy(stored):
+        matches = hmac.compare_digest(legacy_hash(password), stored)
+    else:
+        try:
+            scheme, stored_cost, r, p, salt, key = stored.split("$")
+            if scheme != SCHEME:
+                raise ValueError(scheme)
+            computed = _scrypt(password, base64.b64decode(salt), int(stored_cost), int(r), int(p))
+        except ValueError as e:
+            logger.error(f"Hash de parolă invalid: {e}")
+            return False, None
+        matches = hmac.compare_digest(computed, base64.b64decode(key))
+    if matches and needs_rehash(stored, cost):
+        logger.info("Hash de parolă actualizat la formatul curent")
+        return True, hash_password(password, cost)
+    return matches, None
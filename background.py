@@ -0,0 +1,104 @@
+"""Redare a imaginii de fundal: evenimente comasate, cache LRU și redimensionare pe un fir separat.
+
+PIL este importat abia la prima redare, pe firul de lucru, ca să nu întârzie pornirea.
+"""
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRenderer:
+    def __init__(self, root, label, image_path, cache_size=4, debounce_ms=100, poll_ms=15, on_error=None):
+        self.root = root
+        self.label = label
+        self.image_path = image_path
+        self.source = None
+        self.on_error = on_error
+        self.cache_size = cache_size
+        self.debounce_ms = debounce_ms
+        self.poll_ms = poll_ms
+        self.cache = OrderedDict()
+        self.current_size = None
+        self.wanted_size = None
+        self.photo = None
+        self._pending_id = None
+        self._future = None
+        self._future_size = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background")
+
+    def on_configure(self, event=None):
+        """Primește <Configure> și amână redarea până se oprește șirul de evenimente."""
+        if event is not None and event.widget is not self.root:
+            return
+        if self._pending_id:
+            self.root.after_cancel(self._pending_id)
+        self._pending_id = self.root.after(self.debounce_ms, self.request_render)
+
+    def request_render(self, size=None):
+        self._pending_id = None
+        if size is None:
+            size = (max(1, self.root.winfo_width()), max(1, self.root.winfo_height()))
+        self.wanted_size = size
+        if size == self.current_size:
+            return
+        photo = self.cache.get(size)
+        if photo is not None:
+            self.cache.move_to_end(size)
+            self._apply(size, photo)
+            return
+        if self._future is None:
+            self._submit(size)
+
+    def _submit(self, size):
+        self._future_size = size
+        self._future = self._executor.submit(self._resize, size)
+        self.root.after(self.poll_ms, self._poll)
+
+    def _resize(self, size):
+        from PIL import Image
+
+        if self.source is None:
+            source = Image.open(self.image_path)
+            source.load()
+            self.source = source
+        return self.source.resize(size, Image.Resampling.LANCZOS)
+
+    def _poll(self):
+        if not self._future.done():
+            self.root.after(self.poll_ms, self._poll)
+            return
+        future, size = self._future, self._future_size
+        self._future = None
+        try:
+            resized = future.result()
+        except Exception as e:
+            logger.error(f"Eroare la redimensionarea imaginii de fundal: {e}")
+            if self.on_error:
+                self.on_error(e)
+            return
+        from PIL import ImageTk
+
+        # PhotoImage trebuie creat pe firul Tk
+        photo = ImageTk.PhotoImage(resized)
+        self.cache[size] = photo
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        if size == self.wanted_size:
+            self._apply(size, photo)
+        else:
+            self.request_render(self.wanted_size)
+
+    def _apply(self, size, photo):
+        self.photo = photo
+        self.current_size = size
+        self.label.configure(image=photo)
+        self.label.image = photo
+        logger.debug(f"Imagine de fundal redimensionată: {size[0]}x{size[1]}")
+
+    def shutdown(self):
+        if self._pending_id:
+            self.root.after_cancel(self._pending_id)
+            self._pending_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,36 @@
+"""Compară costul potrivirii tolerante cu comparația exactă folosită anterior.
+
+Rulare: python benchmarks/bench_answer_matching.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from answer_matching import answer_matches
+from questions import normalize_text
+
+CASES = [
+    ("exact, scurt", "Paris", "paris"),
+    ("greșeală de tastare", "Leonardo da Vinci", "leonrado da vinci"),
+    ("spațiu lipsă", "Leonardo da Vinci", "leonardo davinci"),
+    ("ordine inversă", "Leonardo da Vinci", "da vinci leonardo"),
+    ("greșit, lung", "Întâlnire la miezul nopții " * 4, "intalnire la pranz " * 4),
+    ("corect, lung (~200 caractere)", "Critica rațiunii pure de Immanuel Kant " * 5, "critica ratiunii pure de immanuel kant " * 5),
+]
+
+
+def main(number=2000):
+    print(f"{'caz':<32}{'exact (µs)':>12}{'tolerant (µs)':>15}{'rezultat':>10}")
+    for name, answer, user in CASES:
+        accepted = frozenset([normalize_text(answer)])
+        normalized_user = normalize_text(user)
+        exact = timeit.timeit(lambda: normalize_text(user) == normalize_text(answer), number=number) / number
+        fuzzy = timeit.timeit(lambda: answer_matches(normalize_text(user), accepted, "greu"), number=number) / number
+        result = answer_matches(normalized_user, accepted, "greu")
+        print(f"{name:<32}{exact * 1e6:12.1f}{fuzzy * 1e6:15.1f}{str(result):>10}")
+
+
+if __name__ == "__main__":
+    main()
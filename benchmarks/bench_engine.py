@@ -0,0 +1,56 @@
+"""Sesiuni de joc simulate pe QuizEngine, fără interfață grafică.
+
+Rulare: python benchmarks/bench_engine.py [sesiuni]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from questions import QuestionTable
+from quiz_engine import FINISHED, QuizEngine
+
+ANSWERS = ["Paris", "Leonardo da Vinci|da Vinci", "Dunărea", "Mihai Eminescu", "Oceanul Pacific"]
+
+
+def build_questions(count):
+    pairs = [(f"Întrebarea {i}?", ANSWERS[i % len(ANSWERS)]) for i in range(count)]
+    return QuestionTable.from_pairs(pairs, "general", "mediu")
+
+
+def play_session(engine, questions, rng):
+    """Un jucător simulat: răspunde corect, greșit, cere indicii sau amână întrebarea."""
+    engine.start(questions, "general", "mediu", total_questions=10)
+    while engine.phase != FINISHED:
+        question = engine.next_question()
+        if question is None:
+            engine.finish()
+            continue
+        roll = rng.random()
+        if roll < 0.1 and engine.skip():
+            continue
+        if roll < 0.3:
+            engine.hint(rng.choice((1, 2, 3, 4)))
+        if roll < 0.7 or engine.phase != "main":
+            engine.answer(question["answer"])
+        else:
+            engine.answer("nu știu")
+
+
+def main(sessions=5000):
+    questions = build_questions(10_000)
+    rng = random.Random(1)
+    engine = QuizEngine()
+    start = time.perf_counter()
+    for _ in range(sessions):
+        play_session(engine, questions, rng)
+    elapsed = time.perf_counter() - start
+    profile = engine.profile
+    print(f"{sessions} sesiuni în {elapsed:.2f} s ({sessions / elapsed:,.0f} sesiuni/s)")
+    print(f"profil final: nivel {profile.level}, XP {profile.experience}/{profile.level_threshold}, indicii {profile.max_hints}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,43 @@
+"""Latența unui login (verificarea parolei) la fiecare nivel de cost scrypt.
+
+Rulare: python benchmarks/bench_login.py [cost_minim cost_maxim]
+Costul ales se setează apoi prin QUIZ_PASSWORD_COST; pe firul Tk nu se simte, dar întârzie răspunsul la login.
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth import MAX_COST, MIN_COST, hash_password, legacy_hash, verify_password
+
+PASSWORD = "parola-de-test"
+
+
+def measure(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main(low=12, high=17):
+    print(f"{'cost':<8}{'N':>10}{'memorie':>10}{'login p50':>12}{'login max':>12}{'rehash vechi':>15}")
+    legacy = legacy_hash(PASSWORD)
+    for cost in range(max(MIN_COST, low), min(MAX_COST, high) + 1):
+        stored = hash_password(PASSWORD, cost)
+        repeat = 5 if cost <= 16 else 2
+        median, worst = measure(lambda: verify_password(PASSWORD, stored, cost), repeat)
+        rehash, _ = measure(lambda: verify_password(PASSWORD, legacy, cost), repeat)
+        memory_mb = 128 * 8 * (1 << cost) / (1 << 20)
+        print(f"{cost:<8}{1 << cost:>10}{memory_mb:>8.0f}MB{median:>10.1f}ms{worst:>10.1f}ms{rehash:>13.1f}ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        main(int(sys.argv[1]), int(sys.argv[2]))
+    else:
+        main()
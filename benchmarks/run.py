@@ -0,0 +1,329 @@
+"""Suita de benchmark-uri pentru căile fierbinți ale jocului, rulate fără interfață prin QuizEngine.
+
+Rulare:
+    python benchmarks/run.py                          # dimensiuni 10^3, 10^4, 10^5
+    python benchmarks/run.py --sizes 1000,1000000     # până la 10^6 întrebări/scoruri/utilizatori
+    python benchmarks/run.py --save-baseline          # salvează rezultatele în benchmarks/baseline.json
+    python benchmarks/run.py --check                  # eșuează dacă un caz e mai lent decât baseline-ul
+    python benchmarks/run.py --tk                     # adaugă ecranul de întrebări Tk (pornește Xvfb dacă lipsește DISPLAY)
+
+Pentru fiecare caz se raportează operații/s și latențele p50/p95/p99 în microsecunde.
+Salvările obișnuite doar adaugă în jurnale; cazurile compact_* măsoară separat rescrierea
+completă a instantaneelor, care apare rar și nu ar fi atinsă în iterațiile celorlalte cazuri.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from highscore_store import HighscoreStore, score_key
+from player_stats import PlayerStats
+from questions import QuestionTable, normalize_text
+from quiz_engine import Profile, QuizEngine
+from storage import atomic_write_json
+from user_store import UserRecord, UserStore
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = (1000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 1.3
+CATEGORIES = ("general", "țări_orașe", "scenariu")
+DIFFICULTIES = ("ușor", "mediu", "greu")
+ANSWERS = ("Paris", "Leonardo da Vinci|da Vinci", "Întâlnire la miezul nopții", "Immanuel Kant", "2 dimineața")
+
+CASES = []
+
+
+def case(name, iterations):
+    def register(func):
+        CASES.append((name, iterations, func))
+        return func
+    return register
+
+
+def build_questions(size):
+    pairs = ((f"Întrebarea {i}: care este răspunsul?", ANSWERS[i % len(ANSWERS)]) for i in range(size))
+    return QuestionTable.from_pairs(pairs, "general", "mediu")
+
+
+def timed(operation, iterations):
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(iterations):
+        start = clock()
+        operation(i)
+        samples.append(clock() - start)
+    return samples
+
+
+def started_engine(questions):
+    engine = QuizEngine(Profile(max_hints=10 ** 9))
+    # O rundă cu timp practic nelimitat: întrebările nu se epuizează niciodată
+    engine.start(questions, "general", "mediu", fast_quiz_duration=10 ** 9)
+    return engine
+
+
+@case("select_random_questions", 2000)
+def bench_select(size, iterations, workdir):
+    questions = build_questions(size)
+    engine = QuizEngine()
+    return timed(lambda i: engine.start(questions, "general", "mediu", total_questions=10), iterations)
+
+
+@case("select_fast_quiz", 500)
+def bench_select_fast(size, iterations, workdir):
+    questions = build_questions(size)
+    engine = QuizEngine()
+    return timed(lambda i: engine.start(questions, "general", "mediu", fast_quiz_duration=300), iterations)
+
+
+@case("normalize_text", 20000)
+def bench_normalize(size, iterations, workdir):
+    texts = [ANSWERS[i % len(ANSWERS)] + f" {i}" for i in range(1000)]
+    return timed(lambda i: normalize_text(texts[i % len(texts)]), iterations)
+
+
+@case("check_answer", 20000)
+def bench_check_answer(size, iterations, workdir):
+    engine = started_engine(build_questions(size))
+    typos = {"Paris": "pariss", "Immanuel Kant": "imanuel kant"}
+
+    def answer(i):
+        question = engine.next_question()
+        text = question["answer"] if i % 3 else typos.get(question["answer"], "nu știu")
+        engine.answer(text)
+
+    return timed(answer, iterations)
+
+
+@case("hints", 20000)
+def bench_hints(size, iterations, workdir):
+    engine = started_engine(build_questions(size))
+
+    def hint(i):
+        if i % 4 == 0:
+            engine.skip()
+        engine.hint(i % 4 + 1)
+
+    return timed(hint, iterations)
+
+
+def score_entry(i, players):
+    return {
+        "name": f"jucător{i % players}",
+        "score": i % 11,
+        "date": "2025-01-01 12:00",
+        "category": CATEGORIES[i % len(CATEGORIES)],
+        "difficulty": DIFFICULTIES[i % len(DIFFICULTIES)],
+        "questions": 10,
+        "time": float(i % 600),
+        "hints_used": i % 4,
+    }
+
+
+def loaded_scores(size, workdir):
+    players = max(1, size // 10)
+    snapshot = os.path.join(workdir, "highscores.json")
+    atomic_write_json(snapshot, sorted((score_entry(i, players) for i in range(size)), key=score_key))
+    highscores = HighscoreStore(snapshot)
+    highscores.load()
+    stats = PlayerStats(os.path.join(workdir, "player_stats.json"))
+    stats.load(highscores)
+    return highscores, stats, players
+
+
+@case("save_highscore", 300)
+def bench_save_highscore(size, iterations, workdir):
+    highscores, stats, players = loaded_scores(size, workdir)
+
+    def save(i):
+        entry = score_entry(size + i, players)
+        highscores.add(entry)
+        stats.record(entry)
+
+    return timed(save, iterations)
+
+
+@case("compact_highscores", 5)
+def bench_compact_highscores(size, iterations, workdir):
+    highscores, _, players = loaded_scores(size, workdir)
+
+    def compact(i):
+        highscores.add_many([score_entry(size + i, players)])
+        highscores.compact()
+
+    return timed(compact, iterations)
+
+
+@case("compact_player_stats", 5)
+def bench_compact_player_stats(size, iterations, workdir):
+    _, stats, players = loaded_scores(size, workdir)
+    return timed(lambda i: stats.compact(), iterations)
+
+
+def loaded_users(size, workdir):
+    users_file = os.path.join(workdir, "users.json")
+    atomic_write_json(users_file, {f"jucător{i}": UserRecord(f"jucător{i}", "0" * 64).to_json() for i in range(size)})
+    users = UserStore(users_file)
+    users.load()
+    return users
+
+
+@case("compact_users", 5)
+def bench_compact_users(size, iterations, workdir):
+    users = loaded_users(size, workdir)
+    return timed(lambda i: users.compact(), iterations)
+
+
+@case("save_users", 300)
+def bench_save_users(size, iterations, workdir):
+    users = loaded_users(size, workdir)
+    profile = Profile()
+
+    def save(i):
+        name = f"jucător{(i * 7919) % size}"
+        profile.add_experience(10)
+        users.save_progress(name, profile)
+        users.flush()
+
+    return timed(save, iterations)
+
+
+def ensure_display():
+    """Întoarce procesul Xvfb pornit (sau None dacă există deja un ecran)."""
+    if os.environ.get("DISPLAY"):
+        return None
+    if not shutil.which("Xvfb"):
+        raise RuntimeError("DISPLAY lipsește și Xvfb nu este instalat")
+    display = ":99"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1024x768x24"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+def bench_tk_question_screen(size, iterations, workdir):
+    """Tranziția între întrebări în interfața reală, inclusiv recalcularea layout-ului."""
+    import tkinter as tk
+    from quiz import QuizGame
+
+    cwd = os.getcwd()
+    os.chdir(ROOT)  # back.jpg și categoriile se citesc relativ la proiect
+    root = tk.Tk()
+    try:
+        app = QuizGame(root)
+        app.engine = started_engine(build_questions(size))
+        app.build_question_screen()
+
+        def transition(i):
+            app.engine.answer("nu știu")
+            app.update_question_screen()
+            root.update_idletasks()
+
+        return timed(transition, iterations)
+    finally:
+        root.destroy()
+        os.chdir(cwd)
+
+
+def percentile(sorted_samples, fraction):
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    total_s = sum(samples) / 1e9
+    return {
+        "ops_per_s": len(samples) / total_s if total_s else float("inf"),
+        "p50_us": percentile(ordered, 0.50) / 1000,
+        "p95_us": percentile(ordered, 0.95) / 1000,
+        "p99_us": percentile(ordered, 0.99) / 1000,
+    }
+
+
+def run(sizes, names=None, tk_mode=False):
+    cases = list(CASES)
+    if tk_mode:
+        cases.append(("tk_question_screen", 200, bench_tk_question_screen))
+    results = {}
+    print(f"{'caz':<26}{'mărime':>10}{'op/s':>14}{'p50 µs':>11}{'p95 µs':>11}{'p99 µs':>11}")
+    for name, iterations, func in cases:
+        if names and name not in names:
+            continue
+        for size in sizes:
+            random.seed(size)
+            with tempfile.TemporaryDirectory() as workdir:
+                summary = summarize(func(size, iterations, workdir))
+            results[f"{name}@{size}"] = summary
+            print(f"{name:<26}{size:>10}{summary['ops_per_s']:>14,.0f}{summary['p50_us']:>11.1f}"
+                  f"{summary['p95_us']:>11.1f}{summary['p99_us']:>11.1f}", flush=True)
+    return results
+
+
+def check(results, baseline, threshold):
+    """Compară p50 și p95 cu baseline-ul; întoarce lista cazurilor mai lente decât pragul."""
+    regressions = []
+    for key, summary in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        for metric in ("p50_us", "p95_us"):
+            if reference[metric] > 0 and summary[metric] > reference[metric] * threshold:
+                regressions.append(f"{key} {metric}: {summary[metric]:.1f} µs față de {reference[metric]:.1f} µs")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark-uri pentru căile fierbinți ale jocului.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="mărimi separate prin virgulă (întrebări, scoruri, utilizatori)")
+    parser.add_argument("--case", action="append", dest="cases", help="rulează doar cazul dat (repetabil)")
+    parser.add_argument("--tk", action="store_true", help="include ecranul de întrebări Tk")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="ieșire cu cod 1 la regresii")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="raportul maxim acceptat față de baseline (implicit 1.3)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    try:
+        xvfb = ensure_display() if args.tk else None
+    except RuntimeError as e:
+        print(f"Modul Tk nu poate rula: {e}")
+        return 2
+    try:
+        results = run(sizes, args.cases, args.tk)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    if args.save_baseline:
+        atomic_write_json(args.baseline, results, indent=2)
+        print(f"Baseline salvat în {args.baseline}")
+    if args.check:
+        if not os.path.exists(args.baseline):
+            print(f"Baseline-ul {args.baseline} lipsește; rulează întâi cu --save-baseline")
+            return 2
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = check(results, json.load(f), args.threshold)
+        if regressions:
+            print("Regresii de performanță:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("Nicio regresie față de baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Scoruri păstrate într-un jurnal append-only, cu un index al celor mai bune K rezultate.
+
+Fișiere:
+    highscores.json          instantaneul compactat (lista completă, sortată, formatul vechi)
+    highscores.journal       scorurile adăugate după ultima compactare, câte unul pe linie
+    highscores.journal.<n>   jurnalul generației n, în curs de compactare
+    highscores.top.json      top-K, numărul de intrări și generația inclusă în instantaneu
+
+La pornire se citesc doar indexul și jurnalul; istoricul complet se parsează
+numai când este cerut explicit (all_scores) sau la compactare. Primele pagini ale
+clasamentului sunt servite direct din top-K. Compactarea are loc abia când jurnalul
+ajunge cât instantaneul, deci rescrierea lui costă amortizat O(1) per scor salvat.
+"""
+import bisect
+import glob
+import heapq
+import json
+import logging
+import os
+
+from storage import append_jsonl, atomic_write_json, iter_jsonl
+
+logger = logging.getLogger(__name__)
+
+
+def score_key(entry):
+    return -entry["score"], entry["time"]
+
+
+class HighscoreStore:
+    def __init__(self, snapshot_file="highscores.json", top_k=100, compact_every=50):
+        self.snapshot_file = snapshot_file
+        base = os.path.splitext(snapshot_file)[0]
+        self.journal_file = f"{base}.journal"
+        self.index_file = f"{base}.top.json"
+        self.top_k = top_k
+        self.compact_every = compact_every
+        self.top = []
+        self.snapshot_entries = 0
+        self.generation = 0
+        self.pending = []
+        # Clasamentul complet și indexul pe jucători se construiesc la prima afișare
+        self._ranked = None
+        self._by_player = None
+
+    def load(self):
+        index = self._read_valid_index()
+        generations = self._journal_generations()
+        if index is None:
+            # Index lipsă sau mai vechi decât instantaneul: o compactare a fost întreruptă
+            # după înlocuirea instantaneului, deci acesta include deja generația următoare.
+            snapshot = self._read_snapshot()
+            self.generation = self._index_generation() + 1 if generations else 0
+            self.snapshot_entries = len(snapshot)
+            self.top = sorted(snapshot, key=score_key)[:self.top_k]
+            self._write_index()
+        else:
+            self.generation = index["generation"]
+            self.snapshot_entries = index["entries"]
+            self.top = index["top"]
+        for generation, path in generations:
+            if generation <= self.generation:
+                os.remove(path)
+            else:
+                self._replay(path)
+        self._replay(self.journal_file)
+        if self._should_compact():
+            self.compact()
+        logger.info(f"Scoruri încărcate: {len(self)} intrări ({len(self.pending)} din jurnal)")
+
+    def _replay(self, path):
+        for entry in iter_jsonl(path):
+            self.pending.append(entry)
+            self._insert_top(entry)
+
+    def _insert_top(self, entry):
+        if len(self.top) >= self.top_k and score_key(entry) >= score_key(self.top[-1]):
+            return
+        bisect.insort_right(self.top, entry, key=score_key)
+        del self.top[self.top_k:]
+
+    def add(self, entry):
+        """Salvează un scor: o linie în jurnal (cu fsync) și o inserare O(log K) în top."""
+        self.add_many([entry])
+
+    def add_many(self, entries):
+        """Salvează mai multe scoruri cu o singură adăugare (și un singur fsync) în jurnal."""
+        append_jsonl(self.journal_file, entries)
+        for entry in entries:
+            self.pending.append(entry)
+            self._insert_top(entry)
+            if self._ranked is not None:
+                bisect.insort_right(self._ranked, entry, key=score_key)
+                bisect.insort_right(self._by_player.setdefault(entry["name"], []), entry, key=score_key)
+        if self._should_compact():
+            self.compact()
+
+    def _should_compact(self):
+        return len(self.pending) >= max(self.compact_every, self.snapshot_entries)
+
+    def _ensure_leaderboard(self):
+        if self._ranked is None:
+            self._ranked = self.all_scores()
+            self._by_player = {}
+            for entry in self._ranked:
+                self._by_player.setdefault(entry["name"], []).append(entry)
+
+    def count(self, player=None):
+        if player is None:
+            return len(self)
+        self._ensure_leaderboard()
+        return len(self._by_player.get(player, ()))
+
+    def page(self, offset, limit, player=None):
+        """O pagină din clasament (sau din scorurile unui jucător), fără a filtra tot istoricul."""
+        if player is None and self._ranked is None and (offset + limit <= len(self.top) or len(self.top) == len(self)):
+            return self.top[offset:offset + limit]
+        self._ensure_leaderboard()
+        scores = self._ranked if player is None else self._by_player.get(player, [])
+        return scores[offset:offset + limit]
+
+    def scores_for(self, player):
+        self._ensure_leaderboard()
+        return self._by_player.get(player, [])
+
+    def best(self, n=None):
+        return self.top if n is None else self.top[:n]
+
+    def __len__(self):
+        return self.snapshot_entries + len(self.pending)
+
+    def all_scores(self):
+        """Istoricul complet, sortat; parsează instantaneul, deci e folosit doar la cerere."""
+        snapshot = self._read_snapshot()
+        return list(heapq.merge(snapshot, sorted(self.pending, key=score_key), key=score_key))
+
+    def compact(self):
+        """Mută jurnalul în instantaneu. Ordinea pașilor permite reluarea după o întrerupere."""
+        generation = self.generation + 1
+        if os.path.exists(self.journal_file):
+            os.replace(self.journal_file, f"{self.journal_file}.{generation}")
+        scores = self._ranked if self._ranked is not None else self.all_scores()
+        atomic_write_json(self.snapshot_file, scores, indent=4)
+        self.generation = generation
+        self.snapshot_entries = len(scores)
+        self.pending = []
+        self._write_index()
+        for old_generation, path in self._journal_generations():
+            if old_generation <= generation:
+                os.remove(path)
+        logger.info(f"Scoruri compactate: {len(scores)} intrări")
+
+    def _read_snapshot(self):
+        if not os.path.exists(self.snapshot_file):
+            return []
+        with open(self.snapshot_file, "r", encoding="utf-8") as f:
+            scores = json.load(f)
+        # Fișierele vechi erau deja sortate; sortarea e aproape liniară în acest caz
+        scores.sort(key=score_key)
+        return scores
+
+    def _snapshot_signature(self):
+        if not os.path.exists(self.snapshot_file):
+            return None
+        stat = os.stat(self.snapshot_file)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _load_index(self):
+        if not os.path.exists(self.index_file):
+            return None
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Indexul scorurilor nu poate fi citit: {e}")
+            return None
+
+    def _read_valid_index(self):
+        index = self._load_index()
+        if index and index.get("snapshot") == self._snapshot_signature() and index.get("top_k") == self.top_k:
+            return index
+        return None
+
+    def _index_generation(self):
+        index = self._load_index()
+        return index.get("generation", 0) if index else 0
+
+    def _write_index(self):
+        atomic_write_json(self.index_file, {
+            "snapshot": self._snapshot_signature(),
+            "generation": self.generation,
+            "entries": self.snapshot_entries,
+            "top_k": self.top_k,
+            "top": self.top,
+        })
+
+    def _journal_generations(self):
+        generations = []
+        for path in glob.glob(glob.escape(self.journal_file) + ".*"):
+            suffix = path.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                generations.append((int(suffix), path))
+        return sorted(generations)
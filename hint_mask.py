@@ -0,0 +1,96 @@
+"""Masca de indicii a unui răspuns: pozițiile ascunse se calculează o singură dată per întrebare.
+
+Dezvăluirea unei litere e O(1) (eliminare prin interschimbare din lista pozițiilor ascunse),
+iar textul afișat se reconstruiește doar după o modificare. Vocalele se citesc din forma
+normalizată la încărcare (q["normalized"]), fără a normaliza fiecare literă.
+"""
+import random
+from array import array
+
+from questions import normalize_text
+
+VOWELS = frozenset("aeiou")
+
+
+class RevealMask:
+    __slots__ = ("answer", "chars", "hidden", "slots", "vowels", "words", "first_pos", "word_pos", "_rendered")
+
+    def __init__(self, answer, normalized=None):
+        if normalized is None or len(normalized) != len(answer):
+            # Forma normalizată lipsește sau nu e aliniată literă cu literă (de ex. ligaturi)
+            normalized = "".join(normalize_text(char)[:1] or char for char in answer)
+        self.answer = answer
+        self.chars = list(answer)
+        self.hidden = array("H")
+        # slots[i] = poziția lui i în lista hidden + 1; 0 înseamnă că litera e vizibilă
+        self.slots = array("H", bytes(2 * len(answer)))
+        self.vowels = array("H")
+        self.words = []
+        word_start = None
+        for i, char in enumerate(answer):
+            if char.isalnum():
+                self.chars[i] = "_"
+                self.hidden.append(i)
+                self.slots[i] = len(self.hidden)
+                if normalized[i] in VOWELS:
+                    self.vowels.append(i)
+            if char == " ":
+                if word_start is not None:
+                    self.words.append((word_start, i))
+                word_start = None
+            elif word_start is None:
+                word_start = i
+        if word_start is not None:
+            self.words.append((word_start, len(answer)))
+        self.first_pos = 0
+        self.word_pos = 0
+        self._rendered = None
+
+    def is_hidden(self, i):
+        return self.slots[i] != 0
+
+    def hidden_count(self):
+        return len(self.hidden)
+
+    def reveal(self, i):
+        slot = self.slots[i]
+        if not slot:
+            return False
+        last = self.hidden.pop()
+        if last != i:
+            self.hidden[slot - 1] = last
+            self.slots[last] = slot
+        self.slots[i] = 0
+        self.chars[i] = self.answer[i]
+        self._rendered = None
+        return True
+
+    def reveal_random(self, count):
+        for i in random.sample(self.hidden, min(count, len(self.hidden))):
+            self.reveal(i)
+
+    def reveal_first(self):
+        """Prima literă încă ascunsă; indicatorul avansează doar înainte, deci cost amortizat O(1)."""
+        while self.first_pos < len(self.answer):
+            i = self.first_pos
+            self.first_pos += 1
+            if self.reveal(i):
+                return
+
+    def reveal_vowels(self):
+        for i in self.vowels:
+            self.reveal(i)
+
+    def reveal_word(self):
+        """Dezvăluie primul cuvânt care mai are litere ascunse."""
+        while self.word_pos < len(self.words):
+            start, end = self.words[self.word_pos]
+            self.word_pos += 1
+            revealed = [self.reveal(i) for i in range(start, end)]
+            if any(revealed):
+                return
+
+    def render(self):
+        if self._rendered is None:
+            self._rendered = "".join(self.chars)
+        return self._rendered
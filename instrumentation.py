@@ -0,0 +1,190 @@
+"""Măsurarea timpilor din interfață: construirea ecranelor, tastele apăsate și întârzierea buclei Tk.
+
+Pentru fiecare ecran se înregistrează doi timpi:
+    <nume>.build   execuția metodei care construiește ecranul
+    <nume>.drawn   până la primul moment liber al buclei Tk, după ce widget-urile au fost desenate
+Tastele legate prin QuizGame.bind_key sunt măsurate la fel, de la apăsare până la ecranul desenat.
+Dialogurile modale deschise prin TimedDialogs opresc ceasul span-urilor în curs: timpul cât
+jucătorul citește un messagebox nu este atribuit aplicației.
+"""
+import functools
+import time
+import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
+
+from storage import atomic_write_json
+
+# Limitele superioare ale intervalelor histogramei, în milisecunde
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+RECENT_SAMPLES = 512
+BAR_WIDTH = 30
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max", "recent")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, ms):
+        for i, limit in enumerate(BUCKETS_MS):
+            if ms <= limit:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.recent.append(ms)
+
+    def percentile(self, fraction):
+        """Percentila din ultimele RECENT_SAMPLES valori."""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def to_dict(self):
+        labels = [f"<={limit}" for limit in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "max_ms": round(self.max, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class Instrumentation:
+    def __init__(self, root, lag_interval_ms=100):
+        self.root = root
+        self.lag_interval_ms = lag_interval_ms
+        self.histograms = {}
+        self.current_screen = None
+        # Span-urile deschise, ca [început, timp petrecut în dialoguri]
+        self._active = []
+        self._lag_id = None
+        self._lag_due = None
+
+    def record(self, name, ms):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(ms)
+
+    @contextmanager
+    def span(self, name):
+        timing = [time.perf_counter(), 0.0]
+        self._active.append(timing)
+        try:
+            yield
+        finally:
+            self._active.remove(timing)
+            start = timing[0] + timing[1]
+            self.record(f"{name}.build", (time.perf_counter() - start) * 1000)
+            try:
+                # Callback-urile after_idle rulează după redesenarea programată de widget-urile noi
+                self.root.after_idle(self._drawn, name, start)
+            except tk.TclError:
+                pass  # fereastra a fost închisă de handler
+
+    @contextmanager
+    def paused(self):
+        """Timpul petrecut în interior (de ex. un dialog modal) nu se adaugă la span-urile deschise."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for timing in self._active:
+                timing[1] += elapsed
+
+    def _drawn(self, name, start):
+        self.record(f"{name}.drawn", (time.perf_counter() - start) * 1000)
+
+    @contextmanager
+    def screen(self, name):
+        self.current_screen = name
+        with self.span(f"screen.{name}"):
+            yield
+
+    def wrap_handler(self, key, handler):
+        @functools.wraps(handler)
+        def wrapper(event):
+            with self.span(f"key.{key}@{self.current_screen}"):
+                return handler(event)
+        return wrapper
+
+    def start_lag_sampler(self):
+        """Programează un callback la intervale fixe; întârzierea față de momentul cerut e timpul în care bucla a fost ocupată."""
+        self._lag_due = time.perf_counter() + self.lag_interval_ms / 1000
+        self._lag_id = self.root.after(self.lag_interval_ms, self._sample_lag)
+
+    def _sample_lag(self):
+        now = time.perf_counter()
+        self.record("idle_lag", max(0.0, (now - self._lag_due) * 1000))
+        self._lag_due = now + self.lag_interval_ms / 1000
+        self._lag_id = self.root.after(self.lag_interval_ms, self._sample_lag)
+
+    def stop(self):
+        if self._lag_id is not None:
+            try:
+                self.root.after_cancel(self._lag_id)
+            except tk.TclError:
+                pass
+            self._lag_id = None
+
+    def summary(self):
+        return {name: self.histograms[name].to_dict() for name in sorted(self.histograms)}
+
+    def report(self):
+        lines = []
+        for name, data in self.summary().items():
+            lines.append(f"{name}: {data['count']} măsurători, medie {data['mean_ms']:.1f} ms, "
+                         f"p50 {data['p50_ms']:.1f} ms, p95 {data['p95_ms']:.1f} ms, max {data['max_ms']:.1f} ms")
+            largest = max(data["buckets"].values()) or 1
+            for label, count in data["buckets"].items():
+                if count:
+                    bar = "#" * max(1, round(count / largest * BAR_WIDTH))
+                    lines.append(f"    {label:>7} ms  {bar} {count}")
+        return "\n".join(lines) if lines else "Nicio măsurătoare încă."
+
+    def export(self, path):
+        atomic_write_json(path, self.summary(), indent=2)
+
+
+class TimedDialogs:
+    """Înlocuitor pentru tkinter.messagebox care oprește ceasul span-urilor cât dialogul e deschis."""
+
+    def __init__(self, instrumentation, module):
+        self._instrumentation = instrumentation
+        self._module = module
+
+    def __getattr__(self, name):
+        function = getattr(self._module, name)
+        if not callable(function):
+            return function
+
+        @functools.wraps(function)
+        def call(*args, **kwargs):
+            with self._instrumentation.paused():
+                return function(*args, **kwargs)
+        return call
+
+
+def screen(name):
+    """Decorator pentru metodele QuizGame care construiesc un ecran (folosește self.instrumentation)."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.instrumentation.screen(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
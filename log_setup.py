@@ -0,0 +1,110 @@
+"""Jurnalizare neblocantă: înregistrările trec printr-o coadă și sunt scrise pe un fir separat.
+
+Fișierul conține câte un obiect JSON pe linie și se rotește după dimensiune sau vechime.
+Nivelurile se pot regla per subsistem, de ex.:
+
+    QUIZ_LOG_LEVELS="quiz.sound=DEBUG,quiz.ui=WARNING" python main.py
+"""
+import atexit
+import datetime
+import json
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FILE = "quiz_game.log"
+
+DEFAULT_LEVELS = {
+    "quiz": logging.INFO,          # ui, game, data, auth, sound
+    "quiz.sound": logging.WARNING,
+    "background": logging.INFO,
+    "sound_assets": logging.INFO,
+    "question_bank": logging.INFO,
+    "highscore_store": logging.INFO,
+    "player_stats": logging.INFO,
+    "user_store": logging.INFO,
+    "storage": logging.INFO,
+    "quiz_engine": logging.INFO,
+    "quiz_server": logging.INFO,
+    "auth": logging.INFO,
+    "spaced_repetition": logging.INFO,
+    "question_import": logging.INFO,
+    "near_duplicates": logging.INFO,
+    "question_clusters": logging.INFO,
+}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        data = {
+            "time": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.threadName != "MainThread":
+            data["thread"] = record.threadName
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SizeAndTimeRotatingFileHandler(RotatingFileHandler):
+    """Rotește fișierul când depășește max_bytes sau când e mai vechi de interval secunde."""
+
+    def __init__(self, filename, max_bytes, backup_count, interval):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.interval = interval
+        self.rollover_at = self._next_rollover()
+
+    def _next_rollover(self):
+        try:
+            started = os.path.getmtime(self.baseFilename) if os.path.getsize(self.baseFilename) else time.time()
+        except OSError:
+            started = time.time()
+        return started + self.interval
+
+    def shouldRollover(self, record):
+        if self.interval and record.created >= self.rollover_at:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.rollover_at = time.time() + self.interval
+
+
+def parse_levels(spec):
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+    return levels
+
+
+def setup_logging(filename=LOG_FILE, max_bytes=1024 * 1024, backup_count=5, interval=24 * 3600, levels=None):
+    """Configurează coada de jurnalizare și pornește firul de scriere; întoarce QueueListener-ul."""
+    file_handler = SizeAndTimeRotatingFileHandler(filename, max_bytes, backup_count, interval)
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    configured = dict(DEFAULT_LEVELS)
+    configured.update(levels or {})
+    configured.update(parse_levels(os.environ.get("QUIZ_LOG_LEVELS", "")))
+    for name, level in configured.items():
+        logging.getLogger(name).setLevel(level)
+
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -1,10 +1,36 @@
+import sys
+import time
+
+start = time.perf_counter()
 import tkinter as tk
-from tkinter import ttk
 from quiz import QuizGame
+import_time = time.perf_counter() - start
+
+
+def print_startup_report(timings):
+    total = sum(timings.values())
+    print("Startup report:")
+    for name, seconds in timings.items():
+        print(f"  {name:<22}{seconds * 1000:9.1f} ms")
+    print(f"  {'total':<22}{total * 1000:9.1f} ms")
+
 
 def main():
-    root = ttk.Window(themename="litera")  # Folosește ttk.Window pentru consistență
+    timings = {"import": import_time}
+    window_start = time.perf_counter()
+    root = tk.Tk()  # ttk nu are Window; tk.Tk() e fereastra principală, ca în quiz.py
+    timings["window_creation"] = time.perf_counter() - window_start
     app = QuizGame(root)
+    timings.update(app.startup_timings)
+    if "--perf-report" in sys.argv:
+        # Histogramele ecranelor și ale tastelor se scriu la închiderea jocului
+        app.perf_report_file = "perf_report.json"
+    if "--startup-report" in sys.argv:
+        # Raportul se afișează după primul cadru desenat, când login-ul e vizibil
+        def report():
+            timings["first_frame"] = time.perf_counter() - start - sum(timings.values())
+            print_startup_report(timings)
+        root.after_idle(report)
     root.mainloop()  # Înlocuiește while True cu mainloop
 
 if __name__ == "__main__":
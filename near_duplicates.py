@@ -0,0 +1,286 @@
+"""Detectarea întrebărilor aproape identice (reformulări) din toate categoriile și dificultățile.
+
+Fiecare întrebare, normalizată cu normalize_text, se reduce la cuvintele ei
+semnificative (cel puțin MIN_WORD litere și nu din STOP_WORDS, sau numere), fără terminațiile
+din SUFFIXES, ca formele flexionate să coincidă ("Franța"/"Franței", "Germania"/"Germaniei").
+
+Pentru a nu compara toate perechile, semnătura MinHash a cuvintelor (NUM_PERM valori) se taie
+în BANDS benzi de câte ROWS valori (LSH): doar întrebările cu o bandă identică devin candidate.
+Un candidat e comparat exact (Jaccard pe cuvinte) cu primul membru al grupului în care ar intra,
+iar cele confirmate se unesc (union-find). O reformulare are același răspuns, deci candidații se
+caută doar între întrebările cu aceeași formă normalizată a răspunsului: "În ce an a început
+Primul Război Mondial?" și "... s-a terminat ...?" rămân separate. Costul e liniar în numărul
+de întrebări; în memorie rămân doar cheile benzilor, ale răspunsurilor și cuvintele, circa
+160 de octeți per întrebare.
+
+Grupurile se salvează în question_clusters.json, după cheia textului, astfel încât pot fi
+folosite pentru orice sursă (bancă, fișiere text): motorul nu servește două întrebări din
+același grup într-o sesiune. Citirea lor (question_clusters.ClusterMap) nu depinde de acest
+modul, deci jocul nu importă analiza la pornire.
+
+Rulare:
+    python near_duplicates.py                      # questions.qbank sau, în lipsă, categories/
+    python near_duplicates.py questions.qbank categories --threshold 0.8
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import zlib
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from question_bank import DEFAULT_BANK_FILE, QuestionBank, QuestionBankError, iter_text_file
+from question_clusters import DEFAULT_CLUSTERS_FILE, ClusterMap, canonical_text, text_key
+from questions import accepted_field, parse_answer
+
+logger = logging.getLogger(__name__)
+
+MIN_WORD = 3
+MIN_STEM = 3
+# Terminații de articol și de caz, cele mai lungi primele
+SUFFIXES = ("urilor", "ilor", "elor", "ului", "iei", "lor", "ul", "ei", "ii", "ia", "ie", "le", "a", "e", "i")
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.6
+REPORT_CLUSTERS = 10
+CHUNK_TEXTS = 2000
+
+# Cuvinte frecvente în formularea întrebărilor, care nu deosebesc întrebările între ele (normalizate)
+STOP_WORDS = frozenset((
+    "care", "este", "sunt", "fost", "cine", "unde", "cand", "cate", "catre", "cati", "despre", "pentru",
+    "acest", "aceasta", "acesta", "ceea", "dintre", "intre", "numele", "cel", "cea", "cei", "cele", "mai",
+    "din", "ale", "lui", "sau", "are", "fie", "unui", "unei", "the", "and", "who", "how", "was", "are",
+    "for", "what", "which", "where", "when", "does", "with", "from", "that", "this", "were", "there", "name",
+))
+_PRIME = (1 << 61) - 1
+# Aceleași permutări în toate procesele, deci benzile sunt comparabile
+_rng = random.Random(0x5EED)
+PERMUTATIONS = tuple((_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM))
+del _rng
+
+
+def answer_key(accepted):
+    """Cheia de 64 de biți a răspunsului afișat, normalizat (prima formă acceptată)."""
+    return text_key(accepted_field(accepted, "normalized"))
+
+
+def stem(word):
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            return word[:-len(suffix)]
+    return word
+
+
+def shingles(text):
+    words = canonical_text(text).split()
+    significant = {stem(word) for word in words
+                   if (len(word) >= MIN_WORD and word not in STOP_WORDS) or word.isdigit()}
+    return significant or set(words) or {""}
+
+
+def word_hashes(text):
+    return sorted({zlib.crc32(shingle.encode("utf-8")) for shingle in shingles(text)})
+
+
+def band_keys(hashes):
+    """Semnătura MinHash a cuvintelor, tăiată în BANDS benzi; întoarce câte o cheie per bandă."""
+    # Câte un rând de NUM_PERM valori per cuvânt; semnătura e minimul pe fiecare coloană
+    rows = [[(a * h + b) % _PRIME for a, b in PERMUTATIONS] for h in hashes]
+    signature = list(map(min, zip(*rows)))
+    return [hash(tuple(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+
+def signature_chunk(questions):
+    """Rulează într-un proces de lucru: cheile, răspunsurile, benzile și cuvintele unei bucăți de întrebări."""
+    bands = array("q")
+    hashes = array("I")
+    lengths = array("H")
+    for text, _ in questions:
+        words = word_hashes(text)
+        bands.extend(band_keys(words))
+        hashes.extend(words)
+        lengths.append(len(words))
+    keys = [text_key(text) for text, _ in questions]
+    answers = [answer_key(accepted) for _, accepted in questions]
+    return keys, answers, bands.tobytes(), hashes.tobytes(), lengths.tobytes()
+
+
+class NearDuplicateIndex:
+    """Cheile de bandă, răspunsurile și cuvintele întrebărilor, în ordinea adăugării, și gruparea lor."""
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.keys = array("Q")
+        self.answers = array("Q")
+        self.bands = array("q")
+        self.hashes = array("I")
+        self.offsets = array("Q", [0])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, text, accepted):
+        words = word_hashes(text)
+        self.keys.append(text_key(text))
+        self.answers.append(answer_key(accepted))
+        self.bands.extend(band_keys(words))
+        self.hashes.extend(words)
+        self.offsets.append(len(self.hashes))
+
+    def add_chunk(self, keys, answers, bands, hashes, lengths):
+        self.keys.extend(keys)
+        self.answers.extend(answers)
+        self.bands.frombytes(bands)
+        self.hashes.frombytes(hashes)
+        end = self.offsets[-1]
+        for length in array("H", lengths):
+            end += length
+            self.offsets.append(end)
+
+    def similarity(self, i, j):
+        """Similaritatea Jaccard exactă a cuvintelor; MinHash doar propune candidații."""
+        a = set(self.hashes[self.offsets[i]:self.offsets[i + 1]])
+        b = set(self.hashes[self.offsets[j]:self.offsets[j + 1]])
+        return len(a & b) / len(a | b) if a or b else 1.0
+
+    def clusters(self):
+        """Grupurile cu cel puțin două întrebări, ca liste de poziții, cele mai mari primele."""
+        count = len(self.keys)
+        parent = list(range(count))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        bands = self.bands
+        answers = self.answers
+        for band in range(BANDS):
+            # O bandă per trecere: în memorie e doar dicționarul benzii curente. Cheia include
+            # răspunsul, deci întrebările cu răspunsuri diferite nici nu devin candidate.
+            first = {}
+            for i in range(count):
+                j = first.setdefault(bands[i * BANDS + band] ^ answers[i], i)
+                if j == i or answers[i] != answers[j]:
+                    continue
+                root_i, root_j = find(i), find(j)
+                # Se compară rădăcinile, nu perechea: fiecare membru e apropiat de primul din grup,
+                # iar lanțurile de asemănări slabe (A~B, B~C, ...) nu ajung să unească tot indexul
+                if root_i != root_j and self.similarity(root_i, root_j) >= self.threshold:
+                    parent[root_i] = root_j
+        groups = {}
+        for i in range(count):
+            groups.setdefault(find(i), []).append(i)
+        clusters = [members for members in groups.values() if len(members) > 1]
+        clusters.sort(key=len, reverse=True)
+        return clusters
+
+
+def iter_source_questions(sources):
+    """Perechile (întrebare, forme acceptate) din bănci (.qbank) și directoare de fișiere text, într-o ordine fixă."""
+    for source in sources:
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.endswith(".txt"):
+                    for question, answer in iter_text_file(os.path.join(source, name)):
+                        yield question, parse_answer(answer)[1]
+            continue
+        bank = QuestionBank(source)
+        try:
+            for bucket in bank.buckets.values():
+                for index in range(len(bucket)):
+                    question, _, accepted = bank.read_record(bucket.record_offset(index))
+                    yield question, accepted
+        finally:
+            bank.close()
+
+
+def _chunks(texts, size):
+    chunk = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def build_index(questions, pool=None, threshold=SIMILARITY_THRESHOLD, chunk_size=CHUNK_TEXTS, max_in_flight=8):
+    """Calculează semnăturile, în paralel dacă se dă un pool de procese, păstrând ordinea întrebărilor."""
+    index = NearDuplicateIndex(threshold)
+    if pool is None:
+        for text, accepted in questions:
+            index.add(text, accepted)
+        return index
+    in_flight = deque()
+    for chunk in _chunks(questions, chunk_size):
+        in_flight.append(pool.submit(signature_chunk, chunk))
+        if len(in_flight) >= max_in_flight:
+            index.add_chunk(*in_flight.popleft().result())
+    while in_flight:
+        index.add_chunk(*in_flight.popleft().result())
+    return index
+
+
+class DuplicateReport:
+    def __init__(self, questions, clusters, examples):
+        self.questions = questions
+        self.clusters = clusters
+        self.examples = examples
+
+    @property
+    def clustered(self):
+        return sum(len(members) for members in self.clusters)
+
+    def summary(self):
+        lines = [f"Reformulări: {len(self.clusters)} grupuri cu {self.clustered} din {self.questions} întrebări"]
+        for members, texts in self.examples:
+            lines.append(f"  grup de {len(members)}: " + " | ".join(texts))
+        return "\n".join(lines)
+
+
+def find_near_duplicates(sources, clusters_file=DEFAULT_CLUSTERS_FILE, pool=None, threshold=SIMILARITY_THRESHOLD):
+    """Grupează întrebările din surse, salvează grupurile și întoarce un DuplicateReport."""
+    index = build_index(iter_source_questions(sources), pool, threshold)
+    clusters = index.clusters()
+    ClusterMap.from_clusters(index.keys, clusters).save(clusters_file)
+    # Textele exemplelor se recitesc din surse; indexul nu le păstrează
+    wanted = {i: None for members in clusters[:REPORT_CLUSTERS] for i in members[:3]}
+    if wanted:
+        for position, (text, _) in enumerate(iter_source_questions(sources)):
+            if position in wanted:
+                wanted[position] = text
+    examples = [(members, [wanted[i] for i in members[:3]]) for members in clusters[:REPORT_CLUSTERS]]
+    logger.info(f"Reformulări găsite: {len(clusters)} grupuri în {len(index)} întrebări")
+    return DuplicateReport(len(index), clusters, examples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Găsește întrebările reformulate din băncile de întrebări.")
+    parser.add_argument("sources", nargs="*", help="bănci .qbank sau directoare cu fișiere text")
+    parser.add_argument("-o", "--output", default=DEFAULT_CLUSTERS_FILE, help="fișierul cu grupuri")
+    parser.add_argument("--threshold", type=float, default=SIMILARITY_THRESHOLD,
+                        help="similaritatea minimă estimată (implicit 0.6)")
+    parser.add_argument("--workers", type=int, help="numărul de procese (implicit toate nucleele)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    sources = args.sources or [DEFAULT_BANK_FILE if os.path.exists(DEFAULT_BANK_FILE) else "categories"]
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count() or 1) as pool:
+            report = find_near_duplicates(sources, args.output, pool, args.threshold)
+    except (OSError, ValueError, QuestionBankError) as e:
+        print(f"Analiza a eșuat: {e}")
+        return 1
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Statistici cumulative per jucător, actualizate la fiecare joc salvat.
+
+Persistență: instantaneu player_stats.json plus jurnalul player_stats.journal, ca la conturi.
+Un joc salvat adaugă în jurnal o singură linie, cu starea completă a jucătorului modificat,
+deci costul nu depinde de numărul de jucători. Jurnalul este mutat în instantaneu abia
+când devine cel puțin la fel de lung ca acesta, astfel încât rescrierea se amortizează.
+
+Fișierul reține și câte scoruri au fost incluse; dacă nu se potrivește cu numărul
+de scoruri salvate (de ex. după o întrerupere), statisticile se reconstruiesc o dată.
+"""
+import json
+import logging
+import os
+
+from storage import append_jsonl, atomic_write_json, iter_jsonl
+
+logger = logging.getLogger(__name__)
+
+
+def empty_stats():
+    return {"games": 0, "questions": 0, "score": 0, "time": 0.0, "hints": 0, "categories": {}, "difficulties": {}}
+
+
+class PlayerStats:
+    def __init__(self, stats_file="player_stats.json", compact_every=500):
+        self.stats_file = stats_file
+        self.journal_file = f"{os.path.splitext(stats_file)[0]}.journal"
+        self.compact_every = compact_every
+        self.players = {}
+        self.entries = 0
+        self.journal_records = 0
+
+    def load(self, highscores):
+        data = None
+        if os.path.exists(self.stats_file):
+            try:
+                with open(self.stats_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Statisticile nu pot fi citite, se reconstruiesc: {e}")
+        if data:
+            self.players = data["players"]
+            self.entries = data["entries"]
+            # Reluarea jurnalului e idempotentă: fiecare linie conține starea completă a jucătorului
+            self.journal_records = 0
+            for record in iter_jsonl(self.journal_file):
+                self.players[record["name"]] = record["stats"]
+                self.entries = record["entries"]
+                self.journal_records += 1
+        if not data or self.entries != len(highscores):
+            self.rebuild(highscores.all_scores())
+            self.compact()
+        logger.info(f"Statistici încărcate pentru {len(self.players)} jucători")
+
+    def rebuild(self, scores):
+        self.players = {}
+        self.entries = 0
+        for entry in scores:
+            self._add(entry)
+
+    def _add(self, entry):
+        stats = self.players.setdefault(entry["name"], empty_stats())
+        stats["games"] += 1
+        stats["questions"] += entry["questions"]
+        stats["score"] += entry["score"]
+        stats["time"] += entry["time"]
+        stats["hints"] += entry["hints_used"]
+        for group, key in (("categories", entry["category"]), ("difficulties", entry["difficulty"])):
+            totals = stats[group].setdefault(key, [0, 0])
+            totals[0] += entry["questions"]
+            totals[1] += entry["score"]
+        self.entries += 1
+
+    def record(self, entry):
+        self.record_many([entry])
+
+    def record_many(self, entries):
+        """Adaugă scorurile și scrie în jurnal doar jucătorii modificați, într-o singură adăugare."""
+        for entry in entries:
+            self._add(entry)
+        names = sorted({entry["name"] for entry in entries})
+        if not names:
+            return
+        append_jsonl(self.journal_file,
+                     [{"name": name, "stats": self.players[name], "entries": self.entries} for name in names])
+        self.journal_records += len(names)
+        if self.journal_records >= max(self.compact_every, len(self.players)):
+            self.compact()
+
+    def compact(self):
+        atomic_write_json(self.stats_file, {"entries": self.entries, "players": self.players})
+        open(self.journal_file, "w").close()
+        self.journal_records = 0
+
+    def get(self, player):
+        return self.players.get(player)
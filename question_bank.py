@@ -0,0 +1,291 @@
+"""Banca de întrebări compactă, pe disc, citită prin mmap.
+
+Formatul fișierului (little-endian):
+
+    preambul   : b"QBNK", versiune (H), rezervat (H), poziția directorului (Q)
+    înregistrări: pentru fiecare întrebare: len(întrebare) (H), len(răspuns) (H),
+                  len(forme acceptate) (H), apoi textele UTF-8; formele acceptate
+                  sunt răspunsul și variantele lui, deja normalizate, unite prin "|"
+                  (versiunea 1 nu le avea; pentru ea se calculează la citire)
+    tabele     : pentru fiecare categorie/dificultate, câte un offset (Q) per întrebare
+    director   : număr de intrări (H), apoi pentru fiecare intrare:
+                  len(categorie) (H), categorie, len(dificultate) (H), dificultate,
+                  poziția tabelei de offseturi (Q), număr întrebări (I),
+                  lungimea maximă a răspunsului (I; doar informativă, nu se citește)
+
+Directorul se scrie la final, astfel încât fișierul poate fi construit într-o
+singură trecere, fără a ține întrebările în memorie.
+"""
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from questions import Question, accepted_field, parse_answer
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"QBNK"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+DEFAULT_BANK_FILE = "questions.qbank"
+
+_PREAMBLE = struct.Struct("<4sHHQ")
+_RECORD_V1 = struct.Struct("<HH")
+_RECORD = struct.Struct("<HHH")
+_OFFSET = struct.Struct("<Q")
+_LENGTH = struct.Struct("<H")
+_BUCKET_INFO = struct.Struct("<QII")
+_MAX_TEXT = 0xFFFF
+
+
+class QuestionBankError(Exception):
+    pass
+
+
+class BankBucket(Sequence):
+    """Întrebările unei perechi categorie/dificultate, citite la cerere din mmap."""
+
+    def __init__(self, bank, category, difficulty, table_pos, count):
+        self.bank = bank
+        self.category = sys.intern(category)
+        self.difficulty = sys.intern(difficulty)
+        self.table_pos = table_pos
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("index întrebare în afara intervalului")
+        return Question(self, index)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield Question(self, i)
+
+    def field(self, index, field):
+        if field == "question":
+            return self.bank.read_record(self.record_offset(index))[0]
+        if field == "answer":
+            return self.bank.read_record(self.record_offset(index))[1]
+        if field == "category":
+            return self.category
+        if field == "difficulty":
+            return self.difficulty
+        if field in ("normalized", "accepted"):
+            return accepted_field(self.bank.read_record(self.record_offset(index))[2], field)
+        raise KeyError(field)
+
+    def record_offset(self, index):
+        return _OFFSET.unpack_from(self.bank.buffer, self.table_pos + index * _OFFSET.size)[0]
+
+
+class QuestionBank:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise QuestionBankError(f"Banca de întrebări {path} este goală") from e
+        self.buckets = {}
+        try:
+            self._read_directory()
+        except (struct.error, UnicodeDecodeError, QuestionBankError):
+            self.close()
+            raise
+        logger.info(f"Banca de întrebări deschisă: {path} ({len(self.buckets)} categorii/dificultăți)")
+
+    @classmethod
+    def open_if_exists(cls, path=DEFAULT_BANK_FILE):
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, struct.error, UnicodeDecodeError, QuestionBankError) as e:
+            logger.error(f"Eroare la deschiderea băncii de întrebări {path}: {e}")
+            return None
+
+    def _read_directory(self):
+        magic, version, _, directory_pos = _PREAMBLE.unpack_from(self.buffer, 0)
+        self.version = version
+        if magic != MAGIC:
+            raise QuestionBankError(f"{self.path} nu este o bancă de întrebări")
+        if version not in SUPPORTED_VERSIONS:
+            raise QuestionBankError(f"Versiune necunoscută a băncii de întrebări: {version}")
+        pos = directory_pos
+        (entries,) = _LENGTH.unpack_from(self.buffer, pos)
+        pos += _LENGTH.size
+        for _ in range(entries):
+            category, pos = self._read_text(pos)
+            difficulty, pos = self._read_text(pos)
+            table_pos, count, _ = _BUCKET_INFO.unpack_from(self.buffer, pos)
+            pos += _BUCKET_INFO.size
+            self.buckets[(category, difficulty)] = BankBucket(self, category, difficulty, table_pos, count)
+
+    def _read_text(self, pos):
+        (length,) = _LENGTH.unpack_from(self.buffer, pos)
+        start = pos + _LENGTH.size
+        return self.buffer[start:start + length].decode("utf-8"), start + length
+
+    def read_record(self, offset):
+        if self.version == 1:
+            question_len, answer_len = _RECORD_V1.unpack_from(self.buffer, offset)
+            start = offset + _RECORD_V1.size
+            question = self.buffer[start:start + question_len].decode("utf-8")
+            start += question_len
+            answer, accepted = parse_answer(self.buffer[start:start + answer_len].decode("utf-8"))
+            return question, answer, accepted
+        question_len, answer_len, accepted_len = _RECORD.unpack_from(self.buffer, offset)
+        start = offset + _RECORD.size
+        question = self.buffer[start:start + question_len].decode("utf-8")
+        start += question_len
+        answer = self.buffer[start:start + answer_len].decode("utf-8")
+        start += answer_len
+        accepted = self.buffer[start:start + accepted_len].decode("utf-8")
+        return question, answer, accepted
+
+    def get_bucket(self, category, difficulty):
+        return self.buckets.get((category, difficulty))
+
+    def close(self):
+        self.buffer.close()
+        self._file.close()
+
+
+def _encode_text(text):
+    data = text.encode("utf-8")
+    if len(data) > _MAX_TEXT:
+        raise QuestionBankError(f"Text prea lung pentru banca de întrebări ({len(data)} octeți)")
+    return data
+
+
+class QuestionBankWriter:
+    """Scrie o bancă întrebare cu întrebare, în orice ordine a categoriilor.
+
+    Înregistrările ajung direct în fișier; în memorie rămân doar offseturile (8 octeți per
+    întrebare), iar tabelele și directorul se scriu la close(). Fișierul final apare atomic,
+    prin redenumirea unui fișier temporar; abort() renunță la el.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self._file = open(self.tmp_path, "wb")
+        self._file.write(_PREAMBLE.pack(MAGIC, VERSION, 0, 0))
+        self.buckets = {}
+        self.count = 0
+
+    def add(self, category, difficulty, question, answer, accepted):
+        """Adaugă o întrebare cu răspunsul deja trecut prin parse_answer."""
+        question_data = _encode_text(question)
+        answer_data = _encode_text(answer)
+        accepted_data = _encode_text(accepted)
+        bucket = self.buckets.get((category, difficulty))
+        if bucket is None:
+            bucket = self.buckets[(category, difficulty)] = [array("Q"), 0]
+        f = self._file
+        bucket[0].append(f.tell())
+        bucket[1] = max(bucket[1], len(answer))
+        f.write(_RECORD.pack(len(question_data), len(answer_data), len(accepted_data)))
+        f.write(question_data)
+        f.write(answer_data)
+        f.write(accepted_data)
+        self.count += 1
+
+    def close(self):
+        f = self._file
+        directory = []
+        for (category, difficulty), (offsets, max_answer_len) in self.buckets.items():
+            table_pos = f.tell()
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            offsets.tofile(f)
+            directory.append((category, difficulty, table_pos, len(offsets), max_answer_len))
+        directory_pos = f.tell()
+        f.write(_LENGTH.pack(len(directory)))
+        for category, difficulty, table_pos, count, max_answer_len in directory:
+            for text in (category, difficulty):
+                data = _encode_text(text)
+                f.write(_LENGTH.pack(len(data)))
+                f.write(data)
+            f.write(_BUCKET_INFO.pack(table_pos, count, max_answer_len))
+        f.seek(0)
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, 0, directory_pos))
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(self.tmp_path, self.path)
+        logger.info(f"Bancă de întrebări scrisă: {self.path} ({self.count} întrebări)")
+
+    def abort(self):
+        self._file.close()
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_question_bank(path, buckets):
+    """Scrie banca dintr-un iterabil de ((categorie, dificultate), perechi (întrebare, răspuns)).
+
+    Răspunsul poate conține variante separate prin "|"; formele lor normalizate se scriu
+    alături, ca verificarea răspunsului să nu mai normalizeze nimic la joc.
+
+    Întrebările sunt scrise pe măsură ce sosesc; în memorie rămân doar offseturile.
+    """
+    with QuestionBankWriter(path) as writer:
+        for (category, difficulty), pairs in buckets:
+            for question, raw_answer in pairs:
+                writer.add(category, difficulty, question, *parse_answer(raw_answer))
+
+
+def iter_text_file(file_path):
+    """Citește perechi (întrebare, răspuns) din formatul pe două linii, fără readlines()."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        for question in f:
+            answer = f.readline()
+            if not answer:
+                break
+            question = question.strip()
+            answer = answer.strip()
+            if question and answer:
+                yield question, answer
+
+
+def build_from_categories(categories_dir="categories", path=DEFAULT_BANK_FILE):
+    """Compilează fișierele categories/{categorie}_{dificultate}.txt într-o bancă."""
+    sources = []
+    for name in sorted(os.listdir(categories_dir)):
+        stem, ext = os.path.splitext(name)
+        if ext != ".txt" or "_" not in stem:
+            continue
+        category, difficulty = stem.rsplit("_", 1)
+        sources.append(((category, difficulty), os.path.join(categories_dir, name)))
+    write_question_bank(path, ((key, iter_text_file(file_path)) for key, file_path in sources))
+    return len(sources)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else "categories"
+    target = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_BANK_FILE
+    count = build_from_categories(source_dir, target)
+    print(f"{count} fișiere compilate în {target}")
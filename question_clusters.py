@@ -0,0 +1,71 @@
+"""Grupurile de reformulări salvate de near_duplicates.py, așa cum le folosește jocul.
+
+Modulul are doar dependențe ușoare, fiindcă e importat la pornirea jocului și a serverului;
+calculul grupurilor (MinHash, pool de procese) rămâne în near_duplicates.py.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+
+from questions import normalize_text
+from storage import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLUSTERS_FILE = "question_clusters.json"
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def canonical_text(text):
+    """Textul normalizat, fără punctuație și cu spațiile comprimate."""
+    return _NON_WORD.sub(" ", normalize_text(text)).strip()
+
+
+def text_key(text):
+    """Cheia de 64 de biți a unei întrebări, aceeași indiferent de bancă sau fișier."""
+    return int.from_bytes(hashlib.blake2b(canonical_text(text).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class ClusterMap:
+    """Grupul fiecărei întrebări care are reformulări; celelalte nu apar deloc."""
+
+    def __init__(self, cluster_of=None):
+        self._cluster_of = cluster_of or {}
+
+    @classmethod
+    def from_clusters(cls, keys, clusters):
+        cluster_of = {}
+        for cluster_id, members in enumerate(clusters):
+            for i in members:
+                cluster_of[keys[i]] = cluster_id
+        return cls(cluster_of)
+
+    @classmethod
+    def load_if_exists(cls, path=DEFAULT_CLUSTERS_FILE):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return cls({key: cluster_id for cluster_id, keys in enumerate(data["clusters"]) for key in keys})
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Eroare la încărcarea grupurilor de reformulări {path}: {e}")
+            return None
+
+    def save(self, path=DEFAULT_CLUSTERS_FILE):
+        clusters = {}
+        for key, cluster_id in self._cluster_of.items():
+            clusters.setdefault(cluster_id, []).append(key)
+        atomic_write_json(path, {"clusters": [clusters[cluster_id] for cluster_id in sorted(clusters)]})
+        logger.info(f"Grupuri de reformulări salvate: {path} ({len(clusters)} grupuri)")
+
+    def __len__(self):
+        return len(set(self._cluster_of.values()))
+
+    def cluster_of(self, question):
+        """Grupul întrebării sau None dacă nu are reformulări cunoscute."""
+        if not self._cluster_of:
+            return None
+        return self._cluster_of.get(text_key(question["question"]))
@@ -0,0 +1,330 @@
+"""Import în bloc al întrebărilor din exporturi CSV, TSV sau JSONL într-o bancă de întrebări.
+
+Rulare:
+    python question_import.py export.csv                       # adaugă la questions.qbank
+    python question_import.py a.jsonl b.tsv -o alta.qbank --replace
+    python question_import.py export.csv --category general --difficulty mediu
+    python question_import.py export.csv --near-duplicates     # și grupurile de reformulări
+
+Fiecare rând are câmpurile question, answer, category și difficulty (CSV/TSV cu antet,
+JSONL cu câte un obiect pe linie); categoria și dificultatea lipsă se iau din argumente.
+
+Fișierele nu sunt citite integral: firul principal taie intrarea în bucăți de rânduri,
+un pool de procese le validează și normalizează, iar rezultatele se scriu direct în bancă,
+în ordinea intrării. În memorie rămân doar câteva bucăți în lucru, offseturile băncii și
+indexul de duplicate (8 octeți per întrebare distinctă, într-un array).
+
+Cu --near-duplicates, la final aceleași procese calculează și grupurile de reformulări pentru
+toată banca (near_duplicates.py); ele se salvează lângă bancă și apar în raport. Analiza ține
+în memorie câteva sute de octeți per întrebare, deci e opțională; pentru bănci foarte mari
+poate fi rulată separat, cu python near_duplicates.py.
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from near_duplicates import DEFAULT_CLUSTERS_FILE, find_near_duplicates
+from question_bank import DEFAULT_BANK_FILE, QuestionBank, QuestionBankError, QuestionBankWriter
+from questions import normalize_text, parse_answer
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "tsv", "jsonl")
+DEFAULT_CHUNK_ROWS = 5000
+MAX_ERROR_SAMPLES = 10
+_MAX_TEXT = 0xFFFF
+
+DIFFICULTY_ALIASES = {
+    "ușor": "ușor", "usor": "ușor", "easy": "ușor",
+    "mediu": "mediu", "medium": "mediu",
+    "greu": "greu", "hard": "greu",
+}
+
+
+def digest(category, difficulty, question):
+    """Cheia de 64 de biți pentru detectarea duplicatelor (0 e rezervat pentru sloturile goale)."""
+    data = "\x1f".join((category, difficulty, " ".join(normalize_text(question).split()))).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little") or 1
+
+
+class DigestSet:
+    """Mulțime de digest-uri cu adresare deschisă peste un array("Q"), fără obiecte per element."""
+
+    def __init__(self, capacity=1 << 16):
+        self.slots = array("Q", bytes(8 * capacity))
+        self.mask = capacity - 1
+        self.count = 0
+
+    def add(self, key):
+        """Întoarce True dacă cheia era nouă."""
+        slots = self.slots
+        mask = self.mask
+        i = key & mask
+        while True:
+            current = slots[i]
+            if current == key:
+                return False
+            if current == 0:
+                break
+            i = (i + 1) & mask
+        slots[i] = key
+        self.count += 1
+        if self.count * 2 > mask:
+            self._grow()
+        return True
+
+    def _grow(self):
+        old = self.slots
+        self.slots = array("Q", bytes(16 * len(old)))
+        self.mask = len(self.slots) - 1
+        for key in old:
+            if key:
+                i = key & self.mask
+                while self.slots[i]:
+                    i = (i + 1) & self.mask
+                self.slots[i] = key
+
+    def __len__(self):
+        return self.count
+
+
+def clean_text(value):
+    return " ".join(str(value).split()) if value is not None else ""
+
+
+def validate_row(row, defaults):
+    """Întoarce (categorie, dificultate, întrebare, răspuns afișat, forme acceptate) sau ridică ValueError."""
+    question = clean_text(row.get("question"))
+    raw_answer = clean_text(row.get("answer"))
+    category = clean_text(row.get("category") or defaults["category"]).lower().replace(" ", "_")
+    difficulty = DIFFICULTY_ALIASES.get(clean_text(row.get("difficulty") or defaults["difficulty"]).lower())
+    if not question:
+        raise ValueError("întrebare lipsă")
+    if not raw_answer:
+        raise ValueError("răspuns lipsă")
+    if not category:
+        raise ValueError("categorie lipsă")
+    if difficulty is None:
+        raise ValueError(f"dificultate necunoscută: {row.get('difficulty')!r}")
+    answer, accepted = parse_answer(raw_answer)
+    for text in (question, answer, accepted, category):
+        if len(text.encode("utf-8")) > _MAX_TEXT:
+            raise ValueError("text prea lung")
+    return category, difficulty, question, answer, accepted
+
+
+def csv_reader(lines, fmt):
+    # În TSV ghilimelele sunt text obișnuit, iar fiecare linie e o înregistrare
+    if fmt == "tsv":
+        return csv.reader(lines, delimiter="\t", quoting=csv.QUOTE_NONE)
+    return csv.reader(lines)
+
+
+def parse_chunk(fmt, header, first_line, lines, defaults):
+    """Rulează într-un proces de lucru: o bucată de linii brute -> rânduri valide și erori.
+
+    Întoarce (rânduri, număr de rânduri citite, număr de erori, primele erori cu numărul liniei).
+    """
+    rows = []
+    errors = 0
+    samples = []
+    if fmt == "jsonl":
+        records = ((first_line + i, line) for i, line in enumerate(lines) if line.strip())
+    else:
+        reader = csv_reader(io.StringIO("".join(lines)), fmt)
+        records = ((first_line + reader.line_num - 1, values) for values in reader if values)
+    total = 0
+    for line_number, record in records:
+        total += 1
+        try:
+            if fmt == "jsonl":
+                record = json.loads(record)
+                if not isinstance(record, dict):
+                    raise ValueError("linia nu este un obiect JSON")
+            else:
+                record = dict(zip(header, record))
+            category, difficulty, question, answer, accepted = validate_row(record, defaults)
+        except ValueError as e:  # include json.JSONDecodeError
+            errors += 1
+            if len(samples) < MAX_ERROR_SAMPLES:
+                samples.append((line_number, str(e)))
+            continue
+        rows.append((digest(category, difficulty, question), category, difficulty, question, answer, accepted))
+    return rows, total, errors, samples
+
+
+def detect_format(path, fmt=None):
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext in ("json", "ndjson"):
+        return "jsonl"
+    if ext not in FORMATS:
+        raise ValueError(f"Format necunoscut pentru {path}; folosește --format")
+    return ext
+
+
+def read_chunks(f, fmt, chunk_rows):
+    """Împarte fișierul în bucăți de linii, doar la granițe de înregistrare.
+
+    În CSV un câmp între ghilimele poate conține linii noi; o înregistrare se termină
+    abia când numărul de ghilimele văzute e par. TSV și JSONL au o înregistrare pe linie.
+    """
+    chunk = []
+    first_line = line_number = 1
+    open_quotes = False
+    for line in f:
+        chunk.append(line)
+        line_number += 1
+        if fmt == "csv" and line.count('"') % 2:
+            open_quotes = not open_quotes
+        if len(chunk) >= chunk_rows and not open_quotes:
+            yield first_line, chunk
+            chunk = []
+            first_line = line_number
+    if chunk:
+        yield first_line, chunk
+
+
+def read_header(f, fmt):
+    if fmt == "jsonl":
+        return None
+    line = f.readline()
+    header = [name.strip().lower() for name in next(csv_reader([line], fmt), [])]
+    missing = {"question", "answer"} - set(header)
+    if missing:
+        raise ValueError(f"Antetul nu conține coloanele: {', '.join(sorted(missing))}")
+    return header
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.kept = 0
+        self.errors = []
+        self.buckets = {}
+        self.near_duplicates = None
+
+    def summary(self, elapsed):
+        lines = [f"{self.rows} rânduri citite în {elapsed:.1f} s ({self.rows / elapsed if elapsed else 0:,.0f} rânduri/s)",
+                 f"  importate: {self.imported}, duplicate: {self.duplicates}, invalide: {self.invalid}, "
+                 f"păstrate din banca existentă: {self.kept}"]
+        for (category, difficulty), count in sorted(self.buckets.items()):
+            lines.append(f"  {category}/{difficulty}: {count} întrebări")
+        for source, line_number, message in self.errors:
+            lines.append(f"  eroare {source}:{line_number}: {message}")
+        if self.near_duplicates is not None:
+            lines.append(self.near_duplicates.summary())
+        return "\n".join(lines)
+
+
+def copy_existing(path, writer, seen, report):
+    """Copiază banca existentă în cea nouă și îi înregistrează întrebările în indexul de duplicate."""
+    bank = QuestionBank.open_if_exists(path)
+    if bank is None:
+        return
+    try:
+        for (category, difficulty), bucket in bank.buckets.items():
+            for index in range(len(bucket)):
+                question, answer, accepted = bank.read_record(bucket.record_offset(index))
+                if seen.add(digest(category, difficulty, question)):
+                    writer.add(category, difficulty, question, answer, accepted)
+                    report.kept += 1
+                    report.buckets[(category, difficulty)] = report.buckets.get((category, difficulty), 0) + 1
+    finally:
+        bank.close()
+
+
+def import_questions(sources, path=DEFAULT_BANK_FILE, fmt=None, defaults=None, workers=None,
+                     chunk_rows=DEFAULT_CHUNK_ROWS, replace=False, near_duplicates=False):
+    """Importă fișierele date în banca path; întoarce un ImportReport."""
+    defaults = {"category": "general", "difficulty": "mediu", **(defaults or {})}
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    report = ImportReport()
+    seen = DigestSet()
+
+    def consume(future, source):
+        rows, total, errors, samples = future.result()
+        report.rows += total
+        report.invalid += errors
+        for line_number, message in samples:
+            if len(report.errors) < MAX_ERROR_SAMPLES:
+                report.errors.append((source, line_number, message))
+        for key, category, difficulty, question, answer, accepted in rows:
+            if not seen.add(key):
+                report.duplicates += 1
+                continue
+            writer.add(category, difficulty, question, answer, accepted)
+            report.imported += 1
+            report.buckets[(category, difficulty)] = report.buckets.get((category, difficulty), 0) + 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        with QuestionBankWriter(path) as writer:
+            if not replace:
+                copy_existing(path, writer, seen, report)
+            for source in sources:
+                source_format = detect_format(source, fmt)
+                logger.info(f"Import din {source} ({source_format}, {workers} procese)")
+                in_flight = deque()
+                with open(source, "r", encoding="utf-8-sig", newline="") as f:
+                    header = read_header(f, source_format)
+                    # Antetul ocupă prima linie, deci numerotarea datelor începe de la 2
+                    offset = 0 if header is None else 1
+                    for first_line, lines in read_chunks(f, source_format, chunk_rows):
+                        in_flight.append(pool.submit(parse_chunk, source_format, header,
+                                                     first_line + offset, lines, defaults))
+                        # Cel mult max_in_flight bucăți în lucru: memoria nu crește cu fișierul
+                        if len(in_flight) >= max_in_flight:
+                            consume(in_flight.popleft(), source)
+                    while in_flight:
+                        consume(in_flight.popleft(), source)
+        logger.info(f"Import terminat: {report.imported} întrebări noi, {report.duplicates} duplicate, "
+                    f"{report.invalid} invalide")
+        if near_duplicates:
+            clusters_file = os.path.join(os.path.dirname(os.path.abspath(path)), DEFAULT_CLUSTERS_FILE)
+            report.near_duplicates = find_near_duplicates([path], clusters_file, pool)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importă întrebări din CSV/TSV/JSONL într-o bancă de întrebări.")
+    parser.add_argument("sources", nargs="+", help="fișiere de importat")
+    parser.add_argument("-o", "--output", default=DEFAULT_BANK_FILE, help="banca de întrebări (implicit questions.qbank)")
+    parser.add_argument("--format", choices=FORMATS, help="formatul intrării (implicit după extensie)")
+    parser.add_argument("--category", default="general", help="categoria rândurilor fără categorie")
+    parser.add_argument("--difficulty", default="mediu", help="dificultatea rândurilor fără dificultate")
+    parser.add_argument("--workers", type=int, help="numărul de procese (implicit toate nucleele)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rânduri per bucată")
+    parser.add_argument("--replace", action="store_true", help="nu păstra întrebările din banca existentă")
+    parser.add_argument("--near-duplicates", action="store_true",
+                        help="calculează și grupurile de reformulări după import")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    start = time.perf_counter()
+    try:
+        report = import_questions(args.sources, args.output, args.format,
+                                  {"category": args.category, "difficulty": args.difficulty},
+                                  args.workers, args.chunk_rows, args.replace, args.near_duplicates)
+    except (OSError, ValueError, csv.Error, QuestionBankError) as e:
+        print(f"Importul a eșuat: {e}")
+        return 1
+    print(report.summary(time.perf_counter() - start))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Extragere de întrebări fără înlocuire pentru rundele cu timp, cu lotul următor pregătit în fundal."""
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionScheduler:
+    """Parcurge banca într-o permutare aleatoare, generată leneș (Fisher–Yates parțial).
+
+    Memoria folosită e proporțională cu numărul de întrebări extrase, nu cu mărimea băncii.
+    Nicio întrebare nu se repetă până nu au fost servite toate; apoi începe o permutare nouă.
+    Cu clusters (un question_clusters.ClusterMap), dintr-un grup de reformulări se servește doar
+    prima întrebare extrasă în permutarea curentă.
+
+    Întrebările servite pe altă cale (recapitulările) se marchează cu exclude(), iar cele extrase
+    dar nefolosite se întorc cu give_back(); ambele păstrează garanția de mai sus.
+    """
+
+    def __init__(self, questions, batch_size=200, executor=None, clusters=None):
+        self.questions = questions
+        self.batch_size = batch_size
+        self.executor = executor
+        self.clusters = clusters
+        self._served_clusters = set()
+        self._excluded = set()
+        self._returned = []
+        self._swaps = {}
+        self._drawn = 0
+        self._next = None
+
+    def remaining(self):
+        return len(self.questions) - self._drawn
+
+    def exclude(self, questions):
+        """Marchează întrebările (și grupurile lor) ca servite în permutarea curentă."""
+        for question in questions:
+            self._excluded.add(question.index)
+            if self.clusters is not None:
+                cluster = self.clusters.cluster_of(question)
+                if cluster is not None:
+                    self._served_clusters.add(cluster)
+
+    def give_back(self, questions):
+        """Întrebări extrase dar neservite; vor fi primele în loturile următoare."""
+        self._returned.extend(questions)
+
+    def _draw_batch(self):
+        if self.remaining() == 0 and not self._returned:
+            self._swaps = {}
+            self._drawn = 0
+            self._served_clusters = set()
+            self._excluded = set()
+            logger.info("Toate întrebările au fost servite, se începe o permutare nouă")
+        total = len(self.questions)
+        swaps = self._swaps
+        batch = self._returned[:self.batch_size]
+        del self._returned[:self.batch_size]
+        excluded = self._excluded
+        i = self._drawn
+        while i < total and len(batch) < self.batch_size:
+            j = random.randrange(i, total)
+            current = swaps.pop(i, i)
+            if j == i:
+                chosen = current
+            else:
+                chosen = swaps.get(j, j)
+                swaps[j] = current
+            i += 1
+            if chosen in excluded:
+                excluded.discard(chosen)
+                continue
+            question = self.questions[chosen]
+            if self.clusters is not None:
+                cluster = self.clusters.cluster_of(question)
+                if cluster is not None:
+                    if cluster in self._served_clusters:
+                        continue
+                    self._served_clusters.add(cluster)
+            batch.append(question)
+        self._drawn = i
+        if not batch and total:
+            # Restul permutării conținea doar reformulări deja servite
+            return self._draw_batch()
+        return batch
+
+    def next_batch(self):
+        """Întoarce lotul pregătit în fundal, dacă există; altfel îl extrage pe loc."""
+        if self._next is not None:
+            future, self._next = self._next, None
+            batch = future.result()
+        else:
+            batch = self._draw_batch()
+        logger.debug(f"Lot de {len(batch)} întrebări servit, {self.remaining()} rămase")
+        return batch
+
+    def prefetch(self):
+        if self._next is None and self.executor is not None:
+            self._next = self.executor.submit(self._draw_batch)
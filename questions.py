@@ -0,0 +1,166 @@
+"""Reprezentare compactă a întrebărilor: coloane în array-uri în loc de un dict per întrebare.
+
+Un răspuns poate avea variante acceptate, separate prin "|": "Leonardo da Vinci|da Vinci".
+Prima variantă e cea afișată; toate sunt normalizate o singură dată, la încărcare.
+"""
+import unicodedata
+from array import array
+from collections.abc import Sequence
+
+FIELDS = ("question", "answer", "category", "difficulty", "normalized", "accepted")
+ALIAS_SEPARATOR = "|"
+
+
+def normalize_text(text):
+    text = text.lower()
+    text = ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
+    return text
+
+
+def parse_answer(raw_answer):
+    """Întoarce (răspunsul afișat, formele normalizate acceptate unite prin "|")."""
+    variants = [part.strip() for part in raw_answer.split(ALIAS_SEPARATOR)]
+    variants = [variant for variant in variants if variant] or [raw_answer.strip()]
+    accepted = []
+    for variant in variants:
+        normalized = normalize_text(variant)
+        if normalized not in accepted:
+            accepted.append(normalized)
+    return variants[0], ALIAS_SEPARATOR.join(accepted)
+
+
+def accepted_field(accepted_text, field):
+    if field == "normalized":
+        return accepted_text.split(ALIAS_SEPARATOR, 1)[0]
+    return frozenset(accepted_text.split(ALIAS_SEPARATOR))
+
+# Categoriile și dificultățile sunt puține, așa că fiecare etichetă e stocată o singură dată
+_labels = []
+_label_codes = {}
+
+
+def intern_label(text):
+    code = _label_codes.get(text)
+    if code is None:
+        code = len(_labels)
+        if code > 0xFF:
+            raise ValueError("Prea multe categorii/dificultăți distincte")
+        _labels.append(text)
+        _label_codes[text] = code
+    return code
+
+
+def label(code):
+    return _labels[code]
+
+
+class Question:
+    """Vedere ușoară asupra unei întrebări; câmpurile se citesc din sursă doar la acces.
+
+    Suportă accesul de tip dict folosit de interfață: q["question"], q["answer"] etc.
+    Setul formelor acceptate se construiește la prima verificare și rămâne pe vedere,
+    deci răspunsurile repetate la aceeași întrebare servită nu îl mai refac.
+    """
+    __slots__ = ("source", "index", "_accepted")
+
+    def __init__(self, source, index):
+        self.source = source
+        self.index = index
+        self._accepted = None
+
+    def __getitem__(self, field):
+        if field == "accepted":
+            if self._accepted is None:
+                self._accepted = self.source.field(self.index, field)
+            return self._accepted
+        return self.source.field(self.index, field)
+
+    def get(self, field, default=None):
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return FIELDS
+
+    def __eq__(self, other):
+        if not isinstance(other, Question):
+            return NotImplemented
+        return self.source is other.source and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.source), self.index))
+
+    def __repr__(self):
+        return f"Question({self['question']!r}, {self['answer']!r}, {self['category']!r}, {self['difficulty']!r})"
+
+
+class StringTable:
+    """Texte concatenate într-un singur buffer UTF-8, adresate prin offseturi."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("Q", [0])
+
+    def add(self, text):
+        self.data += text.encode("utf-8")
+        self.offsets.append(len(self.data))
+        return len(self.offsets) - 2
+
+    def get(self, string_id):
+        return self.data[self.offsets[string_id]:self.offsets[string_id + 1]].decode("utf-8")
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class QuestionTable(Sequence):
+    """Întrebări ținute în coloane: textele în tabele de șiruri, etichetele ca coduri de un octet."""
+
+    def __init__(self):
+        self.questions = StringTable()
+        self.answers = StringTable()
+        self.accepted = StringTable()
+        self.category_codes = array("B")
+        self.difficulty_codes = array("B")
+
+    @classmethod
+    def from_pairs(cls, pairs, category, difficulty):
+        table = cls()
+        for question, answer in pairs:
+            table.append(question, answer, category, difficulty)
+        return table
+
+    def append(self, question, answer, category, difficulty):
+        answer, accepted = parse_answer(answer)
+        self.questions.add(question)
+        self.answers.add(answer)
+        self.accepted.add(accepted)
+        self.category_codes.append(intern_label(category))
+        self.difficulty_codes.append(intern_label(difficulty))
+
+    def field(self, index, field):
+        if field == "question":
+            return self.questions.get(index)
+        if field == "answer":
+            return self.answers.get(index)
+        if field == "category":
+            return _labels[self.category_codes[index]]
+        if field == "difficulty":
+            return _labels[self.difficulty_codes[index]]
+        if field in ("normalized", "accepted"):
+            return accepted_field(self.accepted.get(index), field)
+        raise KeyError(field)
+
+    def __len__(self):
+        return len(self.category_codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Question(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index întrebare în afara intervalului")
+        return Question(self, index)
@@ -1,71 +1,74 @@
 import os
-import random
 import json
-import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
 import time
-import hashlib
-import unicodedata
 import logging
 import platform
-import numpy as np
-import pygame
-from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
+from background import BackgroundRenderer
+from sound_assets import SoundBank
+from question_bank import QuestionBank, DEFAULT_BANK_FILE, iter_text_file
+from question_clusters import ClusterMap, DEFAULT_CLUSTERS_FILE
+from questions import QuestionTable
+from highscore_store import HighscoreStore
+from player_stats import PlayerStats
+from user_store import UserStore, UserRecord
+from log_setup import setup_logging
+from instrumentation import Instrumentation, TimedDialogs, screen
+from auth import hash_password, verify_password
+from spaced_repetition import ReviewQueue
+from storage import StorageLockedError, WriterLock
+from quiz_engine import QuizEngine, Profile, DEFERRED, REVIEW
+
+ui_log = logging.getLogger("quiz.ui")
+game_log = logging.getLogger("quiz.game")
+data_log = logging.getLogger("quiz.data")
+auth_log = logging.getLogger("quiz.auth")
+sound_log = logging.getLogger("quiz.sound")
 
 class QuizGame:
     def __init__(self, root):
-        logging.basicConfig(
-            filename="quiz_game.log",
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s"
-        )
-        logging.info("Joc inițializat")
+        # Scrierea în fișier se face pe firul QueueListener, nu pe bucla Tk
+        self.log_listener = setup_logging()
+        game_log.info("Joc inițializat")
+        init_start = time.perf_counter()
+        self.startup_timings = {}
 
         self.root = root
         self.root.title("Quiz Game")
         self.root.geometry("800x600")
         self.root.resizable(True, True)
+        # Timpii ecranelor și ai tastelor; raportul se deschide cu F12
+        self.instrumentation = Instrumentation(self.root)
+        # Cât timp un dialog e deschis, tasta sau ecranul măsurat nu acumulează timp
+        self.messagebox = TimedDialogs(self.instrumentation, messagebox)
+        self.perf_report_file = None
+        self.root.bind("<F12>", self.show_perf_report)
 
         # Setează imaginea ca fundal cu fallback
         self.bg_label = None
-        try:
-            self.bg_image = Image.open("back.jpg")
-            self.bg_image = self.bg_image.resize((800, 600), Image.Resampling.LANCZOS)
-            self.bg_photo = ImageTk.PhotoImage(self.bg_image)
-            self.bg_label = tk.Label(self.root, image=self.bg_photo)
+        self.background = None
+        if os.path.exists("back.jpg"):
+            # Imaginea e decodată abia la prima redare, după ce apare ecranul de login
+            self.bg_label = tk.Label(self.root, bg="#F5F5F5")
+            self.background = BackgroundRenderer(self.root, self.bg_label, "back.jpg", on_error=self.background_failed)
             self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-            logging.info("Fundalul imaginii setat cu succes")
-        except FileNotFoundError as e:
-            logging.error(f"Fișierul back.jpg nu a fost găsit: {e}")
-            self.root.configure(bg="#F5F5F5")  # Culoare fallback crem deschis
-            messagebox.showerror("Eroare", "Fișierul back.jpg nu a fost găsit. Verifică calea!")
-            self.bg_label = None
-        except Exception as e:
-            logging.error(f"Eroare la încărcarea imaginii de fundal: {e}")
+            ui_log.info("Fundalul imaginii setat cu succes")
+        else:
+            ui_log.error("Fișierul back.jpg nu a fost găsit")
             self.root.configure(bg="#F5F5F5")  # Culoare fallback crem deschis
-            messagebox.showwarning("Atenție", f"Imaginea de fundal nu a putut fi încărcată: {e}")
-            self.bg_label = None
+            self.messagebox.showerror("Eroare", "Fișierul back.jpg nu a fost găsit. Verifică calea!")
 
         # Adaugă gestionarea redimensionării ferestrei
         self.root.bind("<Configure>", self.resize_background)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        try:
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            self.correct_sound = self.generate_correct_sound()
-            self.incorrect_sound = self.generate_incorrect_sound()
-            self.hint_sound = self.generate_hint_sound()
-            self.game_over_sound = self.generate_game_over_sound()
-            logging.info("Sunete inițializate cu succes")
-        except Exception as e:
-            logging.error(f"Eroare la inițializarea sunetelor: {e}")
-            self.correct_sound = None
-            self.incorrect_sound = None
-            self.hint_sound = None
-            self.game_over_sound = None
-            messagebox.showwarning("Atenție", f"Sunetele nu au putut fi inițializate: {e}")
+        # Mixerul și sunetele se încarcă în fundal; ecranul de login nu le așteaptă
+        self.sound_bank = SoundBank()
+        self.sound_bank.start()
+        self.root.after(200, self.check_sound_bank)
 
         self.colors = {
             "primary": "#94A3B8",      # Albastru-gri pastel pentru elemente principale
@@ -114,204 +117,206 @@ class QuizGame:
         }
         self.difficulties = ["ușor", "mediu", "greu"]
         self.questions = {}
-        self.current_questions = []
-        self.deferred_questions = []
-        self.score = 0
-        self.current_question_index = 0
         self.total_questions = 10
         self.difficulty = "mediu"
         self.category = "general"
         self.player_name = ""
-        self.hints_used = 0
-        self.max_hints = 3
-        self.hint_indices = []
-        self.start_time = 0
-        self.end_time = 0
         self.highscores_file = "highscores.json"
+        self.player_stats_file = "player_stats.json"
+        self.review_queue_file = "review_queue.json"
         self.users_file = "users.json"
+        self.users_flush_id = None
+        self.users_flush_delay = 1000
         self.last_login_file = "last_login.json"
-        self.incorrect_answers = []
-        self.is_fast_quiz = False
-        self.fast_quiz_duration = 300
-        self.time_left = 0
+        self.question_bank_file = DEFAULT_BANK_FILE
+        self.question_clusters_file = DEFAULT_CLUSTERS_FILE
+        self.fast_quiz_duration = None
         self.timer_id = None
         self.status_label = None
         self.answer_label = None
         self.player_label = None
+        self.question_widgets = None
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="quiz-worker")
+        self.poll_interval = 30
+        self.loading_key = None
+        self.loading_progress = ""
+        self.auth_pending = False
+        # Regulile și starea sesiunii; interfața doar afișează rezultatele motorului
+        self.review_queue = ReviewQueue(self.review_queue_file)
+        self.engine = QuizEngine(executor=self.executor, review_queue=self.review_queue)
         self.menu_buttons = []
         self.selected_menu_index = 0
         self.login_elements = []
         self.selected_login_index = 0
-        self.level = 1
-        self.experience = 0
-        self.level_threshold = 100
 
         if not os.path.exists("categories"):
             try:
                 os.makedirs("categories")
-                logging.info("Director 'categories' creat")
+                data_log.info("Director 'categories' creat")
             except Exception as e:
-                logging.error(f"Eroare la crearea directorului 'categories': {e}")
-                messagebox.showerror("Eroare", f"Nu s-a putut crea directorul 'categories': {e}")
+                data_log.error(f"Eroare la crearea directorului 'categories': {e}")
+                self.messagebox.showerror("Eroare", f"Nu s-a putut crea directorul 'categories': {e}")
+
+        # Conturile și scorurile au un singur proces care scrie (alt joc sau quiz_server.py)
+        self.writer_lock = WriterLock()
+        try:
+            self.writer_lock.acquire()
+        except StorageLockedError as e:
+            data_log.error(str(e))
+            self.messagebox.showerror("Eroare", f"{e}. Jocul este deja deschis sau serverul rulează.")
+            raise SystemExit(1)
+
+        self.question_bank = QuestionBank.open_if_exists(self.question_bank_file)
+        self.engine.clusters = ClusterMap.load_if_exists(self.question_clusters_file)
 
         self.load_users()
         self.load_highscores()
+        self.load_review_queue()
+        login_start = time.perf_counter()
+        self.startup_timings["asset_loading"] = login_start - init_start
         self.create_login_screen()
+        self.startup_timings["create_login_screen"] = time.perf_counter() - login_start
+        if self.background:
+            self.root.after_idle(self.background.request_render, (800, 600))
+        self.instrumentation.start_lag_sampler()
+
+    def background_failed(self, error):
+        ui_log.error(f"Eroare la încărcarea imaginii de fundal: {error}")
+        self.root.configure(bg=self.colors["background"])
+        if self.bg_label:
+            self.bg_label.destroy()
+        self.bg_label = None
+        self.messagebox.showwarning("Atenție", f"Imaginea de fundal nu a putut fi încărcată: {error}")
 
     def resize_background(self, event=None):
         """Redimensionează imaginea de fundal în funcție de dimensiunea ferestrei."""
-        if self.bg_label and self.bg_image:
-            new_width = self.root.winfo_width()
-            new_height = self.root.winfo_height()
+        if self.bg_label and self.background:
             try:
-                resized_image = self.bg_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                self.bg_photo = ImageTk.PhotoImage(resized_image)
-                self.bg_label.configure(image=self.bg_photo)
-                self.bg_label.image = self.bg_photo
-                self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-                logging.debug("Imagine de fundal redimensionată")
+                self.background.on_configure(event)
             except Exception as e:
-                logging.error(f"Eroare la redimensionarea imaginii de fundal: {e}")
+                ui_log.error(f"Eroare la redimensionarea imaginii de fundal: {e}")
                 self.root.configure(bg=self.colors["background"])
 
     def on_closing(self):
-        if messagebox.askokcancel("Ieșire", "Vrei să închizi jocul?"):
+        if self.messagebox.askokcancel("Ieșire", "Vrei să închizi jocul?"):
             try:
-                pygame.mixer.quit()
+                self.instrumentation.stop()
+                if self.perf_report_file:
+                    self.instrumentation.export(self.perf_report_file)
+                    ui_log.info(f"Raport de performanță salvat în {self.perf_report_file}")
+                self.sound_bank.shutdown()
+                if self.background:
+                    self.background.shutdown()
                 self.save_users()
+                self.flush_users()
+                self.save_review_queue()
+                self.writer_lock.release()
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                if self.question_bank:
+                    self.question_bank.close()
                 self.root.quit()
                 self.root.destroy()
-                logging.info("Joc închis de utilizator")
+                ui_log.info("Joc închis de utilizator")
             except Exception as e:
-                logging.error(f"Eroare la închiderea jocului: {e}")
-
-    def generate_correct_sound(self):
-        sample_rate = 44100
-        duration = 0.5
-        freq = 1000
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        sound_data = 0.5 * np.sin(2 * np.pi * freq * t)
-        sound_data = np.column_stack((sound_data, sound_data))
-        sound_data = (sound_data * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(sound_data)
-        return sound
-
-    def generate_incorrect_sound(self):
-        sample_rate = 44100
-        duration = 0.5
-        freq = 200
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        sound_data = 0.5 * np.sin(2 * np.pi * freq * t)
-        sound_data = np.column_stack((sound_data, sound_data))
-        sound_data = (sound_data * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(sound_data)
-        return sound
-
-    def generate_hint_sound(self):
-        sample_rate = 44100
-        duration = 0.1
-        freq = 800
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        sound_data = 0.3 * np.sin(2 * np.pi * freq * t)
-        sound_data = np.column_stack((sound_data, sound_data))
-        sound_data = (sound_data * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(sound_data)
-        return sound
-
-    def generate_game_over_sound(self):
-        sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        sound_data = (0.4 * np.sin(2 * np.pi * 600 * t) +
-                      0.3 * np.sin(2 * np.pi * 800 * t) +
-                      0.2 * np.sin(2 * np.pi * 1000 * t))
-        sound_data = np.column_stack((sound_data, sound_data))
-        sound_data = (sound_data * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(sound_data)
-        return sound
-
-    def play_sound(self, sound):
+                ui_log.error(f"Eroare la închiderea jocului: {e}")
+
+    def bind_key(self, sequence, handler):
+        """Leagă o tastă la fereastră, măsurând timpul până la desenarea ecranului următor."""
+        self.root.bind(sequence, self.instrumentation.wrap_handler(sequence.strip("<>"), handler))
+
+    def show_perf_report(self, event=None):
+        window = tk.Toplevel(self.root)
+        window.title("Performance Report")
+        window.geometry("700x500")
+        text = tk.Text(window, font=('Courier', 10), bg=self.colors["background"], fg=self.colors["text"], wrap="none")
+        text.insert("1.0", self.instrumentation.report())
+        text.config(state="disabled")
+        text.pack(fill="both", expand=True)
+        ui_log.info("Raport de performanță afișat")
+
+    def check_sound_bank(self):
+        if not self.sound_bank.ready.is_set():
+            self.root.after(200, self.check_sound_bank)
+        elif self.sound_bank.error:
+            self.messagebox.showwarning("Atenție", f"Sunetele nu au putut fi inițializate: {self.sound_bank.error}")
+
+    def play_sound(self, name):
+        sound = self.sound_bank.get(name)
         if sound:
             try:
                 sound.play()
-                logging.info("Sunet redat")
+                sound_log.debug("Sunet redat")
             except Exception as e:
-                logging.error(f"Eroare la redarea sunetului: {e}")
+                sound_log.error(f"Eroare la redarea sunetului: {e}")
 
     def load_users(self):
-        if os.path.exists(self.users_file):
-            try:
-                with open(self.users_file, "r", encoding="utf-8") as f:
-                    self.users = json.load(f)
-                if self.player_name and self.player_name in self.users:
-                    user_data = self.users[self.player_name]
-                    self.level = user_data.get("level", 1)
-                    self.experience = user_data.get("experience", 0)
-                    self.max_hints = user_data.get("max_hints", 3)
-                logging.info("Utilizatori încărcați cu succes")
-            except Exception as e:
-                logging.error(f"Eroare la încărcarea utilizatorilor: {e}")
-                self.users = {}
-                if self.status_label:
-                    self.status_label.config(text="Eroare la încărcarea utilizatorilor!", fg=self.colors["error"])
-                else:
-                    messagebox.showerror("Eroare", f"Nu s-au putut încărca utilizatorii: {e}")
-        else:
-            self.users = {}
-            logging.info("Fișierul users.json nu există, inițializat cu dicționar gol")
+        self.users = UserStore(self.users_file)
+        try:
+            self.users.load()
+            if self.users.dirty:
+                # Conturile migrate din formatul vechi se scriu imediat
+                self.flush_users()
+            if self.player_name and self.player_name in self.users:
+                self.engine.profile = Profile.from_record(self.users[self.player_name])
+            data_log.info("Utilizatori încărcați cu succes")
+        except Exception as e:
+            data_log.error(f"Eroare la încărcarea utilizatorilor: {e}")
+            self.users = UserStore(self.users_file)
+            if self.status_label:
+                self.status_label.config(text="Eroare la încărcarea utilizatorilor!", fg=self.colors["error"])
+            else:
+                self.messagebox.showerror("Eroare", f"Nu s-au putut încărca utilizatorii: {e}")
 
     def save_users(self):
+        """Marchează profilul curent ca modificat; scrierea pe disc se face grupat, în flush_users."""
+        if self.player_name in self.users:
+            self.users.save_progress(self.player_name, self.engine.profile)
+        if self.users_flush_id is None:
+            self.users_flush_id = self.root.after(self.users_flush_delay, self.flush_users)
+
+    def flush_users(self):
+        if self.users_flush_id is not None:
+            self.root.after_cancel(self.users_flush_id)
+            self.users_flush_id = None
         try:
-            if self.player_name:
-                self.users[self.player_name] = {
-                    "password": self.users.get(self.player_name, {}).get("password", ""),
-                    "level": self.level,
-                    "experience": self.experience,
-                    "max_hints": self.max_hints
-                }
-            with open(self.users_file, "w", encoding="utf-8") as f:
-                json.dump(self.users, f, indent=4, ensure_ascii=False)
-            logging.info(f"Utilizatori salvați: {self.player_name}")
+            count = self.users.flush()
+            if count:
+                data_log.info(f"Utilizatori salvați: {count} conturi modificate")
         except Exception as e:
-            logging.error(f"Eroare la salvarea utilizatorilor: {e}")
+            data_log.error(f"Eroare la salvarea utilizatorilor: {e}")
             if self.status_label:
                 self.status_label.config(text="Eroare la salvarea utilizatorilor!", fg=self.colors["error"])
             else:
-                messagebox.showerror("Eroare", f"Nu s-a putut salva users.json: {e}")
+                self.messagebox.showerror("Eroare", f"Nu s-a putut salva users.json: {e}")
 
     def load_last_login(self):
         if os.path.exists(self.last_login_file):
             try:
                 with open(self.last_login_file, "r", encoding="utf-8") as f:
                     last_login = json.load(f).get("username", "")
-                logging.info(f"Ultimul login încărcat: {last_login}")
+                auth_log.info(f"Ultimul login încărcat: {last_login}")
                 return last_login
             except Exception as e:
-                logging.error(f"Eroare la încărcarea ultimului login: {e}")
+                auth_log.error(f"Eroare la încărcarea ultimului login: {e}")
                 if self.status_label:
                     self.status_label.config(text="Eroare la încărcarea ultimului login!", fg=self.colors["error"])
                 else:
-                    messagebox.showerror("Eroare", f"Nu s-a putut încărca last_login.json: {e}")
+                    self.messagebox.showerror("Eroare", f"Nu s-a putut încărca last_login.json: {e}")
                 return ""
-        logging.info("Fișierul last_login.json nu există")
+        auth_log.info("Fișierul last_login.json nu există")
         return ""
 
     def save_last_login(self, username):
         try:
             with open(self.last_login_file, "w", encoding="utf-8") as f:
                 json.dump({"username": username}, f, indent=4, ensure_ascii=False)
-            logging.info(f"Ultimul login salvat: {username}")
+            auth_log.info(f"Ultimul login salvat: {username}")
         except Exception as e:
-            logging.error(f"Eroare la salvarea ultimului login: {e}")
+            auth_log.error(f"Eroare la salvarea ultimului login: {e}")
             if self.status_label:
                 self.status_label.config(text="Eroare la salvarea ultimului login!", fg=self.colors["error"])
             else:
-                messagebox.showerror("Eroare", f"Nu s-a putut salva last_login.json: {e}")
-
-    def hash_password(self, password):
-        hashed = hashlib.sha256(password.encode()).hexdigest()
-        logging.info("Parolă hash-uită")
-        return hashed
+                self.messagebox.showerror("Eroare", f"Nu s-a putut salva last_login.json: {e}")
 
     def update_login_selection(self):
         for i, element in enumerate(self.login_elements):
@@ -327,6 +332,7 @@ class QuizGame:
                 else:
                     element.config(bg=self.colors["secondary"], relief="raised")
 
+    @screen("login")
     def create_login_screen(self):
         self.clear_frame()
         if self.bg_label:
@@ -410,262 +416,311 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info("Ecran de login creat")
+        self.bind_key('<Return>', select_option)
+        ui_log.info("Ecran de login creat")
 
     def login(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
         if not username or not password:
             self.status_label.config(text="Completează toate câmpurile!")
-            logging.warning("Încercare de login cu câmpuri goale")
+            auth_log.warning("Încercare de login cu câmpuri goale")
             return
-        hashed_password = self.hash_password(password)
-        if username in self.users and self.users[username]["password"] == hashed_password:
-            self.player_name = username
-            self.level = self.users[username].get("level", 1)
-            self.experience = self.users[username].get("experience", 0)
-            self.max_hints = self.users[username].get("max_hints", 3)
-            if self.remember_var.get():
-                self.save_last_login(username)
-            else:
-                self.save_last_login("")
-            self.create_main_menu()
-            logging.info(f"Login reușit pentru utilizator: {username}")
-        else:
+        if self.auth_pending:
+            return
+        if username not in self.users:
             self.status_label.config(text="Nume utilizator sau parolă incorecte!")
-            logging.warning(f"Login eșuat pentru utilizator: {username}")
+            auth_log.warning(f"Login eșuat pentru utilizator: {username}")
+            return
+        # Verificarea scrypt durează; rulează pe firul de lucru ca ecranul să rămână activ
+        self.auth_pending = True
+        self.status_label.config(text="Se verifică...", fg=self.colors["text"])
+        stored_hash = self.users[username].password
+        self.run_in_background(verify_password, lambda future: self.finish_login(username, future), password, stored_hash)
+
+    def finish_login(self, username, future):
+        self.auth_pending = False
+        try:
+            matches, new_hash = future.result()
+        except Exception as e:
+            auth_log.error(f"Eroare la verificarea parolei: {e}")
+            matches, new_hash = False, None
+        if self.status_label is None:
+            return  # ecranul de login a fost închis între timp
+        if not matches:
+            self.status_label.config(text="Nume utilizator sau parolă incorecte!", fg=self.colors["error"])
+            auth_log.warning(f"Login eșuat pentru utilizator: {username}")
+            return
+        self.player_name = username
+        self.engine.profile = Profile.from_record(self.users[username])
+        self.engine.player_name = username
+        if new_hash:
+            # Hash vechi (SHA-256 sau alt cost) înlocuit transparent cu cel curent
+            self.users.set_password(username, new_hash)
+            self.save_users()
+            auth_log.info(f"Parola utilizatorului {username} a fost rehash-uită")
+        if self.remember_var.get():
+            self.save_last_login(username)
+        else:
+            self.save_last_login("")
+        self.create_main_menu()
+        auth_log.info(f"Login reușit pentru utilizator: {username}")
 
     def register(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
         if not username or not password:
             self.status_label.config(text="Completează toate câmpurile!")
-            logging.warning("Încercare de înregistrare cu câmpuri goale")
+            auth_log.warning("Încercare de înregistrare cu câmpuri goale")
+            return
+        if self.auth_pending:
             return
         if username in self.users:
             self.status_label.config(text="Numele de utilizator există deja!")
-            logging.warning(f"Încercare de înregistrare cu utilizator existent: {username}")
+            auth_log.warning(f"Încercare de înregistrare cu utilizator existent: {username}")
             return
-        self.users[username] = {
-            "password": self.hash_password(password),
-            "level": 1,
-            "experience": 0,
-            "max_hints": 3
-        }
+        self.auth_pending = True
+        self.status_label.config(text="Se creează contul...", fg=self.colors["text"])
+        self.run_in_background(hash_password, lambda future: self.finish_register(username, future), password)
+
+    def finish_register(self, username, future):
+        self.auth_pending = False
+        try:
+            hashed = future.result()
+        except Exception as e:
+            auth_log.error(f"Eroare la hash-uirea parolei: {e}")
+            if self.status_label:
+                self.status_label.config(text="Eroare la crearea contului!", fg=self.colors["error"])
+            return
+        if username in self.users:
+            if self.status_label:
+                self.status_label.config(text="Numele de utilizator există deja!")
+            return
+        self.users[username] = UserRecord(username, hashed)
         self.save_users()
-        self.status_label.config(text="Cont creat cu succes! Conectează-te acum.", fg=self.colors["success"])
-        logging.info(f"Utilizator înregistrat: {username}")
+        if self.status_label:
+            self.status_label.config(text="Cont creat cu succes! Conectează-te acum.", fg=self.colors["success"])
+        auth_log.info(f"Utilizator înregistrat: {username}")
 
     def load_highscores(self):
-        if os.path.exists(self.highscores_file):
-            try:
-                with open(self.highscores_file, "r", encoding="utf-8") as f:
-                    self.highscores = json.load(f)
-                logging.info(f"Scoruri încărcate: {len(self.highscores)} intrări")
-            except Exception as e:
-                logging.error(f"Eroare la încărcarea scorurilor: {e}")
-                self.highscores = []
-                if self.status_label:
-                    self.status_label.config(text="Eroare la încărcarea scorurilor!", fg=self.colors["error"])
-                else:
-                    messagebox.showerror("Eroare", f"Nu s-au putut încărca scorurile: {e}")
-        else:
-            self.highscores = []
-            logging.info("Fișierul highscores.json nu există, inițializat cu listă goală")
+        self.highscores = HighscoreStore(self.highscores_file)
+        self.player_stats = PlayerStats(self.player_stats_file)
+        try:
+            self.highscores.load()
+            self.player_stats.load(self.highscores)
+        except Exception as e:
+            data_log.error(f"Eroare la încărcarea scorurilor: {e}")
+            self.highscores = HighscoreStore(self.highscores_file)
+            self.player_stats = PlayerStats(self.player_stats_file)
+            if self.status_label:
+                self.status_label.config(text="Eroare la încărcarea scorurilor!", fg=self.colors["error"])
+            else:
+                self.messagebox.showerror("Eroare", f"Nu s-au putut încărca scorurile: {e}")
+
+    def load_review_queue(self):
+        try:
+            self.review_queue.load()
+        except Exception as e:
+            data_log.error(f"Eroare la încărcarea cozii de recapitulare: {e}")
+            self.review_queue = ReviewQueue(self.review_queue_file)
+            self.engine.review_queue = self.review_queue
+
+    def save_review_queue(self):
+        try:
+            count = self.review_queue.flush()
+            if count:
+                data_log.info(f"Coada de recapitulare salvată: {count} modificări")
+        except Exception as e:
+            data_log.error(f"Eroare la salvarea cozii de recapitulare: {e}")
+            if self.status_label:
+                self.status_label.config(text="Eroare la salvarea recapitulărilor!", fg=self.colors["error"])
+            else:
+                self.messagebox.showerror("Eroare", f"Nu s-a putut salva review_queue.json: {e}")
 
-    def save_highscore(self):
+    def save_highscore(self, summary):
         if not self.player_name:
-            logging.warning("Numele jucătorului lipsește, scorul nu a fost salvat")
+            data_log.warning("Numele jucătorului lipsește, scorul nu a fost salvat")
             return
-        time_taken = self.end_time - self.start_time
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        score_entry = {
-            "name": self.player_name,
-            "score": self.score,
-            "date": current_date,
-            "category": self.category,
-            "difficulty": self.difficulty,
-            "questions": len(self.current_questions) if self.is_fast_quiz else self.total_questions,
-            "time": round(time_taken, 2),
-            "hints_used": self.hints_used
-        }
-        self.highscores.append(score_entry)
-        self.highscores.sort(key=lambda x: (-x["score"], x["time"]))
+        score_entry = self.engine.score_entry(self.player_name, summary)
         try:
-            with open(self.highscores_file, "w", encoding="utf-8") as f:
-                json.dump(self.highscores, f, indent=4, ensure_ascii=False)
-            logging.info(f"Scor salvat: {score_entry}")
+            self.highscores.add(score_entry)
+            self.player_stats.record(score_entry)
+            data_log.info(f"Scor salvat: {score_entry}")
         except Exception as e:
-            logging.error(f"Eroare la salvarea scorurilor: {e}")
+            data_log.error(f"Eroare la salvarea scorurilor: {e}")
             if self.status_label:
                 self.status_label.config(text="Eroare la salvarea scorului!", fg=self.colors["error"])
             else:
-                messagebox.showerror("Eroare", f"Nu s-a putut salva highscores.json: {e}")
-
-    def normalize_text(self, text):
-        text = text.lower()
-        text = ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
-        return text
+                self.messagebox.showerror("Eroare", f"Nu s-a putut salva highscores.json: {e}")
 
-    def load_questions_from_file(self, category, difficulty):
+    def load_questions_from_file(self, category, difficulty, errors):
+        """Rulează pe firul de lucru; erorile sunt adunate în errors și afișate apoi pe firul Tk."""
         file_path = f"categories/{category}_{difficulty}.txt"
-        questions = []
+        questions = QuestionTable()
         if os.path.exists(file_path):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                for i in range(0, len(lines), 2):
-                    if i + 1 < len(lines):
-                        question = lines[i].strip()
-                        answer = lines[i + 1].strip()
-                        if question and answer and len(answer) > 0:
-                            questions.append({"question": question, "answer": answer, "category": category, "difficulty": difficulty})
-                logging.info(f"Încărcate {len(questions)} întrebări din {file_path}")
+                for question, answer in iter_text_file(file_path):
+                    questions.append(question, answer, category, difficulty)
+                data_log.info(f"Încărcate {len(questions)} întrebări din {file_path}")
             except Exception as e:
-                logging.error(f"Eroare la încărcarea întrebărilor din {file_path}: {e}")
-                if self.status_label:
-                    self.status_label.config(text="Eroare la încărcarea întrebărilor!", fg=self.colors["error"])
-                else:
-                    messagebox.showerror("Eroare", f"Nu s-au putut încărca întrebările: {e}")
+                data_log.error(f"Eroare la încărcarea întrebărilor din {file_path}: {e}")
+                errors.append(f"Nu s-au putut încărca întrebările: {e}")
         else:
-            logging.info(f"Fișierul {file_path} nu există")
+            data_log.info(f"Fișierul {file_path} nu există")
         return questions
 
-    def download_questions(self, category, difficulty):
-        if self.status_label:
-            self.status_label.config(text=f"Se încarcă întrebări pentru {self.categories.get(category, category)} ({difficulty})...")
-        self.root.update()
+    def download_questions(self, category, difficulty, errors, progress):
+        progress(f"Se încarcă întrebări pentru {self.categories.get(category, category)} ({difficulty})...")
 
-        questions = []
+        pairs = []
         if category == "general":
             if difficulty == "ușor":
-                questions = [
-                    {"question": "Ce animal este cunoscut pentru dungile sale alb-negru?", "answer": "zebră", "category": "general", "difficulty": "ușor"},
-                    {"question": "Câte zile are luna februarie într-un an normal?", "answer": "28", "category": "general", "difficulty": "ușor"},
-                    {"question": "Ce culoare are cerul într-o zi senină?", "answer": "albastru", "category": "general", "difficulty": "ușor"},
+                pairs = [
+                    ("Ce animal este cunoscut pentru dungile sale alb-negru?", "zebră"),
+                    ("Câte zile are luna februarie într-un an normal?", "28"),
+                    ("Ce culoare are cerul într-o zi senină?", "albastru"),
                 ]
             elif difficulty == "mediu":
-                questions = [
-                    {"question": "Ce limbă se vorbește în Brazilia?", "answer": "portugheză", "category": "general", "difficulty": "mediu"},
-                    {"question": "Cine a fost autorul romanului 'Pe aripile vântului'?", "answer": "Margaret Mitchell", "category": "general", "difficulty": "mediu"},
-                    {"question": "Ce instrument muzical are clape albe și negre?", "answer": "pian", "category": "general", "difficulty": "mediu"},
-                ] + [{"question": f"Întrebare medie generală {i}?", "answer": f"răspuns{i}", "category": "general", "difficulty": "mediu"} for i in range(200)]
+                pairs = [
+                    ("Ce limbă se vorbește în Brazilia?", "portugheză"),
+                    ("Cine a fost autorul romanului 'Pe aripile vântului'?", "Margaret Mitchell"),
+                    ("Ce instrument muzical are clape albe și negre?", "pian"),
+                ] + [(f"Întrebare medie generală {i}?", f"răspuns{i}") for i in range(200)]
             elif difficulty == "greu":
-                questions = [
-                    {"question": "Ce filozof a scris lucrarea 'Critica rațiunii pure'?", "answer": "Immanuel Kant", "category": "general", "difficulty": "greu"},
-                    {"question": "Care este capitala statului Bhutan?", "answer": "Thimphu", "category": "general", "difficulty": "greu"},
-                    {"question": "Ce artist a pictat 'Cina cea de Taină'?", "answer": "Leonardo da Vinci", "category": "general", "difficulty": "greu"},
-                ] + [{"question": f"Întrebare grea generală {i}?", "answer": f"răspuns{i}", "category": "general", "difficulty": "greu"} for i in range(200)]
+                pairs = [
+                    ("Ce filozof a scris lucrarea 'Critica rațiunii pure'?", "Immanuel Kant"),
+                    ("Care este capitala statului Bhutan?", "Thimphu"),
+                    ("Ce artist a pictat 'Cina cea de Taină'?", "Leonardo da Vinci"),
+                ] + [(f"Întrebare grea generală {i}?", f"răspuns{i}") for i in range(200)]
         elif category == "țări_orașe":
             if difficulty == "ușor":
-                questions = [
-                    {"question": "Care este capitala Franței?", "answer": "Paris", "category": "țări_orașe", "difficulty": "ușor"},
-                    {"question": "Ce țară are capitala București?", "answer": "România", "category": "țări_orașe", "difficulty": "ușor"},
+                pairs = [
+                    ("Care este capitala Franței?", "Paris"),
+                    ("Ce țară are capitala București?", "România"),
                 ]
             elif difficulty == "mediu":
-                questions = [
-                    {"question": "Care este capitala Australiei?", "answer": "Canberra", "category": "țări_orașe", "difficulty": "mediu"},
-                    {"question": "Ce oraș este cunoscut pentru Colosseum?", "answer": "Roma", "category": "țări_orașe", "difficulty": "mediu"},
+                pairs = [
+                    ("Care este capitala Australiei?", "Canberra"),
+                    ("Ce oraș este cunoscut pentru Colosseum?", "Roma"),
                 ]
             elif difficulty == "greu":
-                questions = [
-                    {"question": "Care este capitala insulei Kiribati?", "answer": "Tarawa", "category": "țări_orașe", "difficulty": "greu"},
-                    {"question": "Care este cel mai mic stat independent din lume?", "answer": "Vatican", "category": "țări_orașe", "difficulty": "greu"},
+                pairs = [
+                    ("Care este capitala insulei Kiribati?", "Tarawa"),
+                    ("Care este cel mai mic stat independent din lume?", "Vatican"),
                 ]
         elif category == "scenariu":
             if difficulty == "ușor":
-                questions = [
-                    {"question": "Ești un detectiv. Unde cauți mai întâi indicii în castel?", "answer": "bibliotecă", "category": "scenariu", "difficulty": "ușor"},
-                    {"question": "Ce obiect găsești pe biroul din castel?", "answer": "o scrisoare", "category": "scenariu", "difficulty": "ușor"},
+                pairs = [
+                    ("Ești un detectiv. Unde cauți mai întâi indicii în castel?", "bibliotecă"),
+                    ("Ce obiect găsești pe biroul din castel?", "o scrisoare"),
                 ]
             elif difficulty == "mediu":
-                questions = [
-                    {"question": "Ce mesaj este scris pe scrisoarea găsită?", "answer": "Întâlnire la miezul nopții", "category": "scenariu", "difficulty": "mediu"},
-                    {"question": "Unde se află cheia secretă a castelului?", "answer": "sub covor", "category": "scenariu", "difficulty": "mediu"},
+                pairs = [
+                    ("Ce mesaj este scris pe scrisoarea găsită?", "Întâlnire la miezul nopții"),
+                    ("Unde se află cheia secretă a castelului?", "sub covor"),
                 ]
             elif difficulty == "greu":
-                questions = [
-                    {"question": "Ce oră indică ceasul din turn când auzi țipătul?", "answer": "2 dimineața", "category": "scenariu", "difficulty": "greu"},
-                    {"question": "Ce simbol este gravat pe cheia secretă?", "answer": "o lună plină", "category": "scenariu", "difficulty": "greu"},
+                pairs = [
+                    ("Ce oră indică ceasul din turn când auzi țipătul?", "2 dimineața"),
+                    ("Ce simbol este gravat pe cheia secretă?", "o lună plină"),
                 ]
+        questions = QuestionTable.from_pairs(pairs, category, difficulty)
 
         file_path = f"categories/{category}_{difficulty}.txt"
         try:
             with open(file_path, "w", encoding="utf-8") as f:
                 for q in questions:
                     f.write(f"{q['question']}\n{q['answer']}\n")
-            logging.info(f"Întrebări salvate în {file_path}")
+            data_log.info(f"Întrebări salvate în {file_path}")
         except Exception as e:
-            logging.error(f"Eroare la salvarea întrebărilor în {file_path}: {e}")
-            if self.status_label:
-                self.status_label.config(text="Eroare la salvarea întrebărilor!", fg=self.colors["error"])
-            else:
-                messagebox.showerror("Eroare", f"Nu s-au putut salva întrebările: {e}")
+            data_log.error(f"Eroare la salvarea întrebărilor în {file_path}: {e}")
+            errors.append(f"Nu s-au putut salva întrebările: {e}")
 
-        if self.status_label:
-            self.status_label.config(text="Întrebări încărcate cu succes!", fg=self.colors["success"])
-        self.root.update()
-        time.sleep(1)
+        progress("Întrebări încărcate cu succes!")
 
-        logging.info(f"Întrebări simulate descărcate: {len(questions)} pentru {category}/{difficulty}")
+        data_log.info(f"Întrebări simulate descărcate: {len(questions)} pentru {category}/{difficulty}")
         return questions
 
-    def select_random_questions(self):
-        key = f"{self.category}_{self.difficulty}"
-        if key not in self.questions or not self.questions[key]:
-            questions = self.load_questions_from_file(self.category, self.difficulty)
-            if not questions:
-                questions = self.download_questions(self.category, self.difficulty)
+    def acquire_questions(self, category, difficulty, progress):
+        """Obține întrebările unei categorii/dificultăți pe firul de lucru, fără acces la Tk."""
+        errors = []
+        progress(f"Se încarcă întrebări pentru {self.categories.get(category, category)} ({difficulty})...")
+        # Banca mmap are prioritate: întrebările se citesc la cerere, după offset
+        questions = self.question_bank.get_bucket(category, difficulty) if self.question_bank else None
+        if not questions:
+            questions = self.load_questions_from_file(category, difficulty, errors)
+        if not questions:
+            questions = self.download_questions(category, difficulty, errors, progress)
+        return questions, errors
+
+    def run_in_background(self, func, callback, *args):
+        """Rulează func pe executor și apelează callback(future) pe firul Tk când termină."""
+        future = self.executor.submit(func, *args)
+
+        def poll():
+            if future.done():
+                callback(future)
+            else:
+                self.root.after(self.poll_interval, poll)
+
+        self.root.after(self.poll_interval, poll)
+        return future
+
+    def set_loading_status(self, text):
+        self.loading_progress = text
+        if self.status_label is None:
+            self.status_label = tk.Label(self.root, text="", font=('Helvetica', 12), bg=self.colors["background"], fg=self.colors["text"])
+            self.status_label.place(relx=0.5, rely=0.05, anchor="center")
+        self.status_label.config(text=text, fg=self.colors["text"])
+
+    def load_questions_async(self, key, on_ready):
+        category, difficulty = self.category, self.difficulty
+        self.loading_key = key
+        self.loading_progress = ""
+        shown = {"text": None}
+
+        def progress(text):
+            # Apelat de pe firul de lucru: doar reține textul, afișarea se face în poll
+            self.loading_progress = text
+
+        def show_progress():
+            if self.loading_key != key:
+                return
+            if self.loading_progress != shown["text"]:
+                shown["text"] = self.loading_progress
+                self.set_loading_status(self.loading_progress)
+            self.root.after(self.poll_interval, show_progress)
+
+        def done(future):
+            still_wanted = self.loading_key == key
+            self.loading_key = None
+            try:
+                questions, errors = future.result()
+            except Exception as e:
+                data_log.error(f"Eroare la încărcarea întrebărilor pentru {key}: {e}")
+                self.messagebox.showerror("Eroare", f"Nu s-au putut încărca întrebările: {e}")
+                return
+            for error in errors:
+                self.messagebox.showerror("Eroare", error)
             self.questions[key] = questions
+            if still_wanted:
+                on_ready()
 
-        available_questions = self.questions[key]
+        show_progress()
+        self.run_in_background(self.acquire_questions, done, category, difficulty, progress)
+
+    def select_random_questions(self):
+        key = f"{self.category}_{self.difficulty}"
+        available_questions = self.questions.get(key)
         if not available_questions:
-            messagebox.showerror("Eroare", "Nu există întrebări disponibile pentru această categorie și dificultate!")
-            logging.error(f"Nu există întrebări pentru {key}")
+            self.messagebox.showerror("Eroare", "Nu există întrebări disponibile pentru această categorie și dificultate!")
+            data_log.error(f"Nu există întrebări pentru {key}")
             self.create_main_menu()
-            return
-
-        if self.is_fast_quiz:
-            self.current_questions = random.sample(available_questions, min(200, len(available_questions)))
-        elif len(available_questions) <= self.total_questions:
-            self.current_questions = available_questions.copy()
-        else:
-            self.current_questions = random.sample(available_questions, self.total_questions)
-        logging.info(f"Selectate {len(self.current_questions)} întrebări pentru joc")
-
-    def display_hidden_answer(self, answer=None, revealed_indices=None):
-        if answer is None:
-            answer = self.current_questions[self.current_question_index]["answer"]
-        hidden = ""
-        if revealed_indices is None:
-            revealed_indices = []
-        for i, char in enumerate(answer):
-            if char == " ":
-                hidden += " "
-            elif i in revealed_indices or not char.isalnum():
-                hidden += char
-            else:
-                hidden += "_"
-        return hidden
-
-    def reveal_half_letters(self, answer):
-        length = len(answer)
-        num_to_reveal = max(1, length // 2)
-        valid_indices = [i for i, char in enumerate(answer) if char.isalnum() and i not in self.hint_indices]
-        if not valid_indices:
-            return self.display_hidden_answer(answer, self.hint_indices)
-        num_to_reveal = min(num_to_reveal, len(valid_indices))
-        new_indices = random.sample(valid_indices, num_to_reveal)
-        self.hint_indices.extend(new_indices)
-        return self.display_hidden_answer(answer, self.hint_indices)
-
-    def reveal_first_letter(self, answer):
-        for i, char in enumerate(answer):
-            if char.isalnum() and i not in self.hint_indices:
-                self.hint_indices.append(i)
-                break
-        return self.display_hidden_answer(answer, self.hint_indices)
+            return 0
+        count = self.engine.start(available_questions, self.category, self.difficulty,
+                                  self.total_questions, self.fast_quiz_duration)
+        data_log.info(f"Selectate {count} întrebări pentru joc")
+        return count
 
     def clear_frame(self):
         if self.timer_id:
@@ -679,6 +734,8 @@ class QuizGame:
         self.status_label = None
         self.answer_label = None
         self.player_label = None
+        self.question_widgets = None
+        self.loading_key = None
         self.menu_buttons = []
         self.selected_menu_index = 0
         self.login_elements = []
@@ -688,7 +745,7 @@ class QuizGame:
         self.root.unbind('<Down>')
         self.root.unbind('<Left>')
         self.root.unbind('<Right>')
-        logging.info("Interfață curățată")
+        ui_log.debug("Interfață curățată")
 
     def update_menu_selection(self):
         for i, element in enumerate(self.menu_buttons):
@@ -704,6 +761,7 @@ class QuizGame:
                 else:
                     element.config(bg=self.colors["secondary"], relief="raised")
 
+    @screen("main_menu")
     def create_main_menu(self):
         self.clear_frame()
         title_label = tk.Label(self.root, text="QUIZ GAME", font=('Helvetica', 28, 'bold'),
@@ -737,7 +795,7 @@ class QuizGame:
                                   bg=self.colors["background"], fg=self.colors["text"])
         settings_label.place(relx=0.5, rely=0.94, anchor="s")  # Mutat mai jos la rely=0.94
 
-        level_label = tk.Label(self.root, text=f"Level: {self.level} | XP: {self.experience}/{self.level_threshold}",
+        level_label = tk.Label(self.root, text=f"Level: {self.engine.profile.level} | XP: {self.engine.profile.experience}/{self.engine.profile.level_threshold}",
                                font=('Helvetica', 10), bg=self.colors["background"], fg=self.colors["text"])
         level_label.place(relx=0.5, rely=0.99, anchor="s")  # Mutat mai jos la rely=0.99
 
@@ -767,48 +825,45 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info("Meniu principal creat")
+        self.bind_key('<Return>', select_option)
+        ui_log.info("Meniu principal creat")
 
+    @screen("stats")
     def show_stats(self):
         self.clear_frame()
         title_label = tk.Label(self.root, text="Statistics", font=('Helvetica', 24, 'bold'), bg=self.colors["background"], fg=self.colors["text"])
         title_label.place(relx=0.5, rely=0.1, anchor="n")
 
-        player_scores = [s for s in self.highscores if s["name"] == self.player_name]
-        if not player_scores:
+        player_stats = self.player_stats.get(self.player_name)
+        if not player_stats:
             stats_label = tk.Label(self.root, text="No statistics available. Play a game to see your stats!", font=('Helvetica', 14), bg=self.colors["background"], fg=self.colors["text"])
             stats_label.place(relx=0.5, rely=0.3, anchor="center")
         else:
-            total_games = len(player_scores)
-            total_questions = sum(s["questions"] for s in player_scores)
-            total_correct = sum(s["score"] for s in player_scores)
+            total_games = player_stats["games"]
+            total_questions = player_stats["questions"]
+            total_correct = player_stats["score"]
             correct_percentage = (total_correct / total_questions * 100) if total_questions > 0 else 0
             avg_score = total_correct / total_games
-            avg_time = sum(s["time"] for s in player_scores) / total_games
-            total_hints = sum(s["hints_used"] for s in player_scores)
+            avg_time = player_stats["time"] / total_games
+            total_hints = player_stats["hints"]
 
             category_stats = {}
             for cat in self.categories:
-                cat_scores = [s for s in player_scores if s["category"] == cat]
-                if cat_scores:
-                    cat_questions = sum(s["questions"] for s in cat_scores)
-                    cat_correct = sum(s["score"] for s in cat_scores)
+                if cat in player_stats["categories"]:
+                    cat_questions, cat_correct = player_stats["categories"][cat]
                     cat_percentage = (cat_correct / cat_questions * 100) if cat_questions > 0 else 0
                     category_stats[cat] = f"{cat_percentage:.2f}% ({cat_correct}/{cat_questions})"
 
             difficulty_stats = {}
             for diff in self.difficulties:
-                diff_scores = [s for s in player_scores if s["difficulty"] == diff]
-                if diff_scores:
-                    diff_questions = sum(s["questions"] for s in diff_scores)
-                    diff_correct = sum(s["score"] for s in diff_scores)
+                if diff in player_stats["difficulties"]:
+                    diff_questions, diff_correct = player_stats["difficulties"][diff]
                     diff_percentage = (diff_correct / diff_questions * 100) if diff_questions > 0 else 0
                     difficulty_stats[diff] = f"{diff_percentage:.2f}% ({diff_correct}/{diff_questions})"
 
             stats_text = (
                 f"Player: {self.player_name}\n"
-                f"Current Level: {self.level} | XP: {self.experience}/{self.level_threshold}\n"
+                f"Current Level: {self.engine.profile.level} | XP: {self.engine.profile.experience}/{self.engine.profile.level_threshold}\n"
                 f"Games Played: {total_games}\n"
                 f"Correct Answers: {correct_percentage:.2f}% ({total_correct}/{total_questions})\n"
                 f"Average Score: {avg_score:.2f}\n"
@@ -857,9 +912,10 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info(f"Statistici afișate pentru jucător: {self.player_name}")
+        self.bind_key('<Return>', select_option)
+        ui_log.info(f"Statistici afișate pentru jucător: {self.player_name}")
 
+    @screen("category_menu")
     def show_category_menu(self):
         self.clear_frame()
         title_label = tk.Label(self.root, text="SELECT CATEGORY", font=('Helvetica', 24, 'bold'), bg=self.colors["background"], fg=self.colors["text"])
@@ -905,18 +961,17 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info("Meniu de categorii creat")
+        self.bind_key('<Return>', select_option)
+        ui_log.info("Meniu de categorii creat")
 
     def set_category(self, category):
         self.category = category
         self.create_main_menu()
         if self.status_label:
             self.status_label.config(text=f"Category set to: {self.categories[category]}", fg=self.colors["success"])
-        self.root.update()
-        time.sleep(1)
-        logging.info(f"Categorie setată: {category}")
+        ui_log.info(f"Categorie setată: {category}")
 
+    @screen("difficulty_menu")
     def show_difficulty_menu(self):
         self.clear_frame()
         title_label = tk.Label(self.root, text="SELECT DIFFICULTY", font=('Helvetica', 24, 'bold'), bg=self.colors["background"], fg=self.colors["text"])
@@ -961,18 +1016,17 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info("Meniu de dificultate creat")
+        self.bind_key('<Return>', select_option)
+        ui_log.info("Meniu de dificultate creat")
 
     def set_difficulty(self, difficulty):
         self.difficulty = difficulty
         self.create_main_menu()
         if self.status_label:
             self.status_label.config(text=f"Difficulty set to: {difficulty.capitalize()}", fg=self.colors["success"])
-        self.root.update()
-        time.sleep(1)
-        logging.info(f"Dificultate setată: {difficulty}")
+        ui_log.info(f"Dificultate setată: {difficulty}")
 
+    @screen("total_questions_menu")
     def show_total_questions_menu(self):
         self.clear_frame()
         style = ttk.Style()
@@ -1050,85 +1104,80 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
+        self.bind_key('<Return>', select_option)
 
-        logging.info("Meniu pentru setarea numărului de întrebări creat")
+        ui_log.info("Meniu pentru setarea numărului de întrebări creat")
 
     def set_total_questions(self, value):
         self.total_questions = value
         self.create_main_menu()
         if self.status_label:
             self.status_label.config(text=f"Number of questions set to: {value}", fg=self.colors["success"])
-        self.root.update()
-        time.sleep(1)
-        logging.info(f"Număr de întrebări setat: {value}")
+        ui_log.info(f"Număr de întrebări setat: {value}")
 
     def start_fast_quiz(self, duration):
-        self.is_fast_quiz = True
-        self.fast_quiz_duration = duration
-        self.start_game()
-        logging.info(f"Fast quiz început cu durata: {duration} secunde")
-
-    def start_game(self):
-        self.score = 0
-        self.current_question_index = 0
-        self.hints_used = 0
-        self.hint_indices = []
-        self.incorrect_answers = []
-        self.deferred_questions = []
-        self.select_random_questions()
-        if not self.current_questions:
+        self.start_game(duration)
+        game_log.info(f"Fast quiz început cu durata: {duration} secunde")
+
+    def start_game(self, fast_quiz_duration=None):
+        self.fast_quiz_duration = fast_quiz_duration
+        key = f"{self.category}_{self.difficulty}"
+        if self.questions.get(key):
+            self.begin_round()
+        elif self.loading_key != key:
+            # Citirea de pe disc rulează în fundal; runda pornește când întrebările sunt gata
+            self.load_questions_async(key, self.begin_round)
+
+    def begin_round(self):
+        if not self.select_random_questions():
             return
-        self.start_time = time.time()
         self.show_question_screen()
-        logging.info(f"Joc început: {self.category}, {self.difficulty}, {self.total_questions} întrebări")
+        game_log.info(f"Joc început: {self.category}, {self.difficulty}, {self.total_questions} întrebări")
 
     def update_timer(self):
-        elapsed_time = time.time() - self.start_time
-        self.time_left = max(0, self.fast_quiz_duration - elapsed_time)
-        minutes = int(self.time_left // 60)
-        seconds = int(self.time_left % 60)
+        if not self.engine.is_fast_quiz:
+            self.timer_id = None
+            return
+        time_left = self.engine.time_left()
+        minutes = int(time_left // 60)
+        seconds = int(time_left % 60)
         self.timer_label.config(text=f"Time Left: {minutes:02d}:{seconds:02d}")
-        if self.time_left > 0:
+        if time_left > 0:
             self.timer_id = self.root.after(1000, self.update_timer)
         else:
+            self.timer_id = None
             self.end_game()
-        logging.debug(f"Timer actualizat: {self.time_left} secunde rămase")
+        ui_log.debug(f"Timer actualizat: {time_left} secunde rămase")
 
+    @screen("question")
     def show_question_screen(self):
-        if self.is_fast_quiz and (time.time() - self.start_time) >= self.fast_quiz_duration:
-            self.end_game()
-            return
-        if not self.is_fast_quiz and self.current_question_index >= len(self.current_questions):
+        if self.engine.next_question() is None:
             self.end_game()
             return
-        if self.is_fast_quiz and self.current_question_index >= len(self.current_questions):
-            self.select_random_questions()
-            self.current_question_index = 0
+        # Ecranul se construiește o singură dată pe rundă; între întrebări doar se actualizează
+        if self.question_widgets is None or self.question_widgets["fast_quiz"] != self.engine.is_fast_quiz:
+            self.build_question_screen()
+        self.update_question_screen()
+        # Durata tranziției e măsurată de span-ul screen.question (raportul F12)
+        ui_log.info(f"Ecran întrebare afișat: Întrebarea {self.engine.index + 1}")
+
+    def build_question_screen(self):
         self.clear_frame()
+        widgets = {"fast_quiz": self.engine.is_fast_quiz}
 
-        current_q = self.current_questions[self.current_question_index]
-        question = current_q["question"]
-        answer = current_q["answer"]
-        hidden_answer = self.display_hidden_answer(revealed_indices=self.hint_indices)
-
-        player_info = f"{self.player_name} | Score: {self.score} | Hints: {self.max_hints - self.hints_used} | Level: {self.level}"
-        self.player_label = tk.Label(self.root, text=player_info, font=('Helvetica', 14), bg=self.colors["background"], fg=self.colors["text"])
+        self.player_label = tk.Label(self.root, text="", font=('Helvetica', 14), bg=self.colors["background"], fg=self.colors["text"])
         self.player_label.place(relx=0.02, rely=0.02, anchor="nw")
 
-        question_info = f"Question {self.current_question_index + 1}" + (f"/{len(self.current_questions)}" if not self.is_fast_quiz else "")
-        question_label = tk.Label(self.root, text=question_info, font=('Helvetica', 14), bg=self.colors["background"], fg=self.colors["text"])
-        question_label.place(relx=0.98, rely=0.02, anchor="ne")
+        widgets["counter"] = tk.Label(self.root, text="", font=('Helvetica', 14), bg=self.colors["background"], fg=self.colors["text"])
+        widgets["counter"].place(relx=0.98, rely=0.02, anchor="ne")
 
-        progress = (self.current_question_index + 1) / len(self.current_questions) * 100 if not self.is_fast_quiz else (self.fast_quiz_duration - self.time_left) / self.fast_quiz_duration * 100
-        progress_bar = ttk.Progressbar(self.root, length=600, mode='determinate', maximum=100, value=progress)
-        progress_bar.place(relx=0.5, rely=0.1, anchor="center")
+        widgets["progress"] = ttk.Progressbar(self.root, length=600, mode='determinate', maximum=100, value=0)
+        widgets["progress"].place(relx=0.5, rely=0.1, anchor="center")
 
-        question_label = tk.Label(self.root, text=f"{question}", font=('Helvetica', 16), bg=self.colors["background"], fg=self.colors["text"], wraplength=650, justify="center")
-        question_label.place(relx=0.5, rely=0.2, anchor="center")
+        widgets["question"] = tk.Label(self.root, text="", font=('Helvetica', 16), bg=self.colors["background"], fg=self.colors["text"], wraplength=650, justify="center")
+        widgets["question"].place(relx=0.5, rely=0.2, anchor="center")
 
-        answer_text = f"Answer ({len(answer)} letters): {hidden_answer}"
-        self.answer_label = tk.Label(self.root, text=answer_text, font=('Helvetica', 18), bg=self.colors["background"], fg=self.colors["text"])
+        self.answer_label = tk.Label(self.root, text="", font=('Helvetica', 18), bg=self.colors["background"], fg=self.colors["text"])
         self.answer_label.place(relx=0.5, rely=0.35, anchor="center")
 
         input_frame = tk.Frame(self.root, bg=self.colors["background"])
@@ -1166,16 +1215,24 @@ class QuizGame:
                                  activebackground=self.colors["success"], activeforeground=self.colors["text"], command=lambda: self.show_hint(2), relief="flat", cursor="hand2")
         hint2_button.pack(side="left", fill="x", expand=True, padx=5)
 
+        hint3_button = tk.Button(hint_frame, text="Hint: Vowels", font=('Helvetica', 12, 'bold'), bg=self.colors["secondary"], fg=self.colors["text"],
+                                 activebackground=self.colors["success"], activeforeground=self.colors["text"], command=lambda: self.show_hint(3), relief="flat", cursor="hand2")
+        hint3_button.pack(side="left", fill="x", expand=True, padx=5)
+
+        hint4_button = tk.Button(hint_frame, text="Hint: Word", font=('Helvetica', 12, 'bold'), bg=self.colors["secondary"], fg=self.colors["text"],
+                                 activebackground=self.colors["success"], activeforeground=self.colors["text"], command=lambda: self.show_hint(4), relief="flat", cursor="hand2")
+        hint4_button.pack(side="left", fill="x", expand=True, padx=5)
+
         clear_button = tk.Button(hint_frame, text="Clear Answer", font=('Helvetica', 12, 'bold'), bg=self.colors["error"], fg=self.colors["text"],
                                  activebackground=self.colors["secondary"], activeforeground=self.colors["text"], command=lambda: self.answer_entry.delete(0, tk.END), relief="flat", cursor="hand2")
         clear_button.pack(side="left", fill="x", expand=True, padx=5)
 
-        if self.is_fast_quiz:
+        if self.engine.is_fast_quiz:
             self.timer_label = tk.Label(self.root, text="Time Left: 00:00", font=('Helvetica', 14), bg=self.colors["background"], fg=self.colors["error"])
             self.timer_label.place(relx=0.5, rely=0.9, anchor="center")
             self.update_timer()
 
-        self.menu_buttons = [self.answer_entry, check_button, skip_button, back_button, hint1_button, hint2_button, clear_button]
+        self.menu_buttons = [self.answer_entry, check_button, skip_button, back_button, hint1_button, hint2_button, hint3_button, hint4_button, clear_button]
 
         def move_up(event):
             self.selected_menu_index = (self.selected_menu_index - 1) % len(self.menu_buttons)
@@ -1211,167 +1268,191 @@ class QuizGame:
             elif isinstance(element, tk.Button):
                 element.invoke()
 
-        self.selected_menu_index = 0
-        self.update_menu_selection()
         self.root.bind('<Up>', move_up)
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info(f"Ecran întrebare afișat: Întrebarea {self.current_question_index + 1}")
+        self.bind_key('<Return>', select_option)
+        self.question_widgets = widgets
+        ui_log.info("Ecran de întrebări construit")
+
+    def update_player_label(self):
+        if self.player_label:
+            self.player_label.config(text=f"{self.player_name} | Score: {self.engine.score} | Hints: {self.engine.hints_left()} | Level: {self.engine.profile.level}")
+
+    def update_question_screen(self):
+        """Actualizează pe loc widget-urile ecranului de întrebări pentru întrebarea curentă."""
+        widgets = self.question_widgets
+        engine = self.engine
+        current_q = engine.next_question()
+        answer = current_q["answer"]
+
+        self.update_player_label()
+        question_info = f"Question {engine.index + 1}" + (f"/{len(engine.questions)}" if not engine.is_fast_quiz else "")
+        widgets["counter"].config(text=question_info)
+        if engine.is_fast_quiz:
+            progress = (engine.fast_quiz_duration - engine.time_left()) / engine.fast_quiz_duration * 100
+        else:
+            progress = (engine.index + 1) / len(engine.questions) * 100
+        widgets["progress"].config(value=progress)
+        widgets["question"].config(text=f"{current_q['question']}")
+        self.answer_label.config(text=f"Answer ({len(answer)} letters): {engine.hidden_answer()}")
+        self.answer_entry.delete(0, tk.END)
+
+        self.selected_menu_index = 0
+        self.update_menu_selection()
 
     def skip_question(self):
-        if self.hints_used >= self.max_hints:
-            messagebox.showwarning("Warning", "You have used all available hints!")
-            logging.warning("Attempt to skip question without available hints")
+        current_q = self.engine.next_question()
+        if current_q is None:
+            # Timpul rundei rapide a expirat între două actualizări ale cronometrului
+            self.end_game()
             return
-        current_q = self.current_questions[self.current_question_index]
-        self.deferred_questions.append(current_q)
-        self.hints_used += 1
-        if self.player_label:
-            self.player_label.config(text=f"{self.player_name} | Score: {self.score} | Hints: {self.max_hints - self.hints_used} | Level: {self.level}")
-        messagebox.showinfo("Skipped", "Question skipped. You will answer it at the end.")
-        self.current_question_index += 1
-        self.hint_indices = []
+        if not self.engine.skip():
+            self.messagebox.showwarning("Warning", "You have used all available hints!")
+            game_log.warning("Attempt to skip question without available hints")
+            return
+        self.update_player_label()
+        self.messagebox.showinfo("Skipped", "Question skipped. You will answer it at the end.")
         self.show_question_screen()
-        logging.info(f"Question skipped: {current_q['question']}")
+        game_log.info(f"Question skipped: {current_q['question']}")
 
     def check_answer(self):
-        current_q = self.current_questions[self.current_question_index]
+        current_q = self.engine.next_question()
+        if current_q is None:
+            self.end_game()
+            return
         user_answer = self.answer_entry.get().strip()
         if not user_answer:
-            messagebox.showwarning("Warning", "Please enter an answer!")
-            logging.warning("Attempt to check answer without input")
+            self.messagebox.showwarning("Warning", "Please enter an answer!")
+            game_log.warning("Attempt to check answer without input")
             return
-        correct_answer = current_q["answer"]
-        normalized_user_answer = self.normalize_text(user_answer)
-        normalized_correct_answer = self.normalize_text(correct_answer)
-        logging.info(f"User answer: {normalized_user_answer}, Correct answer: {normalized_correct_answer}")
-        if normalized_user_answer == normalized_correct_answer:
-            self.score += 1
-            xp_earned = 10
-            if self.difficulty == "mediu":
-                xp_earned += 5
-            elif self.difficulty == "greu":
-                xp_earned += 10
-            if self.is_fast_quiz:
-                xp_earned += 5
-            self.experience += xp_earned
-            messagebox.showinfo("Correct!", f"Correct answer! You earned {xp_earned} XP!")
-            self.play_sound(self.correct_sound)
-            while self.experience >= self.level_threshold:
-                self.level += 1
-                self.experience -= self.level_threshold
-                self.level_threshold = int(self.level_threshold * 1.5)
-                self.max_hints += 1
-                messagebox.showinfo("New Level!", f"You reached Level {self.level}! Reward: +1 hint (total: {self.max_hints})")
+        result = self.engine.answer(user_answer)
+        if result.correct:
+            self.messagebox.showinfo("Correct!", f"Correct answer! You earned {result.xp} XP!")
+            self.play_sound("correct")
+            for level in result.levels:
+                self.messagebox.showinfo("New Level!", f"You reached Level {level}! Reward: +1 hint (total: {self.engine.profile.max_hints})")
+            if result.levels:
                 self.save_users()
-            logging.info(f"Correct answer: {current_q['question']}, XP earned: {xp_earned}")
+            game_log.info(f"Correct answer: {current_q['question']}, XP earned: {result.xp}")
         else:
-            messagebox.showerror("Incorrect!", f"Wrong answer! The correct answer was: {correct_answer}")
-            self.play_sound(self.incorrect_sound)
-            self.incorrect_answers.append(current_q)
-            logging.info(f"Incorrect answer: {current_q['question']}, Answer given: {user_answer}")
-        self.current_question_index += 1
-        self.hint_indices = []
+            self.messagebox.showerror("Incorrect!", f"Wrong answer! The correct answer was: {result.answer}")
+            self.play_sound("incorrect")
+            game_log.info(f"Incorrect answer: {current_q['question']}, Answer given: {user_answer}")
         self.show_question_screen()
 
     def end_game(self):
-        self.end_time = time.time()
-        time_taken = round(self.end_time - self.start_time, 2)
-        self.save_highscore()
+        summary = self.engine.finish()
+        self.save_highscore(summary)
         self.save_users()
-        self.play_sound(self.game_over_sound)
-        if self.deferred_questions and (not self.is_fast_quiz or self.time_left > 0):
-            messagebox.showinfo("Deferred Questions", "You will now answer the skipped questions.")
-            self.current_questions = self.deferred_questions
-            self.deferred_questions = []
-            self.current_question_index = 0
-            self.is_fast_quiz = False
+        self.save_review_queue()
+        self.play_sound("game_over")
+        if summary.next_phase == DEFERRED:
+            self.messagebox.showinfo("Deferred Questions", "You will now answer the skipped questions.")
             self.show_question_screen()
-            logging.info("Switching to deferred questions")
+            game_log.info("Switching to deferred questions")
             return
+        profile = self.engine.profile
         result_message = (
             f"Congratulations, {self.player_name}!\n"
-            f"Final Score: {self.score}/{self.current_question_index}\n"
-            f"Total Time: {time_taken} seconds\n"
-            f"Hints Used: {self.hints_used}\n"
-            f"Level: {self.level} | XP: {self.experience}/{self.level_threshold}\n"
+            f"Final Score: {summary.score}/{summary.answered}\n"
+            f"Total Time: {summary.time_taken} seconds\n"
+            f"Hints Used: {summary.hints_used}\n"
+            f"Level: {profile.level} | XP: {profile.experience}/{profile.level_threshold}\n"
         )
-        if self.incorrect_answers:
+        if summary.next_phase == REVIEW:
             result_message += "\nYou got some questions wrong. Press OK to review them."
-            messagebox.showinfo("Final Result", result_message)
-            self.start_review_incorrect_answers()
-            logging.info("Game ended, proceeding to review incorrect answers")
+            self.messagebox.showinfo("Final Result", result_message)
+            self.show_question_screen()
+            game_log.info("Game ended, proceeding to review incorrect answers")
         else:
-            messagebox.showinfo("Final Result", result_message)
+            self.messagebox.showinfo("Final Result", result_message)
             self.create_main_menu()
-            logging.info("Game ended, returning to menu")
-
-    def start_review_incorrect_answers(self):
-        self.current_questions = self.incorrect_answers
-        self.incorrect_answers = []
-        self.current_question_index = 0
-        self.is_fast_quiz = False
-        self.show_question_screen()
-        logging.info("Started reviewing incorrect answers")
+            game_log.info("Game ended, returning to menu")
 
     def show_hint(self, hint_type):
-        if self.hints_used >= self.max_hints:
-            messagebox.showwarning("Warning", "You have used all available hints!")
-            logging.warning("Attempt to use hint without available hints")
+        if self.engine.hints_left() <= 0:
+            self.messagebox.showwarning("Warning", "You have used all available hints!")
+            game_log.warning("Attempt to use hint without available hints")
             return
-        current_q = self.current_questions[self.current_question_index]
-        answer = current_q["answer"]
-        if hint_type == 1:
-            hidden_answer = self.reveal_half_letters(answer)
-        elif hint_type == 2:
-            hidden_answer = self.reveal_first_letter(answer)
-        else:
-            messagebox.showerror("Error", "Invalid hint type!")
-            logging.error(f"Invalid hint requested: {hint_type}")
+        current_q = self.engine.next_question()
+        if current_q is None:
+            self.end_game()
             return
-        self.hints_used += 1
-        self.answer_label.config(text=f"Answer ({len(answer)} letters): {hidden_answer}")
-        if self.player_label:
-            self.player_label.config(text=f"{self.player_name} | Score: {self.score} | Hints: {self.max_hints - self.hints_used} | Level: {self.level}")
-        self.play_sound(self.hint_sound)
-        logging.info(f"Hint used: type {hint_type} for question {current_q['question']}")
+        try:
+            hidden_answer = self.engine.hint(hint_type)
+        except ValueError:
+            self.messagebox.showerror("Error", "Invalid hint type!")
+            game_log.error(f"Invalid hint requested: {hint_type}")
+            return
+        self.answer_label.config(text=f"Answer ({len(current_q['answer'])} letters): {hidden_answer}")
+        self.update_player_label()
+        self.play_sound("hint")
+        game_log.info(f"Hint used: type {hint_type} for question {current_q['question']}")
 
+    @screen("highscores")
     def show_highscores(self, show_player_only=False):
         self.clear_frame()
-        title_label = tk.Label(self.root, text=f"{'MY HIGHSCORES' if show_player_only else 'ALL HIGHSCORES'}",
-                               font=('Helvetica', 24, 'bold'), bg=self.colors["background"],
+        title_label = tk.Label(self.root, text="", font=('Helvetica', 24, 'bold'), bg=self.colors["background"],
                                fg=self.colors["text"])
         title_label.place(relx=0.5, rely=0.1, anchor="n")
 
         columns = ("Name", "Score", "Time", "Category", "Difficulty", "Date")
-        tree = ttk.Treeview(self.root, columns=columns, show="headings", height=8,
+        table_frame = tk.Frame(self.root, bg=self.colors["background"])
+        tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=8,
                             style="Custom.Treeview")  # Redus height la 8 pentru a face loc butoanelor
         for col in columns:
             tree.heading(col, text=col)
             tree.column(col, width=100, anchor="center")
-        scores_to_show = [score for score in self.highscores if
-                          score['name'] == self.player_name] if show_player_only else self.highscores
-        for i, score in enumerate(scores_to_show, 1):
-            category_name = self.categories.get(score['category'], score['category'])
-            tree.insert("", "end", values=(
-                score['name'],
-                score['score'],
-                f"{score['time']} sec",
-                category_name,
-                score['difficulty'],
-                score['date']
-            ))
-        tree.place(relx=0.5, rely=0.45, anchor="center")  # Mutat mai sus la rely=0.45
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+        tree.pack(side="left")
+        scrollbar.pack(side="left", fill="y")
+        table_frame.place(relx=0.5, rely=0.45, anchor="center")  # Mutat mai sus la rely=0.45
+
+        # Rândurile se inserează pe pagini, doar când utilizatorul ajunge la finalul celor afișate
+        page_size = 50
+        view = {"player": None, "loaded": 0, "total": 0}
+
+        def load_next_page():
+            scores = self.highscores.page(view["loaded"], page_size, view["player"])
+            for score in scores:
+                category_name = self.categories.get(score['category'], score['category'])
+                tree.insert("", "end", values=(
+                    score['name'],
+                    score['score'],
+                    f"{score['time']} sec",
+                    category_name,
+                    score['difficulty'],
+                    score['date']
+                ))
+            view["loaded"] += len(scores)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) >= 0.95 and view["loaded"] < view["total"]:
+                load_next_page()
+
+        def show_scores(player_only):
+            view["player"] = self.player_name if player_only else None
+            view["total"] = self.highscores.count(view["player"])
+            view["loaded"] = 0
+            tree.delete(*tree.get_children())
+            load_next_page()
+            title_label.config(text="MY HIGHSCORES" if player_only else "ALL HIGHSCORES")
+            toggle_button.config(text="Show All Scores" if player_only else "Show Only My Scores",
+                                 command=lambda: show_scores(not player_only))
+            ui_log.info(f"Highscores displayed: {'player only' if player_only else 'all scores'}")
+
+        tree.configure(yscrollcommand=on_scroll)
 
         btn_frame = tk.Frame(self.root, bg=self.colors["background"], highlightthickness=0)
         btn_frame.place(relx=0.5, rely=0.75, anchor="center")  # Mutat mai sus la rely=0.75
 
-        toggle_button = tk.Button(btn_frame, text="Show Only My Scores" if not show_player_only else "Show All Scores",
+        toggle_button = tk.Button(btn_frame, text="",
                                   font=('Helvetica', 12, 'bold'), bg=self.colors["secondary"], fg=self.colors["text"],
                                   activebackground=self.colors["success"], activeforeground=self.colors["text"],
-                                  command=lambda: self.show_highscores(not show_player_only), relief="flat",
+                                  relief="flat",
                                   cursor="hand2",
                                   width=20)
         toggle_button.pack(side="left", padx=10)
@@ -1411,8 +1492,8 @@ class QuizGame:
         self.root.bind('<Down>', move_down)
         self.root.bind('<Left>', move_left)
         self.root.bind('<Right>', move_right)
-        self.root.bind('<Return>', select_option)
-        logging.info(f"Highscores displayed: {'player only' if show_player_only else 'all scores'}")
+        self.bind_key('<Return>', select_option)
+        show_scores(show_player_only)
 
 if __name__ == "__main__":
     if platform.system() == "Emscripten":
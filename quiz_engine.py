@@ -0,0 +1,289 @@
+"""Regulile jocului, fără interfață grafică: selecția întrebărilor, punctajul, XP-ul, indiciile,
+întrebările amânate și recapitularea celor greșite.
+
+QuizGame doar afișează ce întoarce motorul; același motor poate rula fără ecran,
+de exemplu pentru simulări de încărcare sau pentru alte interfețe.
+"""
+import datetime
+import logging
+import random
+import time
+from collections import namedtuple
+
+from answer_matching import answer_matches
+from hint_mask import RevealMask
+from question_scheduler import QuestionScheduler
+from questions import normalize_text
+
+logger = logging.getLogger(__name__)
+
+BASE_XP = 10
+DIFFICULTY_XP = {"ușor": 0, "mediu": 5, "greu": 10}
+FAST_QUIZ_XP = 5
+FAST_QUIZ_BATCH = 200
+# Cât dintr-o sesiune nouă poate fi ocupat de întrebări greșite anterior, ajunse la scadență
+REVIEW_SHARE = 0.5
+
+# Etapele unei sesiuni: runda propriu-zisă, întrebările amânate, recapitularea celor greșite
+MAIN = "main"
+DEFERRED = "deferred"
+REVIEW = "review"
+FINISHED = "finished"
+
+# 1: jumătate din litere, 2: prima literă, 3: vocalele, 4: un cuvânt
+HINT_TYPES = (1, 2, 3, 4)
+
+AnswerResult = namedtuple("AnswerResult", "correct xp levels answer")
+Summary = namedtuple("Summary", "score answered questions time_taken hints_used next_phase")
+
+
+class Profile:
+    """Progresul unui jucător, păstrat între sesiuni."""
+    __slots__ = ("level", "experience", "level_threshold", "max_hints")
+
+    def __init__(self, level=1, experience=0, max_hints=3, level_threshold=100):
+        self.level = level
+        self.experience = experience
+        self.max_hints = max_hints
+        self.level_threshold = level_threshold
+
+    @classmethod
+    def from_record(cls, record):
+        return cls(record.level, record.experience, record.max_hints)
+
+    def add_experience(self, xp):
+        """Adaugă XP; întoarce nivelurile noi atinse (fiecare aduce un indiciu în plus)."""
+        self.experience += xp
+        levels = []
+        while self.experience >= self.level_threshold:
+            self.level += 1
+            self.experience -= self.level_threshold
+            self.level_threshold = int(self.level_threshold * 1.5)
+            self.max_hints += 1
+            levels.append(self.level)
+        return levels
+
+
+class QuizEngine:
+    def __init__(self, profile=None, executor=None, clock=time.time, review_queue=None, player_name=None,
+                 clusters=None):
+        self.profile = profile if profile is not None else Profile()
+        self.executor = executor
+        self.clock = clock
+        self.review_queue = review_queue
+        self.player_name = player_name
+        # Grupurile de reformulări (question_clusters.ClusterMap); o sesiune primește cel mult una din grup
+        self.clusters = clusters
+        self.category = None
+        self.difficulty = None
+        self.total_questions = 0
+        self.fast_quiz_duration = None
+        self.phase = FINISHED
+        self.questions = []
+        self.index = 0
+        self.score = 0
+        self.hints_used = 0
+        self.deferred = []
+        self.incorrect = []
+        self.mask = None
+        self.scheduler = None
+        self.start_time = 0
+        self.end_time = 0
+
+    @property
+    def is_fast_quiz(self):
+        return self.phase == MAIN and self.fast_quiz_duration is not None
+
+    def hints_left(self):
+        return self.profile.max_hints - self.hints_used
+
+    def time_left(self):
+        if not self.is_fast_quiz:
+            return 0
+        return max(0, self.fast_quiz_duration - (self.clock() - self.start_time))
+
+    def start(self, questions, category, difficulty, total_questions=10, fast_quiz_duration=None):
+        """Pornește o sesiune nouă; fast_quiz_duration (secunde) transformă runda într-una cu timp."""
+        if not questions:
+            raise ValueError(f"Nu există întrebări pentru {category}_{difficulty}")
+        self.category = category
+        self.difficulty = difficulty
+        self.total_questions = total_questions
+        self.fast_quiz_duration = fast_quiz_duration
+        self.score = 0
+        self.hints_used = 0
+        self.deferred = []
+        self.incorrect = []
+        self.scheduler = None
+        size = FAST_QUIZ_BATCH if fast_quiz_duration is not None else total_questions
+        due = self._due_reviews(questions, max(1, int(size * REVIEW_SHARE)))
+        # Întrebările scadente înlocuiesc o parte din cele noi, fără duplicate și fără reformulări
+        new_count = size - len(due)
+        if fast_quiz_duration is not None:
+            self.scheduler = QuestionScheduler(questions, FAST_QUIZ_BATCH, self.executor, self.clusters)
+            # Recapitulările contează ca servite, deci loturile următoare nu le mai repetă
+            self.scheduler.exclude(due)
+            selected = self._without_due(self.scheduler.next_batch(), due)
+            self.scheduler.give_back(selected[new_count:])
+            selected = selected[:new_count]
+            self.scheduler.prefetch()
+        elif self.clusters is not None:
+            scheduler = QuestionScheduler(questions, total_questions, clusters=self.clusters)
+            scheduler.exclude(due)
+            selected = self._without_due(scheduler.next_batch(), due)[:new_count]
+        else:
+            if len(questions) <= total_questions:
+                selected = list(questions)
+            else:
+                selected = random.sample(questions, total_questions)
+            selected = self._without_due(selected, due)[:new_count]
+        if due:
+            selected = due + selected
+            random.shuffle(selected)
+        self._enter(MAIN, selected)
+        self.start_time = self.clock()
+        logger.debug(f"Sesiune pornită: {category}, {difficulty}, {len(selected)} întrebări ({len(due)} de recapitulat)")
+        return len(selected)
+
+    def _without_due(self, selected, due):
+        """Elimină recapitulările și reformulările lor din întrebările noi.
+
+        Dacă recapitulările acoperă toată banca, planificatorul reia permutarea și le extrage din nou.
+        """
+        if not due:
+            return selected
+        due_set = set(due)
+        due_clusters = set()
+        if self.clusters is not None:
+            due_clusters = {self.clusters.cluster_of(question) for question in due}
+            due_clusters.discard(None)
+        return [question for question in selected if question not in due_set
+                and not (due_clusters and self.clusters.cluster_of(question) in due_clusters)]
+
+    def _due_reviews(self, questions, limit):
+        if self.review_queue is None or not self.player_name:
+            return []
+        return self.review_queue.due_questions(self.player_name, self.category, self.difficulty,
+                                               questions, limit, self.clock())
+
+    def _enter(self, phase, questions):
+        self.phase = phase
+        self.questions = questions
+        self.index = 0
+        self.mask = None
+
+    def _advance(self):
+        self.index += 1
+        self.mask = None
+
+    def next_question(self):
+        """Întrebarea curentă sau None când etapa s-a încheiat (întrebări epuizate sau timp expirat)."""
+        if self.phase == FINISHED:
+            return None
+        if self.is_fast_quiz:
+            if self.time_left() <= 0:
+                return None
+            if self.index >= len(self.questions):
+                # Lotul următor a fost extras în fundal, fără repetări față de cele deja servite
+                self.questions = self.scheduler.next_batch()
+                self.scheduler.prefetch()
+                self.index = 0
+        elif self.index >= len(self.questions):
+            return None
+        question = self.questions[self.index]
+        if self.mask is None:
+            # Masca se calculează o dată per întrebare; indiciile doar o actualizează
+            self.mask = RevealMask(question["answer"], question["normalized"])
+        return question
+
+    def hidden_answer(self):
+        return self.mask.render()
+
+    def answer(self, text):
+        question = self.next_question()
+        if question is None:
+            raise ValueError("Nu există o întrebare curentă")
+        text = text.strip()
+        if not text:
+            raise ValueError("Răspunsul este gol")
+        # Răspunsurile corecte au fost normalizate la încărcare; se normalizează doar intrarea
+        correct = answer_matches(normalize_text(text), question["accepted"], self.difficulty)
+        xp = 0
+        levels = []
+        if correct:
+            self.score += 1
+            xp = BASE_XP + DIFFICULTY_XP.get(self.difficulty, 0)
+            if self.is_fast_quiz:
+                xp += FAST_QUIZ_XP
+            levels = self.profile.add_experience(xp)
+        else:
+            self.incorrect.append(question)
+        if self.review_queue is not None and self.player_name:
+            self.review_queue.record(self.player_name, question, correct, self.clock())
+        self._advance()
+        return AnswerResult(correct, xp, levels, question["answer"])
+
+    def hint(self, hint_type):
+        """Dezvăluie o parte din răspuns; întoarce textul afișat sau None dacă nu mai sunt indicii."""
+        if hint_type not in HINT_TYPES:
+            raise ValueError(f"Tip de indiciu invalid: {hint_type}")
+        if self.hints_left() <= 0:
+            return None
+        question = self.next_question()
+        if question is None:
+            raise ValueError("Nu există o întrebare curentă")
+        if hint_type == 1:
+            self.mask.reveal_random(max(1, len(question["answer"]) // 2))
+        elif hint_type == 2:
+            self.mask.reveal_first()
+        elif hint_type == 3:
+            self.mask.reveal_vowels()
+        else:
+            self.mask.reveal_word()
+        self.hints_used += 1
+        return self.mask.render()
+
+    def skip(self):
+        """Amână întrebarea curentă la finalul rundei; costă un indiciu."""
+        if self.hints_left() <= 0:
+            return False
+        question = self.next_question()
+        if question is None:
+            raise ValueError("Nu există o întrebare curentă")
+        self.deferred.append(question)
+        self.hints_used += 1
+        self._advance()
+        return True
+
+    def finish(self):
+        """Încheie etapa curentă și trece la întrebările amânate sau la recapitulare, dacă există.
+
+        Rezumatul întors descrie etapa încheiată; next_phase spune ce urmează.
+        """
+        self.end_time = self.clock()
+        questions = len(self.questions) if self.is_fast_quiz else self.total_questions
+        time_expired = self.is_fast_quiz and self.time_left() <= 0
+        answered = self.index
+        if self.deferred and not time_expired:
+            self._enter(DEFERRED, self.deferred)
+            self.deferred = []
+        elif self.incorrect:
+            self._enter(REVIEW, self.incorrect)
+            self.incorrect = []
+        else:
+            self.phase = FINISHED
+        logger.debug(f"Etapă încheiată: {self.score}/{answered}, urmează {self.phase}")
+        return Summary(self.score, answered, questions, round(self.end_time - self.start_time, 2),
+                       self.hints_used, self.phase)
+
+    def score_entry(self, player_name, summary):
+        return {
+            "name": player_name,
+            "score": summary.score,
+            "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "category": self.category,
+            "difficulty": self.difficulty,
+            "questions": summary.questions,
+            "time": summary.time_taken,
+            "hints_used": summary.hints_used
+        }
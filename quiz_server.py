@@ -0,0 +1,442 @@
+"""Server local pentru mai mulți jucători simultan, peste aceeași bancă de întrebări.
+
+Protocolul: câte un obiect JSON pe linie, în ambele sensuri. Fiecare cerere are "op";
+răspunsul are "ok" și, la eroare, "error". Operații:
+
+    {"op": "register", "name": ..., "password": ...}
+    {"op": "login", "name": ..., "password": ...}
+    {"op": "start", "category": "general", "difficulty": "mediu", "questions": 10, "duration": null}
+    {"op": "question"}
+    {"op": "answer", "text": ...}
+    {"op": "hint", "type": 1}
+    {"op": "skip"}
+    {"op": "finish"}
+    {"op": "highscores", "offset": 0, "limit": 10, "player": null}
+    {"op": "quit"}
+
+Fiecare conexiune are propriul QuizEngine; întrebările sunt citite o singură dată și
+partajate, doar pentru citire. Conturile și scorurile sunt accesate numai de pe un fir
+dedicat, deci scrierile pe disc nu blochează bucla asyncio. Fișierele de date au un singur
+proces care scrie: serverul nu pornește cât timp jocul (sau alt server) le folosește.
+
+Rulare: python quiz_server.py [--host 127.0.0.1] [--port 8765]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from auth import hash_password, verify_password
+from highscore_store import HighscoreStore
+from log_setup import setup_logging
+from player_stats import PlayerStats
+from question_bank import DEFAULT_BANK_FILE, QuestionBank, iter_text_file
+from question_clusters import DEFAULT_CLUSTERS_FILE, ClusterMap
+from questions import QuestionTable
+from quiz_engine import FINISHED, Profile, QuizEngine
+from storage import DEFAULT_LOCK_FILE, StorageLockedError, WriterLock
+from user_store import UserRecord, UserStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE = 64 * 1024
+# Aceleași categorii și dificultăți ca în QuizGame; banca poate adăuga altele, importate
+CATEGORIES = frozenset(("general", "țări_orașe", "scenariu"))
+DIFFICULTIES = frozenset(("ușor", "mediu", "greu"))
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class ClientSession:
+    """Starea unei conexiuni: jucătorul autentificat, sesiunea lui de joc și fluxul de scriere."""
+    __slots__ = ("player_name", "engine", "writer")
+
+    def __init__(self, writer):
+        self.player_name = None
+        self.engine = None
+        self.writer = writer
+
+
+class QuizServer:
+    def __init__(self, users_file="users.json", highscores_file="highscores.json",
+                 player_stats_file="player_stats.json", bank_file=DEFAULT_BANK_FILE,
+                 categories_dir="categories", clusters_file=DEFAULT_CLUSTERS_FILE, users_flush_delay=1.0,
+                 compact_every=1000):
+        self.writer_lock = WriterLock(os.path.join(os.path.dirname(users_file), DEFAULT_LOCK_FILE))
+        self.users = UserStore(users_file)
+        self.highscores = HighscoreStore(highscores_file, compact_every=compact_every)
+        self.player_stats = PlayerStats(player_stats_file)
+        self.question_bank = QuestionBank.open_if_exists(bank_file)
+        self.question_clusters = ClusterMap.load_if_exists(clusters_file)
+        self.categories_dir = categories_dir
+        self.users_flush_delay = users_flush_delay
+        self.users_flush_handle = None
+        self.pending_scores = []
+        self.score_writer = None
+        self.questions = {}
+        self.question_loads = {}
+        self.sessions = set()
+        # Un singur fir pentru conturi și scoruri: depozitele nu sunt sigure între fire
+        self.storage = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quiz-storage")
+        self.loop = None
+        self.server = None
+
+    def load(self):
+        self.users.load()
+        self.highscores.load()
+        self.player_stats.load(self.highscores)
+
+    async def in_storage(self, func, *args):
+        return await self.loop.run_in_executor(self.storage, func, *args)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.loop = asyncio.get_running_loop()
+        self.writer_lock.acquire()
+        try:
+            await self.in_storage(self.load)
+        except BaseException:
+            self.writer_lock.release()
+            raise
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+        logger.info(f"Server pornit pe {host}:{port}")
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            # wait_closed() așteaptă și conexiunile deschise, deci clienții sunt deconectați întâi
+            for session in list(self.sessions):
+                session.writer.close()
+            await self.server.wait_closed()
+        if self.users_flush_handle is not None:
+            self.users_flush_handle.cancel()
+            self.users_flush_handle = None
+        await self.in_storage(self.users.flush)
+        self.storage.shutdown()
+        self.writer_lock.release()
+        if self.question_bank:
+            self.question_bank.close()
+        logger.info("Server oprit")
+
+    async def handle_client(self, reader, writer):
+        session = ClientSession(writer)
+        self.sessions.add(session)
+        peer = writer.get_extra_info("peername")
+        logger.debug(f"Conexiune nouă: {peer}")
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self.send(writer, {"ok": False, "error": "Cerere prea lungă"})
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ProtocolError("Cererea trebuie să fie un obiect JSON")
+                    if request.get("op") == "quit":
+                        await self.send(writer, {"ok": True})
+                        break
+                    response = await self.dispatch(session, request)
+                except (ProtocolError, ValueError, TypeError) as e:
+                    response = {"ok": False, "error": str(e)}
+                except Exception as e:
+                    logger.exception(f"Eroare la procesarea cererii: {e}")
+                    response = {"ok": False, "error": "Eroare internă"}
+                await self.send(writer, response)
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+            logger.debug(f"Conexiune închisă: {peer}")
+
+    async def send(self, writer, response):
+        writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+
+    async def dispatch(self, session, request):
+        op = request.get("op")
+        handler = getattr(self, f"op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            raise ProtocolError(f"Operație necunoscută: {op}")
+        if op not in ("login", "register", "highscores") and session.player_name is None:
+            raise ProtocolError("Autentificare necesară")
+        result = await handler(session, request)
+        result["ok"] = True
+        return result
+
+    @staticmethod
+    def credentials(request):
+        name = str(request.get("name", "")).strip()
+        password = str(request.get("password", ""))
+        if not name or not password:
+            raise ProtocolError("Completează toate câmpurile!")
+        return name, password
+
+    async def op_register(self, session, request):
+        name, password = self.credentials(request)
+        # scrypt eliberează GIL-ul: hash-urile rulează în paralel, pe executorul implicit
+        hashed = await self.loop.run_in_executor(None, hash_password, password)
+
+        def register():
+            if name in self.users:
+                return False
+            self.users[name] = UserRecord(name, hashed)
+            return True
+
+        if not await self.in_storage(register):
+            raise ProtocolError("Numele de utilizator există deja!")
+        self.schedule_users_flush()
+        logger.info(f"Utilizator înregistrat: {name}")
+        return {}
+
+    async def op_login(self, session, request):
+        name, password = self.credentials(request)
+
+        def stored_hash():
+            return self.users[name].password if name in self.users else None
+
+        stored = await self.in_storage(stored_hash)
+        matches = False
+        if stored is not None:
+            matches, new_hash = await self.loop.run_in_executor(None, verify_password, password, stored)
+        if not matches:
+            logger.warning(f"Login eșuat pentru utilizator: {name}")
+            raise ProtocolError("Nume utilizator sau parolă incorecte!")
+
+        def login():
+            if new_hash:
+                self.users.set_password(name, new_hash)
+            return Profile.from_record(self.users[name])
+
+        profile = await self.in_storage(login)
+        if new_hash:
+            self.schedule_users_flush()
+        session.player_name = name
+        session.engine = QuizEngine(profile, clusters=self.question_clusters)
+        logger.info(f"Login reușit pentru utilizator: {name}")
+        return {"profile": self.profile_view(profile)}
+
+    async def op_start(self, session, request):
+        category = request.get("category", "general")
+        difficulty = request.get("difficulty", "mediu")
+        total = int(request.get("questions", 10))
+        duration = request.get("duration")
+        if not self.known_bucket(category, difficulty):
+            raise ProtocolError("Categorie sau dificultate necunoscută")
+        if total <= 0 or (duration is not None and duration <= 0):
+            raise ProtocolError("Număr de întrebări sau durată invalidă")
+        questions = await self.get_questions(category, difficulty)
+        if not questions:
+            raise ProtocolError("Nu există întrebări disponibile pentru această categorie și dificultate!")
+        session.engine.start(questions, category, difficulty, total, duration)
+        return {"question": self.question_view(session.engine)}
+
+    async def op_question(self, session, request):
+        return {"question": self.question_view(session.engine)}
+
+    async def op_answer(self, session, request):
+        engine = session.engine
+        result = engine.answer(str(request.get("text", "")))
+        return {
+            "correct": result.correct,
+            "xp": result.xp,
+            "levels": result.levels,
+            "answer": result.answer,
+            "question": self.question_view(engine),
+        }
+
+    async def op_hint(self, session, request):
+        hidden = session.engine.hint(request.get("type"))
+        if hidden is None:
+            raise ProtocolError("You have used all available hints!")
+        return {"hidden": hidden, "hints_left": session.engine.hints_left()}
+
+    async def op_skip(self, session, request):
+        if not session.engine.skip():
+            raise ProtocolError("You have used all available hints!")
+        return {"question": self.question_view(session.engine)}
+
+    async def op_finish(self, session, request):
+        """Încheie etapa curentă; scorul se salvează ca în joc, la fiecare etapă încheiată."""
+        engine = session.engine
+        if engine.phase == FINISHED:
+            raise ProtocolError("Nu există o sesiune în desfășurare")
+        summary = engine.finish()
+        entry = engine.score_entry(session.player_name, summary)
+
+        def save_profile():
+            self.users.save_progress(session.player_name, engine.profile)
+
+        await self.in_storage(save_profile)
+        self.schedule_users_flush()
+        await self.record_score(entry)
+        return {
+            "summary": summary._asdict(),
+            "profile": self.profile_view(engine.profile),
+            "question": self.question_view(engine),
+        }
+
+    async def op_highscores(self, session, request):
+        offset = max(0, int(request.get("offset", 0)))
+        limit = min(100, max(1, int(request.get("limit", 10))))
+        player = request.get("player")
+
+        def page():
+            return self.highscores.count(player), self.highscores.page(offset, limit, player)
+
+        total, scores = await self.in_storage(page)
+        return {"total": total, "scores": scores}
+
+    async def record_score(self, entry):
+        """Așteaptă până când scorul e scris pe disc.
+
+        Scorurile sosite cât timp un lot se scrie formează lotul următor: o singură
+        adăugare cu fsync per lot, nu per jucător.
+        """
+        future = self.loop.create_future()
+        self.pending_scores.append((entry, future))
+        if self.score_writer is None:
+            self.score_writer = self.loop.create_task(self.write_scores())
+        await future
+
+    async def write_scores(self):
+        try:
+            while self.pending_scores:
+                batch, self.pending_scores = self.pending_scores, []
+                try:
+                    await self.in_storage(self.save_scores, [entry for entry, _ in batch])
+                except Exception as e:
+                    logger.error(f"Eroare la salvarea scorurilor: {e}")
+                    for _, future in batch:
+                        future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        future.set_result(None)
+        finally:
+            self.score_writer = None
+
+    def save_scores(self, entries):
+        self.highscores.add_many(entries)
+        self.player_stats.record_many(entries)
+        logger.debug(f"Scoruri salvate: {len(entries)}")
+
+    def schedule_users_flush(self):
+        """Modificările de conturi se scriu grupat, ca în interfața grafică."""
+        if self.users_flush_handle is None:
+            self.users_flush_handle = self.loop.call_later(self.users_flush_delay, self.flush_users)
+
+    def flush_users(self):
+        self.users_flush_handle = None
+        future = self.loop.run_in_executor(self.storage, self.users.flush)
+        future.add_done_callback(self._users_flushed)
+
+    @staticmethod
+    def _users_flushed(future):
+        if future.exception() is not None:
+            logger.error(f"Eroare la salvarea utilizatorilor: {future.exception()}")
+        elif future.result():
+            logger.info(f"Utilizatori salvați: {future.result()} conturi modificate")
+
+    def known_bucket(self, category, difficulty):
+        """Doar categoriile jocului și cele din bancă; numele ajung în căi de fișiere și în cache."""
+        if not isinstance(category, str) or not isinstance(difficulty, str):
+            return False
+        if category in CATEGORIES and difficulty in DIFFICULTIES:
+            return True
+        return bool(self.question_bank and self.question_bank.get_bucket(category, difficulty))
+
+    async def get_questions(self, category, difficulty):
+        """Întrebările sunt citite o singură dată per categorie/dificultate și partajate între sesiuni."""
+        key = (category, difficulty)
+        questions = self.questions.get(key)
+        if questions is not None:
+            return questions
+        load = self.question_loads.get(key)
+        if load is None:
+            # Cererile simultane pentru aceeași categorie așteaptă aceeași încărcare
+            load = self.loop.run_in_executor(None, self.load_questions, category, difficulty)
+            self.question_loads[key] = load
+        try:
+            questions = await asyncio.shield(load)
+        finally:
+            self.question_loads.pop(key, None)
+        self.questions[key] = questions
+        return questions
+
+    def load_questions(self, category, difficulty):
+        questions = self.question_bank.get_bucket(category, difficulty) if self.question_bank else None
+        if questions:
+            return questions
+        questions = QuestionTable()
+        file_path = os.path.join(self.categories_dir, f"{category}_{difficulty}.txt")
+        if os.path.exists(file_path):
+            for question, answer in iter_text_file(file_path):
+                questions.append(question, answer, category, difficulty)
+            logger.info(f"Încărcate {len(questions)} întrebări din {file_path}")
+        return questions
+
+    @staticmethod
+    def profile_view(profile):
+        return {
+            "level": profile.level,
+            "experience": profile.experience,
+            "level_threshold": profile.level_threshold,
+            "max_hints": profile.max_hints,
+        }
+
+    @staticmethod
+    def question_view(engine):
+        question = engine.next_question()
+        if question is None:
+            return None
+        return {
+            "text": question["question"],
+            "hidden": engine.hidden_answer(),
+            "letters": len(question["answer"]),
+            "number": engine.index + 1,
+            "phase": engine.phase,
+            "score": engine.score,
+            "hints_left": engine.hints_left(),
+            "time_left": round(engine.time_left(), 1) if engine.is_fast_quiz else None,
+        }
+
+
+async def serve(host, port):
+    server = QuizServer()
+    await server.start(host, port)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server de quiz pentru mai mulți jucători, pe localhost.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    setup_logging()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except StorageLockedError as e:
+        logger.error(str(e))
+        print(f"{e}; închide jocul sau celălalt server și încearcă din nou.")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
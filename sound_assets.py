@@ -0,0 +1,102 @@
+"""Sunete generate o singură dată și păstrate ca fișiere PCM, încărcate în fundal.
+
+numpy și pygame sunt importate doar pe firul de încărcare, nu la pornirea jocului.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+SOUND_CACHE_DIR = "sound_cache"
+
+# nume -> (durată în secunde, ((frecvență, amplitudine), ...))
+TONES = {
+    "correct": (0.5, ((1000, 0.5),)),
+    "incorrect": (0.5, ((200, 0.5),)),
+    "hint": (0.1, ((800, 0.3),)),
+    "game_over": (1.0, ((600, 0.4), (800, 0.3), (1000, 0.2))),
+}
+
+
+def tone_cache_path(name, spec, cache_dir=SOUND_CACHE_DIR):
+    """Calea fișierului PCM; cheia include toți parametrii, deci un ton modificat se regenerează."""
+    key = repr((SAMPLE_RATE, CHANNELS, spec)).encode()
+    return os.path.join(cache_dir, f"{name}-{hashlib.sha1(key).hexdigest()[:12]}.pcm")
+
+
+def render_tone(spec):
+    import numpy as np
+
+    duration, partials = spec
+    t = np.arange(int(SAMPLE_RATE * duration)) / SAMPLE_RATE
+    sound_data = sum(amplitude * np.sin(2 * np.pi * freq * t) for freq, amplitude in partials)
+    sound_data = (sound_data * 32767).astype("<i2")
+    # Eșantioane intercalate stânga/dreapta, la fel ca np.column_stack pentru stereo
+    return np.repeat(sound_data, CHANNELS).tobytes()
+
+
+def ensure_tone_file(name, spec, cache_dir=SOUND_CACHE_DIR):
+    path = tone_cache_path(name, spec, cache_dir)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(render_tone(spec))
+        os.replace(tmp_path, path)
+        logger.info(f"Sunet generat și salvat: {path}")
+    return path
+
+
+def load_tone(path):
+    import pygame
+
+    # Fișierul mapat în memorie este dat direct ca buffer, fără copii intermediare în Python
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return pygame.mixer.Sound(buffer=buffer)
+
+
+class SoundBank:
+    """Inițializează mixerul și încarcă tonurile pe un fir separat, fără a bloca interfața."""
+
+    def __init__(self, tones=TONES, cache_dir=SOUND_CACHE_DIR):
+        self.tones = tones
+        self.cache_dir = cache_dir
+        self.sounds = {}
+        self.error = None
+        self.ready = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._load, name="sound-loader", daemon=True)
+        self._thread.start()
+
+    def _load(self):
+        try:
+            import pygame
+
+            pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=CHANNELS, buffer=512)
+            sounds = {}
+            for name, spec in self.tones.items():
+                sounds[name] = load_tone(ensure_tone_file(name, spec, self.cache_dir))
+            self.sounds = sounds
+            logger.info("Sunete inițializate cu succes")
+        except Exception as e:
+            self.error = e
+            logger.error(f"Eroare la inițializarea sunetelor: {e}")
+        finally:
+            self.ready.set()
+
+    def get(self, name):
+        return self.sounds.get(name) if self.ready.is_set() else None
+
+    def shutdown(self):
+        if self.ready.is_set() and not self.error:
+            import pygame
+
+            pygame.mixer.quit()
@@ -0,0 +1,175 @@
+"""Coada de recapitulare per jucător: întrebările greșite revin în sesiunile următoare, la intervale tot mai mari.
+
+Fiecare (jucător, categorie, dificultate) are un heap ordonat după scadență. O reprogramare
+nu caută vechea intrare în heap: adaugă una nouă, iar cea veche devine depășită (numărul ei
+de secvență nu mai corespunde) și este aruncată când ajunge în vârf. Astfel, alegerea
+următoarelor N întrebări scadente costă O(N log M), indiferent de lungimea istoricului.
+
+Persistență: instantaneu review_queue.json plus jurnalul review_queue.journal, ca la conturi.
+"""
+import heapq
+import itertools
+import json
+import logging
+import os
+
+from storage import append_jsonl, atomic_write_json, iter_jsonl
+
+logger = logging.getLogger(__name__)
+
+FIRST_INTERVAL = 10 * 60          # o întrebare greșită revine după 10 minute
+GRADUATE_INTERVAL = 30 * 24 * 3600  # peste 30 de zile întrebarea e considerată învățată
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+EASE_PENALTY = 0.2
+
+
+class ReviewItem:
+    __slots__ = ("question", "index", "due", "interval", "ease", "lapses", "seq")
+
+    def __init__(self, question, index, due, interval=FIRST_INTERVAL, ease=DEFAULT_EASE, lapses=0):
+        self.question = question
+        self.index = index
+        self.due = due
+        self.interval = interval
+        self.ease = ease
+        self.lapses = lapses
+        self.seq = 0
+
+
+class ReviewQueue:
+    def __init__(self, queue_file="review_queue.json", compact_every=2000):
+        self.queue_file = queue_file
+        self.journal_file = f"{os.path.splitext(queue_file)[0]}.journal"
+        self.compact_every = compact_every
+        self.items = {}
+        self.heaps = {}
+        self.pending = []
+        self.journal_records = 0
+        self._seq = itertools.count(1)
+
+    def load(self):
+        self.items = {}
+        self.heaps = {}
+        if os.path.exists(self.queue_file):
+            with open(self.queue_file, "r", encoding="utf-8") as f:
+                for record in json.load(f):
+                    self._apply(record)
+        # Reluarea jurnalului e idempotentă: fiecare linie conține starea completă a întrebării
+        self.journal_records = 0
+        for record in iter_jsonl(self.journal_file):
+            self._apply(record)
+            self.journal_records += 1
+        for key, items in self.items.items():
+            # Un singur heapify per coadă la pornire, O(M)
+            heap = [(item.due, item.seq, item.question) for item in items.values()]
+            heapq.heapify(heap)
+            self.heaps[key] = heap
+        logger.info(f"Coada de recapitulare încărcată: {sum(len(items) for items in self.items.values())} întrebări")
+
+    def _apply(self, record):
+        key = (record["user"], record["category"], record["difficulty"])
+        items = self.items.setdefault(key, {})
+        if record.get("removed"):
+            items.pop(record["question"], None)
+            return
+        item = ReviewItem(record["question"], record["index"], record["due"],
+                          record["interval"], record["ease"], record["lapses"])
+        item.seq = next(self._seq)
+        items[record["question"]] = item
+
+    @staticmethod
+    def _record(key, item, removed=False):
+        user, category, difficulty = key
+        record = {"user": user, "category": category, "difficulty": difficulty, "question": item.question}
+        if removed:
+            record["removed"] = True
+        else:
+            record.update(index=item.index, due=item.due, interval=item.interval, ease=item.ease, lapses=item.lapses)
+        return record
+
+    def _schedule(self, key, item):
+        item.seq = next(self._seq)
+        heap = self.heaps.setdefault(key, [])
+        heapq.heappush(heap, (item.due, item.seq, item.question))
+        if len(heap) > 2 * len(self.items.get(key, ())) + 64:
+            # Prea multe intrări depășite: heap-ul se reconstruiește doar din cele valide
+            heap[:] = [(i.due, i.seq, i.question) for i in self.items[key].values()]
+            heapq.heapify(heap)
+        self.pending.append(self._record(key, item))
+
+    def _remove(self, key, item):
+        del self.items[key][item.question]
+        self.pending.append(self._record(key, item, removed=True))
+
+    def record(self, user, question, correct, now):
+        """Actualizează coada după un răspuns: greșelile intră în coadă, răspunsurile corecte o răresc."""
+        key = (user, question["category"], question["difficulty"])
+        items = self.items.setdefault(key, {})
+        text = question["question"]
+        item = items.get(text)
+        if item is None:
+            if correct:
+                return
+            item = items[text] = ReviewItem(text, question.index, now + FIRST_INTERVAL)
+        elif correct:
+            item.interval = item.interval * item.ease
+            if item.interval >= GRADUATE_INTERVAL:
+                self._remove(key, item)
+                return
+            item.due = now + item.interval
+        else:
+            item.lapses += 1
+            item.ease = max(MIN_EASE, item.ease - EASE_PENALTY)
+            item.interval = FIRST_INTERVAL
+            item.due = now + FIRST_INTERVAL
+        item.index = question.index
+        self._schedule(key, item)
+
+    def due(self, user, category, difficulty, limit, now):
+        """Cel mult limit întrebări scadente, cele mai vechi primele; rămân în coadă până la răspuns."""
+        key = (user, category, difficulty)
+        heap = self.heaps.get(key)
+        items = self.items.get(key, {})
+        result = []
+        while heap and len(result) < limit and heap[0][0] <= now:
+            due, seq, text = heapq.heappop(heap)
+            item = items.get(text)
+            if item is None or item.seq != seq:
+                continue  # intrare depășită de o reprogramare sau de o ștergere
+            result.append(item)
+        for item in result:
+            heapq.heappush(heap, (item.due, item.seq, item.question))
+        return result
+
+    def due_questions(self, user, category, difficulty, questions, limit, now):
+        """Întrebările scadente, luate din banca curentă după index.
+
+        O intrare al cărei index nu mai corespunde textului (banca a fost modificată) este ștearsă.
+        """
+        selected = []
+        key = (user, category, difficulty)
+        for item in self.due(user, category, difficulty, limit, now):
+            if 0 <= item.index < len(questions) and questions[item.index]["question"] == item.question:
+                selected.append(questions[item.index])
+            else:
+                self._remove(key, item)
+        return selected
+
+    def flush(self):
+        """Scrie modificările adunate de la ultimul flush într-o singură adăugare la jurnal."""
+        if not self.pending:
+            return 0
+        records, self.pending = self.pending, []
+        append_jsonl(self.journal_file, records)
+        self.journal_records += len(records)
+        if self.journal_records >= self.compact_every:
+            self.compact()
+        return len(records)
+
+    def compact(self):
+        records = [self._record(key, item) for key, items in self.items.items() for item in items.values()]
+        atomic_write_json(self.queue_file, records)
+        open(self.journal_file, "w").close()
+        self.journal_records = 0
+        logger.info(f"Coada de recapitulare compactată: {len(records)} întrebări")
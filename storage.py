@@ -0,0 +1,89 @@
+"""Scriere sigură pe disc: fișiere JSON înlocuite atomic și jurnale JSON-lines cu fsync.
+
+Instantaneele sunt rescrise din starea din memorie a procesului, deci fișierele de date
+pot avea un singur proces care scrie; WriterLock îl reține pe toată durata rulării.
+"""
+import json
+import logging
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+DEFAULT_LOCK_FILE = "quiz_data.lock"
+
+
+class StorageLockedError(Exception):
+    pass
+
+
+class WriterLock:
+    """Blocare exclusivă, neblocantă, ținută de la pornire până la închiderea procesului."""
+
+    def __init__(self, path=DEFAULT_LOCK_FILE):
+        self.path = path
+        self._file = None
+
+    def acquire(self):
+        lock = open(self.path, "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError as e:
+            lock.close()
+            raise StorageLockedError(f"Fișierele de date sunt folosite de alt proces ({self.path})") from e
+        self._file = lock
+        logger.info(f"Blocare de scriere obținută: {self.path}")
+
+    def release(self):
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+
+def atomic_write_json(path, data, indent=None):
+    """Scrie într-un fișier temporar, face fsync și îl redenumește peste cel vechi."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def append_jsonl(path, records, fsync=True):
+    """Adaugă înregistrări la finalul jurnalului, câte una pe linie, într-o singură scriere."""
+    data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+
+
+def iter_jsonl(path):
+    """Citește un jurnal; o ultimă linie incompletă (scriere întreruptă) este ignorată."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Linie invalidă ignorată în {path}:{line_number}")
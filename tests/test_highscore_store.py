@@ -0,0 +1,68 @@
+import pytest
+
+import highscore_store
+from highscore_store import HighscoreStore, score_key
+
+
+class Interrupted(Exception):
+    pass
+
+
+def make_entry(i):
+    return {"name": f"jucător{i % 3}", "score": i % 7, "date": "2025-01-01 12:00", "category": "general",
+            "difficulty": "mediu", "questions": 10, "time": float(i), "hints_used": 0}
+
+
+def open_store(tmp_path):
+    store = HighscoreStore(str(tmp_path / "highscores.json"), top_k=5, compact_every=10 ** 6)
+    store.load()
+    return store
+
+
+def interrupt_write_of(monkeypatch, path):
+    original = highscore_store.atomic_write_json
+
+    def write(target, data, indent=None):
+        if target == path:
+            raise Interrupted(target)
+        original(target, data, indent)
+
+    monkeypatch.setattr(highscore_store, "atomic_write_json", write)
+
+
+@pytest.mark.parametrize("interrupted_file", ["snapshot_file", "index_file"])
+def test_interrupted_compaction_keeps_every_score_once(tmp_path, monkeypatch, interrupted_file):
+    store = open_store(tmp_path)
+    entries = [make_entry(i) for i in range(20)]
+    store.add_many(entries[:8])
+    store.compact()
+    store.add_many(entries[8:])
+
+    # snapshot_file: oprire după redenumirea jurnalului, înainte de înlocuirea instantaneului;
+    # index_file: oprire după înlocuirea instantaneului, înainte de scrierea indexului
+    interrupt_write_of(monkeypatch, getattr(store, interrupted_file))
+    with pytest.raises(Interrupted):
+        store.compact()
+    monkeypatch.undo()
+
+    reloaded = open_store(tmp_path)
+    expected = sorted(entries, key=score_key)
+    assert reloaded.all_scores() == expected
+    assert len(reloaded) == len(entries)
+    assert reloaded.best() == expected[:5]
+
+    # Următoarea compactare pornește din starea recuperată și nu dublează nimic
+    reloaded.add(make_entry(20))
+    reloaded.compact()
+    assert open_store(tmp_path).all_scores() == sorted(entries + [make_entry(20)], key=score_key)
+
+
+def test_first_pages_come_from_top_index(tmp_path):
+    store = open_store(tmp_path)
+    entries = [make_entry(i) for i in range(12)]
+    store.add_many(entries)
+    store.compact()
+    reloaded = open_store(tmp_path)
+    assert reloaded.page(0, 5) == sorted(entries, key=score_key)[:5]
+    assert reloaded._ranked is None
+    assert reloaded.page(5, 5) == sorted(entries, key=score_key)[5:10]
@@ -0,0 +1,98 @@
+import struct
+
+import pytest
+
+import question_bank
+from question_bank import QuestionBank, QuestionBankError, write_question_bank
+from questions import ALIAS_SEPARATOR, parse_answer
+
+QUESTIONS = {
+    ("general", "mediu"): [("Cine a pictat Mona Lisa?", "Leonardo da Vinci|da Vinci"),
+                           ("Care este capitala Franței?", "Paris")],
+    ("țări_orașe", "ușor"): [("Capitala României?", "București")],
+}
+
+
+def read_all(bank):
+    result = {}
+    for key, bucket in bank.buckets.items():
+        result[key] = [(question["question"], question["answer"], question["accepted"]) for question in bucket]
+    return result
+
+
+def expected():
+    result = {}
+    for key, pairs in QUESTIONS.items():
+        rows = []
+        for question, raw_answer in pairs:
+            answer, accepted = parse_answer(raw_answer)
+            rows.append((question, answer, frozenset(accepted.split(ALIAS_SEPARATOR))))
+        result[key] = rows
+    return result
+
+
+def write_v1(path):
+    """Formatul versiunii 1: înregistrări fără formele acceptate, calculate la citire."""
+    data = bytearray(question_bank._PREAMBLE.pack(question_bank.MAGIC, 1, 0, 0))
+    tables = []
+    for key, pairs in QUESTIONS.items():
+        offsets = []
+        for question, raw_answer in pairs:
+            offsets.append(len(data))
+            question_data, answer_data = question.encode("utf-8"), raw_answer.encode("utf-8")
+            data += struct.pack("<HH", len(question_data), len(answer_data)) + question_data + answer_data
+        tables.append((key, offsets))
+    directory = []
+    for key, offsets in tables:
+        directory.append((key, len(data), len(offsets)))
+        for offset in offsets:
+            data += struct.pack("<Q", offset)
+    directory_pos = len(data)
+    data += struct.pack("<H", len(directory))
+    for (category, difficulty), table_pos, count in directory:
+        for text in (category, difficulty):
+            encoded = text.encode("utf-8")
+            data += struct.pack("<H", len(encoded)) + encoded
+        data += struct.pack("<QII", table_pos, count, 0)
+    data[:question_bank._PREAMBLE.size] = question_bank._PREAMBLE.pack(question_bank.MAGIC, 1, 0, directory_pos)
+    path.write_bytes(bytes(data))
+
+
+def test_v2_round_trip(tmp_path):
+    path = tmp_path / "questions.qbank"
+    write_question_bank(str(path), QUESTIONS.items())
+    bank = QuestionBank(str(path))
+    try:
+        assert bank.version == question_bank.VERSION
+        assert read_all(bank) == expected()
+        bucket = bank.get_bucket("general", "mediu")
+        assert bucket[-1]["question"] == "Care este capitala Franței?"
+        assert bucket[0]["normalized"] == "leonardo da vinci"
+        with pytest.raises(IndexError):
+            bucket[2]
+    finally:
+        bank.close()
+
+
+def test_v1_bank_is_read_with_computed_accepted_forms(tmp_path):
+    path = tmp_path / "old.qbank"
+    write_v1(path)
+    bank = QuestionBank(str(path))
+    try:
+        assert bank.version == 1
+        assert read_all(bank) == expected()
+    finally:
+        bank.close()
+
+
+@pytest.mark.parametrize("magic, version", [(b"XXXX", question_bank.VERSION), (question_bank.MAGIC, 99)])
+def test_rejects_bad_magic_or_version(tmp_path, magic, version):
+    path = tmp_path / "questions.qbank"
+    write_question_bank(str(path), QUESTIONS.items())
+    data = bytearray(path.read_bytes())
+    _, _, reserved, directory_pos = question_bank._PREAMBLE.unpack_from(data, 0)
+    data[:question_bank._PREAMBLE.size] = question_bank._PREAMBLE.pack(magic, version, reserved, directory_pos)
+    path.write_bytes(bytes(data))
+    with pytest.raises(QuestionBankError):
+        QuestionBank(str(path))
+    assert QuestionBank.open_if_exists(str(path)) is None
@@ -0,0 +1,36 @@
+import pytest
+
+from question_clusters import ClusterMap
+from questions import QuestionTable
+from quiz_engine import QuizEngine
+from spaced_repetition import ReviewQueue
+
+NOW = 10 ** 6
+
+
+def engine_with_all_due(tmp_path, count, clusters=None):
+    questions = QuestionTable.from_pairs(((f"Întrebarea {i}?", f"Răspuns {i}") for i in range(count)),
+                                         "țări_orașe", "ușor")
+    review_queue = ReviewQueue(str(tmp_path / "review_queue.json"))
+    for question in questions:
+        review_queue.record("Dalia", question, False, 0)
+    engine = QuizEngine(clock=lambda: NOW, review_queue=review_queue, player_name="Dalia", clusters=clusters)
+    return engine, questions
+
+
+def test_fast_quiz_serves_each_due_question_once(tmp_path):
+    engine, questions = engine_with_all_due(tmp_path, 2)
+    engine.start(questions, "țări_orașe", "ușor", fast_quiz_duration=60)
+    assert len(engine.questions) == 2
+    served = []
+    for _ in range(len(questions)):
+        served.append(engine.next_question().index)
+        engine.answer("nu știu")
+    assert sorted(served) == [0, 1]
+
+
+@pytest.mark.parametrize("clusters", [None, ClusterMap()])
+def test_untimed_round_serves_each_due_question_once(tmp_path, clusters):
+    engine, questions = engine_with_all_due(tmp_path, 2, clusters)
+    engine.start(questions, "țări_orașe", "ușor", total_questions=10)
+    assert sorted(question.index for question in engine.questions) == [0, 1]
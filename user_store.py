@@ -0,0 +1,155 @@
+"""Conturile utilizatorilor: instantaneu users.json plus un jurnal de modificări per utilizator.
+
+O actualizare de profil adaugă o singură linie în jurnal, în loc să rescrie toate
+conturile. Modificările se adună în memorie și se scriu împreună la flush(); jurnalul
+este mutat în instantaneu, printr-un fișier temporar și redenumire, abia când are cel puțin
+atâtea linii câte conturi există, deci rescrierea se amortizează. Reluarea jurnalului peste
+instantaneu este idempotentă, deci o compactare întreruptă nu pierde date.
+
+Fișierele au un singur proces care scrie (storage.WriterLock), așa că instantaneul se scrie
+direct din memorie.
+
+Conturile sunt citite o singură dată în UserRecord-uri; intrările vechi, salvate doar ca
+hash de parolă ("Dalia": "a079..."), sunt migrate în aceeași trecere și rescrise la flush().
+"""
+import gc
+import json
+import logging
+import os
+from collections.abc import MutableMapping
+
+from storage import append_jsonl, atomic_write_json, iter_jsonl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEVEL = 1
+DEFAULT_EXPERIENCE = 0
+DEFAULT_MAX_HINTS = 3
+
+
+class UserRecord:
+    __slots__ = ("name", "password", "level", "experience", "max_hints")
+
+    def __init__(self, name, password, level=DEFAULT_LEVEL, experience=DEFAULT_EXPERIENCE, max_hints=DEFAULT_MAX_HINTS):
+        self.name = name
+        self.password = password
+        self.level = level
+        self.experience = experience
+        self.max_hints = max_hints
+
+    @classmethod
+    def from_json(cls, name, data):
+        """Întoarce (record, migrat); un șir simplu este formatul vechi, doar cu hash-ul parolei."""
+        if isinstance(data, str):
+            return cls(name, data), True
+        return cls(name, data.get("password", ""), data.get("level", DEFAULT_LEVEL),
+                   data.get("experience", DEFAULT_EXPERIENCE), data.get("max_hints", DEFAULT_MAX_HINTS)), False
+
+    def to_json(self):
+        return {
+            "password": self.password,
+            "level": self.level,
+            "experience": self.experience,
+            "max_hints": self.max_hints
+        }
+
+    def __repr__(self):
+        return f"UserRecord({self.name!r}, level={self.level}, experience={self.experience}, max_hints={self.max_hints})"
+
+
+class UserStore(MutableMapping):
+    def __init__(self, users_file="users.json", compact_every=500):
+        self.users_file = users_file
+        base = os.path.splitext(users_file)[0]
+        self.journal_file = f"{base}.journal"
+        self.compact_every = compact_every
+        self.users = {}
+        self.dirty = set()
+        self.journal_records = 0
+
+    def load(self):
+        # Colectorul de cicluri ar parcurge repetat milioanele de obiecte noi; încărcarea nu creează cicluri
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            users, migrated = self._read()
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.users = users
+        self.dirty = set(migrated)
+        if migrated:
+            logger.info(f"Conturi în format vechi migrate: {len(migrated)}")
+        logger.info(f"Utilizatori încărcați: {len(users)} ({self.journal_records} modificări în jurnal)")
+
+    def _read(self):
+        raw = {}
+        if os.path.exists(self.users_file):
+            with open(self.users_file, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        self.journal_records = 0
+        for record in iter_jsonl(self.journal_file):
+            raw[record["name"]] = record["data"]
+            self.journal_records += 1
+        # O singură trecere: fiecare intrare devine un UserRecord, cele vechi sunt migrate pe loc
+        users = {}
+        migrated = []
+        for name, data in raw.items():
+            users[name], legacy = UserRecord.from_json(name, data)
+            if legacy:
+                migrated.append(name)
+        return users, migrated
+
+    def __getitem__(self, username):
+        return self.users[username]
+
+    def __setitem__(self, username, record):
+        if not isinstance(record, UserRecord):
+            raise TypeError("Conturile se salvează ca UserRecord")
+        self.users[username] = record
+        self.dirty.add(username)
+
+    def __delitem__(self, username):
+        raise TypeError("Conturile nu pot fi șterse din joc")
+
+    def __iter__(self):
+        return iter(self.users)
+
+    def __len__(self):
+        return len(self.users)
+
+    def __contains__(self, username):
+        return username in self.users
+
+    def mark_dirty(self, username):
+        self.dirty.add(username)
+
+    def save_progress(self, username, profile):
+        """Copiază nivelul, XP-ul și indiciile din profilul de joc în contul utilizatorului."""
+        record = self.users[username]
+        record.level = profile.level
+        record.experience = profile.experience
+        record.max_hints = profile.max_hints
+        self.dirty.add(username)
+
+    def set_password(self, username, password_hash):
+        self.users[username].password = password_hash
+        self.dirty.add(username)
+
+    def flush(self):
+        """Scrie toate conturile modificate într-o singură adăugare la jurnal."""
+        if not self.dirty:
+            return 0
+        records = [{"name": name, "data": self.users[name].to_json()} for name in sorted(self.dirty)]
+        append_jsonl(self.journal_file, records)
+        self.journal_records += len(records)
+        self.dirty.clear()
+        if self.journal_records >= max(self.compact_every, len(self.users)):
+            self.compact()
+        return len(records)
+
+    def compact(self):
+        atomic_write_json(self.users_file, {name: record.to_json() for name, record in self.users.items()}, indent=4)
+        open(self.journal_file, "w").close()
+        self.journal_records = 0
+        logger.info(f"Utilizatori compactați: {len(self.users)} conturi")